@@ -530,6 +530,8 @@ LavaVu.colourArrayFloat = new_instancemethod(_LavaVuPython.LavaVu_colourArrayFlo
 LavaVu.geometryArrayViewFloat = new_instancemethod(_LavaVuPython.LavaVu_geometryArrayViewFloat, None, LavaVu)
 LavaVu.geometryArrayViewUInt = new_instancemethod(_LavaVuPython.LavaVu_geometryArrayViewUInt, None, LavaVu)
 LavaVu.geometryArrayViewUChar = new_instancemethod(_LavaVuPython.LavaVu_geometryArrayViewUChar, None, LavaVu)
+LavaVu.geometryArrayViewUShort = new_instancemethod(_LavaVuPython.LavaVu_geometryArrayViewUShort, None, LavaVu)
+LavaVu.geometryPrecision = new_instancemethod(_LavaVuPython.LavaVu_geometryPrecision, None, LavaVu)
 LavaVu.imageBuffer = new_instancemethod(_LavaVuPython.LavaVu_imageBuffer, None, LavaVu)
 LavaVu.imageJPEG = new_instancemethod(_LavaVuPython.LavaVu_imageJPEG, None, LavaVu)
 LavaVu.imagePNG = new_instancemethod(_LavaVuPython.LavaVu_imagePNG, None, LavaVu)
@@ -0,0 +1,101 @@
+"""
+LavaVu python interface: render thread benchmarks
+
+Measures the round trip latency and throughput of calls made
+to the render thread, the event driven (default) and polling
+render loop modes can be compared by running as a script:
+
+    python -m lavavu.benchmark
+
+"""
+from __future__ import print_function
+import time
+import numpy
+
+def _noop():
+    #Empty call, measures only the queue overhead
+    return None
+
+def latency(calls=500, polling=False, **kwargs):
+    """
+    Measure render thread call latency and throughput
+
+    Parameters
+    ----------
+    calls : int
+        Number of calls to make for each measurement
+    polling : boolean
+        Use the timer polling render loop instead of the event driven loop
+    **kwargs
+        Passed to the created Viewer
+
+    Returns
+    -------
+    results : dict
+        Latency statistics of calls waiting for a return value in milliseconds
+        (mean, median, p95, max) and queued calls processed per second (throughput)
+    """
+    import lavavu
+    saved = lavavu.settings["polling"]
+    lavavu.settings["polling"] = polling
+    try:
+        lv = lavavu.Viewer(**kwargs)
+    finally:
+        lavavu.settings["polling"] = saved
+    app = lv.app
+
+    #Warm up
+    for i in range(10):
+        app._thread_call(_noop, True)
+
+    #Round trip latency, wait for each call to return
+    times = numpy.zeros(calls)
+    for i in range(calls):
+        t0 = time.time()
+        app._thread_call(_noop, True)
+        times[i] = time.time() - t0
+    times *= 1000.0
+
+    #Throughput, queue all calls then wait for the last
+    t0 = time.time()
+    for i in range(calls-1):
+        app._thread_call(_noop, False)
+    app._thread_call(_noop, True)
+    elapsed = time.time() - t0
+
+    lv._shutdown()
+
+    return {"mean" : numpy.mean(times),
+            "median" : numpy.median(times),
+            "p95" : numpy.percentile(times, 95),
+            "max" : numpy.max(times),
+            "throughput" : calls / elapsed}
+
+def compare(calls=500, **kwargs):
+    """
+    Compare render thread call latency of the polling and event driven loop modes
+
+    Parameters
+    ----------
+    calls : int
+        Number of calls to make for each measurement
+    **kwargs
+        Passed to the created Viewer
+
+    Returns
+    -------
+    results : dict
+        The latency() results for each mode, by mode name
+    """
+    results = {}
+    for mode, polling in [("polling", True), ("event", False)]:
+        results[mode] = latency(calls, polling, **kwargs)
+
+    print("%-8s %10s %10s %10s %10s %14s" % ("mode", "mean(ms)", "median", "p95", "max", "calls/sec"))
+    for mode in results:
+        r = results[mode]
+        print("%-8s %10.3f %10.3f %10.3f %10.3f %14.1f" % (mode, r["mean"], r["median"], r["p95"], r["max"], r["throughput"]))
+    return results
+
+if __name__ == '__main__':
+    compare()
@@ -247,26 +247,121 @@ def _get_objects(source):
     else:
         return [source]
 
-def export_OBJ(filepath, source):
+#Rows of data formatted with each string operation when writing text files
+TEXT_BLOCK = 65536
+
+def _format_rows(job):
+    """
+    Format a block of rows as text with a single string operation,
+    jobs are (text, None) to output text as is, or (format, rows)
+    (module level so it can be run by worker processes)
+    """
+    fmt, rows = job
+    if rows is None:
+        return fmt
+    return (fmt * len(rows)) % tuple(rows.ravel().tolist())
+
+def _text_rows(fmt, data, offset=0, repeat=1):
+    """
+    Split an array into blocks of rows to format, optionally
+    adding an offset and repeating each column
+    """
+    for start in range(0, len(data), TEXT_BLOCK):
+        rows = data[start:start+TEXT_BLOCK]
+        if offset:
+            rows = rows + offset
+        if repeat > 1:
+            rows = numpy.repeat(rows, repeat, axis=1)
+        yield (fmt, rows)
+
+def _write_text(f, jobs, pool=None, batch=1):
+    """
+    Format and write text jobs in order, if a process pool is provided
+    batches of jobs are formatted in parallel
+    """
+    if pool is None:
+        for job in jobs:
+            f.write(_format_rows(job))
+        return
+    pending = []
+    for job in jobs:
+        pending.append(job)
+        if len(pending) >= batch:
+            f.write(''.join(pool.map(_format_rows, pending)))
+            pending = []
+    if len(pending):
+        f.write(''.join(pool.map(_format_rows, pending)))
+
+def export_OBJ(filepath, source, processes=None):
     """
     Export given object(s) to an OBJ file
     Supports only triangle mesh object data
 
     If source is lavavu.Viewer() exports all objects
     If source is lavavu.Object() exports single object
+
+    Parameters
+    ----------
+    filepath : str
+        Output file to write
+    source : lavavu.Viewer or lavavu.Object
+        Where to get object data to export
+    processes : int
+        Format the data in parallel with this many worker processes,
+        output is written in the same order, default is to format in this process
+
+    Example
+    -------
+    With a colourmap texture, texture coordinates are calculated from the values
+
+    >>> import lavavu, os, tempfile
+    >>> lv = lavavu.Viewer()
+    >>> tris = lv.triangles("mesh", texture='colourmap', dims=[2,2])
+    >>> tris.vertices([[0,0,0], [1,0,0], [0,1,0], [1,1,0]])
+    >>> tris.indices([0,1,2, 1,3,2])
+    >>> tris.values([0., 1., 2., 4.])
+    >>> cwd = os.getcwd()
+    >>> os.chdir(tempfile.mkdtemp())
+    >>> export_OBJ('mesh.obj', tris)
+    [mesh] element 1 of 1
+    - Vertices : (4, 3)
+    - Normals : (0, 3)
+    - Texcoords : (4, 2)
+    - Faces (v/t): (2, 3)
+    >>> print(''.join([l for l in open('mesh.obj') if l[0] in 'vf']))
+    v 0.000000 0.000000 0.000000
+    v 1.000000 0.000000 0.000000
+    v 0.000000 1.000000 0.000000
+    v 1.000000 1.000000 0.000000
+    vt 0.000000 0.000000
+    vt 0.250000 0.000000
+    vt 0.500000 0.000000
+    vt 1.000000 0.000000
+    f 1/1 2/2 3/3
+    f 2/2 4/4 3/3
+    <BLANKLINE>
+    >>> os.chdir(cwd)
     """
     mtlfilename = os.path.basename(filepath) + '.mtl'
     objects = _get_objects(source)
-    with open(filepath, 'w') as f, open(mtlfilename, 'w') as m:
-        f.write("# OBJ file\n")
-        offset = 1
-        for obj in objects:
-            f.write("g %s\n" % obj.name)
-            offset = _write_OBJ(f, m, filepath, obj, offset)
-
-def _write_OBJ(f, m, filepath, obj, offset=1):
+    pool = None
+    if processes and processes > 1:
+        import multiprocessing
+        pool = multiprocessing.Pool(processes)
+    try:
+        with open(filepath, 'w') as f, open(mtlfilename, 'w') as m:
+            f.write("# OBJ file\n")
+            offset = 1
+            for obj in objects:
+                f.write("g %s\n" % obj.name)
+                offset = _write_OBJ(f, m, filepath, obj, offset, pool, 4 * (processes or 1))
+    finally:
+        if pool:
+            pool.close()
+            pool.join()
+
+def _write_OBJ(f, m, filepath, obj, offset=1, pool=None, batch=1):
     mtl_line = ""
-    cmaptexcoords = []
     colourdict = None
     import re
     name = re.sub(r"\s+", "", obj["name"])
@@ -295,15 +390,14 @@ def _write_OBJ(f, m, filepath, obj, offset=1):
         mtl_line = "usemtl default-%s\n" % name
         m.write(mtl)
 
-    if m and len(obj.data.colours) > 0:
-        import matplotlib
+    colours, coloffsets = obj.data.concat("colours")
+    if m and len(colours) > 0:
         print("Creating palette")
+        #Materials for each unique rgb colour (alpha ignored)
         colourdict = {}
-        for data in obj:
-            for c in data.colours:
-                rgb = colour2rgb(c)
-                cs = colour2hex(rgb)
-                colourdict[cs] = rgb
+        for c in numpy.unique(colours & 0xffffff):
+            rgb = colour2rgb(int(c))
+            colourdict[colour2hex(rgb)] = rgb
         print("Writing mtl lib (colour list)")
         for c in colourdict:
             rgb = colourdict[c]
@@ -313,14 +407,11 @@ def _write_OBJ(f, m, filepath, obj, offset=1):
             m.write(mtl)
 
     for o,data in enumerate(obj):
-        print("[%s] element %d of %d" % (obj.name, o+1, len(obj.data.vertices)))
+        print("[%s] element %d of %d" % (obj.name, o+1, len(obj.data)))
         verts = data.vertices.reshape((-1,3))
         if len(verts) == 0:
             print("No vertices")
             continue
-        f.write("o Surface_%d\n" % o)
-        #f.write("o %s\n" % obj.name)
-        if m: f.write("mtllib " + os.path.basename(filepath) + ".mtl\n")
         indices = data.indices.reshape((-1,3))
         normals = data.normals.reshape((-1,3))
         texcoords = data.texcoords.reshape((-1,2))
@@ -329,87 +420,150 @@ def _write_OBJ(f, m, filepath, obj, offset=1):
             label = obj["colourby"]
             if isinstance(label,int):
                 #Use the given label index
-                sets = list(datasets.keys())
+                sets = list(obj.datasets.keys())
                 label = sets[label]
             elif len(label) == 0:
                 #Use the default label
                 label = 'values'
-            valdata = data[label]
-            if len(valdata) >= o+1:
-                #Found matching value array
-                v = valdata
-                #Normalise [0,1]
-                texcoords = (v - numpy.min(v)) / numpy.ptp(v)
+            #(flattened, value data on a grid is shaped to the grid dims)
+            v = data.get(label).ravel()
+            if len(v):
+                #Found matching value array, normalise [0,1]
                 #Add 2nd dimension (not actually necessary,
                 #tex coords can by 1d but breaks some loaders (meshlab)
-                zeros = numpy.zeros((len(texcoords)))
-                texcoords = numpy.vstack((texcoords,zeros)).reshape([2, -1]).transpose()
-
-        print("- Writing vertices:",verts.shape)
-        for v in verts:
-            f.write("v %.6f %.6f %.6f\n" % (v[0], v[1], v[2]))
-        print("- Writing normals:",normals.shape)
-        for n in normals:
-            f.write("vn %.6f %.6f %.6f\n" % (n[0], n[1], n[2]))
-        print("- Writing texcoords:",texcoords.shape)
-        if len(texcoords.shape) == 2:
-            for t in texcoords:
-                f.write("vt %.6f %.6f\n" % (t[0], t[1]))
-        else:
-            for t in texcoords:
-                f.write("vt %.6f\n" % t)
-
-        #Face elements v/t/n v/t v//n
-        f.write(mtl_line)
+                texcoords = numpy.zeros((len(v), 2), dtype=numpy.float32)
+                vrange = numpy.ptp(v)
+                if vrange > 0:
+                    texcoords[:,0] = (v - numpy.min(v)) / vrange
+
+        print("- Vertices :",verts.shape)
+        print("- Normals :",normals.shape)
+        print("- Texcoords :",texcoords.shape)
         if len(normals) and len(texcoords):
-            print("- Writing faces (v/t/n):",indices.shape)
+            ffmt = "f %d/%d/%d %d/%d/%d %d/%d/%d\n"
+            print("- Faces (v/t/n):",indices.shape)
         elif len(texcoords):
-            print("- Writing faces (v/t):",indices.shape)
+            ffmt = "f %d/%d %d/%d %d/%d\n"
+            print("- Faces (v/t):",indices.shape)
         elif len(normals):
-            print("- Writing faces (v//n):",indices.shape)
+            ffmt = "f %d//%d %d//%d %d//%d\n"
+            print("- Faces (v//n):",indices.shape)
         else:
-            print("- Writing faces (v):",indices.shape)
-        print("- Colours :",data.colours.shape)
-        print("- Indices :",indices.shape)
-
-        cs0 = ""
-        vperc = 1
-        if colourdict:
-            vperc = int(verts.shape[0] / len(data.colours))
-
-        for n,i in enumerate(indices):
-            if n%1000==0: print(".", end='', flush=True)
-            i0 = i[0]+offset
-            i1 = i[1]+offset
-            i2 = i[2]+offset
-            if colourdict:
-                ci = int(i[0] / vperc)
-                #print(i0,vperc,ci)
-                #print(data.colours)
-                #c = data.colours[ci]
-                c = data.colours[ci]
-                rgb = colour2rgb(c)
-                cs = colour2hex(rgb)
-                cs1 = cs[1:]
-                #if i[0]%100==0: print(ci,c,rgb,cs,mtl_line2)
-                if cs0 != cs1 and cs in colourdict:
-                    f.write("usemtl " + cs1 + "\n")
-                    cs0 = cs1
-
-            if len(normals) and len(texcoords):
-                f.write("f %d/%d/%d %d/%d/%d %d/%d/%d\n" % (i0, i0, i0, i1, i1, i1, i2, i2, i2))
-            elif len(texcoords):
-                f.write("f %d/%d %d/%d %d/%d\n" % (i0, i0, i1, i1, i2, i2))
-            elif len(normals):
-                f.write("f %d//%d %d//%d %d//%d\n" % (i0, i0, i1, i1, i2, i2))
+            ffmt = "f %d %d %d\n"
+            print("- Faces (v):",indices.shape)
+        repeat = ffmt.count("%d") // 3
+
+        def jobs():
+            yield ("o Surface_%d\n" % o, None)
+            if m: yield ("mtllib " + os.path.basename(filepath) + ".mtl\n", None)
+            for job in _text_rows("v %.6f %.6f %.6f\n", verts): yield job
+            for job in _text_rows("vn %.6f %.6f %.6f\n", normals): yield job
+            for job in _text_rows("vt %.6f %.6f\n", texcoords): yield job
+
+            #Face elements v/t/n v/t v//n
+            yield (mtl_line, None)
+            faces = indices
+            el_colours = colours[coloffsets[o]:coloffsets[o+1]]
+            if colourdict and len(el_colours) and len(faces):
+                #Per face material from the colour of the first vertex,
+                #switch material at the boundaries of each run of the same colour
+                vperc = max(1, verts.shape[0] // len(el_colours))
+                ci = numpy.minimum(faces[:,0] // vperc, len(el_colours)-1)
+                fc = el_colours[ci] & 0xffffff
+                runs = numpy.concatenate(([0], numpy.flatnonzero(fc[1:] != fc[:-1]) + 1, [len(fc)]))
+                for r in range(len(runs)-1):
+                    yield ("usemtl " + colour2hex(colour2rgb(int(fc[runs[r]])))[1:] + "\n", None)
+                    for job in _text_rows(ffmt, faces[runs[r]:runs[r+1]], offset, repeat): yield job
             else:
-                f.write("f %d %d %d\n" % (i0, i1, i2))
-        print()
+                for job in _text_rows(ffmt, faces, offset, repeat): yield job
 
+        _write_text(f, jobs(), pool, batch)
         offset += verts.shape[0]
     return offset
 
-def export_PLY(filepath, source, binary=True):
+def _colour_rgb(colours):
+    """
+    Vectorised colour2rgb, unpack packed colours to red, green and blue uint8 arrays
+    """
+    colours = numpy.asarray(colours, dtype=numpy.uint32)
+    return [(colours & 255).astype(numpy.uint8),
+            ((colours >> 8) & 255).astype(numpy.uint8),
+            ((colours >> 16) & 255).astype(numpy.uint8)]
+
+def _PLY_layout(objects):
+    """
+    Count the vertices and faces to export and get the vertex and face
+    data types, optional fields are based on the first object element
+    """
+    vc = 0
+    fc = 0
+    vertex = None
+    face = None
+    for obj in objects:
+        for data in obj:
+            verts = data.vertices.reshape((-1,3))
+            if len(verts) == 0:
+                continue
+            vc += verts.shape[0]
+            if data.type != 'points':
+                fc += data.indices.size // 3
+            vperc = 0
+            if len(data.colours):
+                vperc = int(verts.shape[0] / len(data.colours))
+            if vertex is None:
+                vertex = [('x', '<f4'), ('y', '<f4'), ('z', '<f4')]
+                if data.normals.size // 3 == verts.shape[0]:
+                    vertex += [('nx', '<f4'), ('ny', '<f4'), ('nz', '<f4')]
+                if data.texcoords.size // 2 == verts.shape[0]:
+                    vertex += [('s', '<f4'), ('t', '<f4')]
+                if vperc and vperc == 1:
+                    vertex += [('red', 'u1'), ('green', 'u1'), ('blue', 'u1')]
+            if face is None and data.type != 'points':
+                #Per face colours, or less
+                face = [('vertex_indices', '<i4', (3,))]
+                if vperc and vperc < len(verts):
+                    face += [('red', 'u1'), ('green', 'u1'), ('blue', 'u1')]
+    return vc, fc, vertex, face
+
+def _PLY_vertices(data, vertex):
+    """
+    Fill the vertex fields of a structured array from an element
+    """
+    verts = data.vertices.reshape((-1,3))
+    n = verts.shape[0]
+    if n == 0:
+        return
+    for i,field in enumerate(['x', 'y', 'z']):
+        vertex[field] = verts[:,i]
+    normals = data.normals.reshape((-1,3))
+    if 'nx' in vertex.dtype.names and normals.shape[0] == n:
+        for i,field in enumerate(['nx', 'ny', 'nz']):
+            vertex[field] = normals[:,i]
+    texcoords = data.texcoords.reshape((-1,2))
+    if 's' in vertex.dtype.names and texcoords.shape[0] == n:
+        vertex['s'] = texcoords[:,0]
+        vertex['t'] = texcoords[:,1]
+    colours = data.colours
+    if 'red' in vertex.dtype.names and len(colours) and len(colours) >= n and int(n / len(colours)) == 1:
+        vertex['red'], vertex['green'], vertex['blue'] = _colour_rgb(colours[:n])
+
+def _PLY_faces(data, face, voffset):
+    """
+    Fill the face fields of a structured array from an element,
+    indices are offset by the number of vertices in previous elements
+    """
+    indices = data.indices.reshape((-1,3))
+    face['vertex_indices'] = indices + voffset
+    n = data.vertices.size // 3
+    colours = data.colours
+    if 'red' in face.dtype.names and len(colours) and len(indices):
+        vperc = int(n / len(colours))
+        if vperc and vperc < n:
+            #Have colour, but less than vertices, apply to faces
+            ci = numpy.minimum(indices[:,0] // vperc, len(colours)-1)
+            face['red'], face['green'], face['blue'] = _colour_rgb(colours[ci])
+
+def export_PLY(filepath, source, binary=True, stream=False):
     """
     Export given object(s) to a PLY file
     Supports points or triangle mesh object data
@@ -425,107 +579,69 @@ def export_PLY(filepath, source, binary=True):
         Where to get object data to export
     binary : boolean
         Write vertex/face data as binary, default True
+    stream : boolean
+        Write binary data directly to the file one element at a time,
+        instead of building the full data set and writing with plyfile,
+        the plyfile module is not required (ascii output is not streamed)
+
+    Example
+    -------
+    Elements without any data are skipped
+
+    >>> import lavavu, os, tempfile
+    >>> lv = lavavu.Viewer()
+    >>> pts = lv.points("pts", vertices=[[0,0,0], [1,1,1]], colours="red blue")
+    >>> pts.append()
+    >>> filename = os.path.join(tempfile.mkdtemp(), 'pts.ply')
+    >>> export_PLY(filename, pts, stream=True)
+    2  vertices,  0  faces
+    Streaming binary PLY data
+    >>> ply = read_PLY(filename)
+    >>> print(ply['vertex']['x'].tolist(), ply['vertex']['red'].tolist())
+    [0.0, 1.0] [255, 0]
     """
     objects = _get_objects(source)
-    with open(filepath, mode='wb') as f:
-        voffset = 0
-        foffset = 0
-        #First count vertices, faces
-        fc = 0
-        vc = 0
-        for obj in objects:
-            for o,data in enumerate(obj):
-                vc += len(data.vertices) // 3
-                fc += len(data.indices) // 3
-
-        #Pass the counts first
-        vertex = None
-        face = None
-        print(vc, " vertices, ", fc, " faces")
-        for obj in objects:
-            for o,data in enumerate(obj):
-                print("[%s] element %d of %d, type %s" % (obj.name, o+1, len(obj.data), data.type))
-                #print("OFFSETS:",voffset,foffset)
-                verts = data.vertices.reshape((-1,3))
-                if len(verts) == 0:
-                    print("No vertices")
-                    return
-                indices = data.indices.reshape((-1,3))
-                normals = data.normals.reshape((-1,3))
-                texcoords = data.texcoords.reshape((-1,2))
-
-                vperc = 0
-                cperf = 0
-                if len(data.colours):
-                    vperc = int(verts.shape[0] / len(data.colours))
-                    C = data.colours
-                    #print("COLOURS:",len(C),C.shape, verts.shape[0], verts.shape[0] / len(data.colours), vperc)
-
-                if data.type != 'points':
-                    #Per face colours, or less
-                    if face is None:
-                        if vperc and vperc < len(verts):
-                            #cperf = int(indices.shape[0] / len(data.colours))
-                            face = numpy.zeros(shape=(fc), dtype=[('vertex_indices', 'i4', (3,)), ('red', 'u1'), ('green', 'u1'), ('blue', 'u1')])
-                        else:
-                            face = numpy.zeros(shape=(fc), dtype=[('vertex_indices', 'i4', (3,))])
-                        print("FACE:",face.dtype)
-
-                    for i,idx in enumerate(indices):
-                        if i%1000==0: print(".", end='', flush=True)
-                        if vperc and vperc < len(verts):
-                            #Have colour, but less than vertices, apply to faces
-                            ci = idx[0] // vperc
-                            c = data.colours[ci]
-                            rgb = colour2rgb(c)
-                            face[i+foffset] = ([idx[0]+voffset, idx[1]+voffset, idx[2]+voffset], rgb[0], rgb[1], rgb[2])
-                        else:
-                            face[i+foffset] = ([idx[0]+voffset, idx[1]+voffset, idx[2]+voffset])
-                    print()
-
-                #Construct and write vertex elements
-                if vertex is None:
-                    #Setup vertex array based on first object element
-                    D = [('x', 'f4'), ('y', 'f4'), ('z', 'f4')]
-                    if normals.shape[0] == verts.shape[0]:
-                        D += [('nx', 'f4'), ('ny', 'f4'), ('nz', 'f4')]
-                    if texcoords.shape[0] == verts.shape[0]:
-                        D += [('s', 'f4'), ('t', 'f4')]
-                    if vperc and vperc == 1:
-                        D += [('red', 'u1'), ('green', 'u1'), ('blue', 'u1')]
-                    print("VERTEX:",D)
-                    vertex = numpy.zeros(shape=(vc), dtype=D)
-
-                for i,v in enumerate(verts):
-                    #if i%1000==0:
-                    #    print("vert index",i,vperc)
-                    if i%1000==0: print(".", end='', flush=True)
-                    E = [v[0], v[1], v[2]]
-                    if normals.shape[0] == verts.shape[0]:
-                        N = normals[i]
-                        E += [N[0], N[1], N[2]]
-                    if texcoords.shape[0] == verts.shape[0]:
-                        T = texcoords[i]
-                        E += [T[0], T[1]]
-                    if vperc and vperc == 1:
-                        c = data.colours[i]
-                        rgb = colour2rgb(c)
-                        E += [rgb[0], rgb[1], rgb[2]]
-                    vertex[i+voffset] = tuple(E)
-                print()
-
-                #Update offsets : number of vertices / faces added
-                voffset += verts.shape[0]
-                foffset += indices.shape[0]
+    #First count vertices, faces
+    vc, fc, vdtype, fdtype = _PLY_layout(objects)
+    print(vc, " vertices, ", fc, " faces")
+    if vdtype is None:
+        print("No vertices")
+        return
+
+    if stream and binary:
+        _stream_PLY(filepath, objects, vc, fc, vdtype, fdtype)
+        return
+
+    vertex = numpy.zeros(shape=(vc), dtype=vdtype)
+    face = numpy.zeros(shape=(fc), dtype=fdtype) if fdtype else None
+    print("VERTEX:",vertex.dtype)
+    if face is not None:
+        print("FACE:",face.dtype)
+    voffset = 0
+    foffset = 0
+    for obj in objects:
+        for o,data in enumerate(obj):
+            print("[%s] element %d of %d, type %s" % (obj.name, o+1, len(obj.data), data.type))
+            nv = data.vertices.size // 3
+            if nv == 0:
+                continue
+            nf = data.indices.size // 3 if data.type != 'points' else 0
+            #Fill the slices for this element
+            _PLY_vertices(data, vertex[voffset:voffset+nv])
+            if face is not None and nf:
+                _PLY_faces(data, face[foffset:foffset+nf], voffset)
+            #Update offsets : number of vertices / faces added
+            voffset += nv
+            foffset += nf
 
-        import plyfile
-        #vertex = numpy.array(vertex, dtype=vertex.dtype)
-        els = []
-        els.append(plyfile.PlyElement.describe(vertex, 'vertex'))
-        if face is not None:
-            els.append(plyfile.PlyElement.describe(face, 'face'))
+    import plyfile
+    els = []
+    els.append(plyfile.PlyElement.describe(vertex, 'vertex'))
+    if face is not None:
+        els.append(plyfile.PlyElement.describe(face, 'face'))
 
-        #Write, text or binary
+    #Write, text or binary
+    with open(filepath, mode='wb') as f:
         if binary:
             print("Writing binary PLY data")
             plyfile.PlyData(els).write(f)
@@ -533,6 +649,186 @@ def export_PLY(filepath, source, binary=True):
             print("Writing ascii PLY data")
             plyfile.PlyData(els, text=True).write(f)
 
+def _stream_PLY(filepath, objects, vc, fc, vdtype, fdtype):
+    """
+    Write binary PLY data directly, each element's vertices then faces
+    are converted and written in turn so the full data set is never held in memory
+    """
+    types = {'<f4' : 'float', 'u1' : 'uchar', '<i4' : 'int'}
+    header = ["ply", "format binary_little_endian 1.0", "element vertex %d" % vc]
+    header += ["property %s %s" % (types[d[1]], d[0]) for d in vdtype]
+    if fdtype:
+        header += ["element face %d" % fc]
+        #List property, stored as a count followed by the 3 indices
+        header += ["property list uchar int vertex_indices"]
+        header += ["property %s %s" % (types[d[1]], d[0]) for d in fdtype[1:]]
+        fdtype = [('count', 'u1')] + fdtype
+    header += ["end_header"]
+
+    print("Streaming binary PLY data")
+    try:
+        with open(filepath, mode='wb') as f:
+            f.write(('\n'.join(header) + '\n').encode('ascii'))
+            #Vertices of all elements first, then faces
+            for obj in objects:
+                for data in obj:
+                    nv = data.vertices.size // 3
+                    if nv == 0:
+                        continue
+                    vertex = numpy.zeros(shape=(nv), dtype=vdtype)
+                    _PLY_vertices(data, vertex)
+                    f.write(vertex.tobytes())
+            if fdtype is None:
+                return
+            voffset = 0
+            for obj in objects:
+                for data in obj:
+                    nv = data.vertices.size // 3
+                    if nv == 0:
+                        continue
+                    if data.type != 'points':
+                        face = numpy.zeros(shape=(data.indices.size // 3), dtype=fdtype)
+                        face['count'] = 3
+                        _PLY_faces(data, face, voffset)
+                        f.write(face.tobytes())
+                    voffset += nv
+    except:
+        #Don't leave a partially written file
+        if os.path.exists(filepath):
+            os.remove(filepath)
+        raise
+
+#PLY property types and equivalent numpy types
+_PLY_TYPES = {'char' : 'i1', 'uchar' : 'u1', 'short' : 'i2', 'ushort' : 'u2',
+              'int' : 'i4', 'uint' : 'u4', 'float' : 'f4', 'double' : 'f8',
+              'int8' : 'i1', 'uint8' : 'u1', 'int16' : 'i2', 'uint16' : 'u2',
+              'int32' : 'i4', 'uint32' : 'u4', 'float32' : 'f4', 'float64' : 'f8'}
+
+def _read_PLY_header(f):
+    """
+    Parse a PLY file header, returns the format, a list of elements
+    as (name, count, properties) and the offset of the data
+    properties are (name, type) or (name, count type, item type) for lists
+    """
+    if f.readline().strip() != b'ply':
+        raise ValueError("Not a PLY file")
+    fmt = None
+    elements = []
+    while True:
+        line = f.readline()
+        if not line:
+            raise ValueError("PLY header not terminated")
+        words = line.decode('ascii', 'replace').split()
+        if not len(words): continue
+        if words[0] == 'end_header':
+            break
+        elif words[0] == 'format':
+            fmt = words[1]
+        elif words[0] == 'element':
+            elements.append((words[1], int(words[2]), []))
+        elif words[0] == 'property':
+            if words[1] == 'list':
+                elements[-1][2].append((words[4], _PLY_TYPES[words[2]], _PLY_TYPES[words[3]]))
+            else:
+                elements[-1][2].append((words[2], _PLY_TYPES[words[1]]))
+    return fmt, elements, f.tell()
+
+def read_PLY(filename, subsample=1):
+    """
+    Read the elements of a PLY file as numpy arrays
+
+    Binary files are memory mapped, each element is returned as a
+    structured array where the properties are strided views of the file data,
+    list properties with a fixed number of items (eg: triangle vertex_indices)
+    are returned as (N, items) views, no data is read until it is used
+
+    ASCII files and those with variable length lists are read with plyfile
+
+    Parameters
+    ----------
+    filename : str
+        PLY file to read
+    subsample : int
+        Subsample factor for the vertex element, use every Nth vertex
+        (should only be used with point data, as face indices are not adjusted)
+
+    Returns
+    -------
+    elements : dict
+        Structured data arrays for each element by name
+
+    Example
+    -------
+    >>> import lavavu, os, tempfile
+    >>> lv = lavavu.Viewer()
+    >>> tris = lv.triangles("tris", vertices=[[0,0,0], [1,0,0], [0,1,0], [1,1,0]], indices=[0,1,2, 1,3,2])
+    >>> filename = os.path.join(tempfile.mkdtemp(), 'tris.ply')
+    >>> export_PLY(filename, tris, stream=True)
+    4  vertices,  2  faces
+    Streaming binary PLY data
+    >>> ply = read_PLY(filename)
+    >>> print(ply['vertex']['x'].tolist())
+    [0.0, 1.0, 0.0, 1.0]
+    >>> print(ply['face']['vertex_indices'].tolist())
+    [[0, 1, 2], [1, 3, 2]]
+    """
+    size = os.path.getsize(filename)
+    with open(filename, 'rb') as f:
+        fmt, elements, offset = _read_PLY_header(f)
+        result = {}
+        if fmt in ['binary_little_endian', 'binary_big_endian']:
+            endian = '<' if fmt == 'binary_little_endian' else '>'
+            for name, count, props in elements:
+                fields = []
+                for prop in props:
+                    if len(prop) == 3:
+                        #List property, need a fixed item count, read from the first record
+                        f.seek(offset + (numpy.dtype(fields).itemsize if len(fields) else 0))
+                        items = numpy.frombuffer(f.read(numpy.dtype(prop[1]).itemsize), dtype=endian + prop[1]) if count else [3]
+                        if len(items) == 0:
+                            result = None
+                            break
+                        fields += [('_count_' + prop[0], endian + prop[1]), (prop[0], endian + prop[2], (int(items[0]),))]
+                    else:
+                        fields += [(prop[0], endian + prop[1])]
+                if result is None: break
+                dtype = numpy.dtype(fields)
+                if offset + count * dtype.itemsize > size:
+                    #List lengths vary (the first record is not typical), data would overrun the file
+                    result = None
+                    break
+                if count == 0:
+                    data = numpy.zeros(0, dtype=dtype)
+                else:
+                    data = numpy.memmap(filename, dtype=dtype, mode='r', offset=offset, shape=(count,))
+                #Check all list lengths match
+                if any([not numpy.all(data['_count_' + p[0]] == data['_count_' + p[0]][0]) for p in props if len(p) == 3 and count]):
+                    result = None
+                    break
+                result[name] = data
+                offset += count * dtype.itemsize
+        else:
+            result = None
+
+    if result is None:
+        #ASCII or variable length lists, fall back to plyfile
+        import plyfile
+        plydata = plyfile.PlyData.read(filename)
+        result = dict([(el.name, el.data) for el in plydata.elements])
+
+    if subsample > 1 and 'vertex' in result:
+        result['vertex'] = result['vertex'][::subsample]
+    return result
+
+def _PLY_columns(element, names, dtype=numpy.float32):
+    """
+    Copy properties from a PLY element into the columns of a new array
+    """
+    out = numpy.empty(shape=(len(element), len(names)), dtype=dtype)
+    for i,name in enumerate(names):
+        out[:,i] = element[name]
+    return out
+
 def _get_PLY_colours(element):
     """
     Extract colour data from PLY element and return as a numpy rgba array
@@ -541,76 +837,63 @@ def _get_PLY_colours(element):
     g = None
     b = None
     a = None
-    #print(element.properties)
-    for prop in element.properties:
-        #print(prop,prop.name,prop.dtype)
-        if 'red' in prop.name: r = element[prop.name]
-        if 'green' in prop.name: g = element[prop.name]
-        if 'blue' in prop.name: b = element[prop.name]
-        if 'alpha' in prop.name: a = element[prop.name]
+    #(plyfile element or structured array from read_PLY)
+    names = element.dtype.names if isinstance(element, numpy.ndarray) else [prop.name for prop in element.properties]
+    for name in names:
+        if 'red' in name: r = name
+        if 'green' in name: g = name
+        if 'blue' in name: b = name
+        if 'alpha' in name: a = name
 
     if r is not None and g is not None and b is not None:
-        if a is None:
-            a = numpy.full(r.shape, 255)
-        #return numpy.array([r, g, b, a])
-        return numpy.vstack((r,g,b,a)).reshape([4, -1]).transpose()
+        #Opaque if no alpha provided
+        C = numpy.full((len(element), 4), 255, dtype=numpy.uint8)
+        for i,name in enumerate([r, g, b, a]):
+            if name is not None:
+                C[:,i] = element[name]
+        return C
 
     return None
 
 def plot_PLY(lv, filename):
     """
-    Plot triangles from a PlyData instance. Assumptions:
+    Plot triangles or points from a PLY file. Assumptions:
         `ply' has a 'vertex' element with 'x', 'y', and 'z'
             properties;
         `ply' has a 'face' element with an integral list property
             'vertex_indices', all of whose elements have length 3.
+
+    Binary files are memory mapped and loaded directly, see read_PLY()
     """
-    import plyfile
-    plydata = plyfile.PlyData.read(filename)
-
-    x = plydata['vertex']['x']
-    y = plydata['vertex']['y']
-    z = plydata['vertex']['z']
-    V = numpy.vstack((x,y,z)).reshape([3, -1]).transpose()
-    #V = numpy.array([x, y, z])
-    #print("VERTS:", V.shape)
-
-    vp = []
-    for prop in plydata['vertex'].properties:
-        vp.append(prop.name)
-        print(prop.name)
-    
+    plydata = read_PLY(filename)
+
+    vertex = plydata['vertex']
+    vp = vertex.dtype.names
+    print(vp)
+    V = _PLY_columns(vertex, ['x', 'y', 'z'])
+
     N = None
     if 'nx' in vp and 'ny' in vp and 'nz' in vp:
-        nx = plydata['vertex']['nx']
-        ny = plydata['vertex']['ny']
-        nz = plydata['vertex']['nz']
-        N = numpy.vstack((nx,ny,nz)).reshape([3, -1]).transpose()
-    
+        N = _PLY_columns(vertex, ['nx', 'ny', 'nz'])
+
     T = None
     if 's' in vp and 't' in vp:
-        s = plydata['vertex']['s']
-        t = plydata['vertex']['t']
-        T = numpy.vstack((s,t)).reshape([2, -1]).transpose()
+        T = _PLY_columns(vertex, ['s', 't'])
 
-    C = _get_PLY_colours(plydata['vertex'])
+    C = _get_PLY_colours(vertex)
 
     if 'face' in plydata:
-        #print(plydata['face'])
         #Face colours?
         if C is None:
             C = _get_PLY_colours(plydata['face'])
 
         tri_idx = plydata['face']['vertex_indices']
-        idx_dtype = tri_idx[0].dtype
-        tri_idx = numpy.asarray(tri_idx).flatten()
-        #print(type(tri_idx),idx_dtype,tri_idx.shape)
-        #print(tri_idx)
-
-        triangles = numpy.array([t.tolist() for t in tri_idx]).flatten()
-        #triangles = numpy.fromiter(tri_idx, [('data', idx_dtype, (3,))], count=len(tri_idx))['data']
+        if tri_idx.dtype == object:
+            #Lists read by plyfile
+            tri_idx = numpy.vstack(tri_idx)
+        #(N,3) view of the mapped file, converted to uint32 in a single pass
+        triangles = tri_idx.ravel()
 
         return lv.triangles(vertices=V, indices=triangles, colours=C, normals=N, texcoords=T)
     else:
         return lv.points(vertices=V, colours=C, normals=N, texcoords=T)
-
@@ -14,7 +14,7 @@ See the :any:`lavavu.Viewer` class documentation for more information.
 """
 
 __all__ = ['Viewer', 'Object', 'Properties', 'ColourMap', 'DrawData', 'Figure', 'Geometry', 'Image',
-           'download', 'grid2d', 'grid3d', 'cubehelix', 'loadCPT', 'matplotlib_colourmap', 'printH5', 'lerp',
+           'download', 'grid2d', 'grid3d', 'memmap', 'quantize', 'cubehelix', 'loadCPT', 'matplotlib_colourmap', 'printH5', 'lerp',
            'inject', 'hidecode', 'style', 'cellstyle', 'cellwidth',
            'version', 'settings', 'is_ipython', 'is_notebook', 'getname']
 
@@ -22,7 +22,7 @@ __all__ = ['Viewer', 'Object', 'Properties', 'ColourMap', 'DrawData', 'Figure',
 import os
 #must be an object or won't be referenced from __init__.py import
 #(enures values are passed on when set externally)
-settings = {"default_args" : [], "echo_fails" : False, "quality_override" : None}
+settings = {"default_args" : [], "echo_fails" : False, "quality_override" : None, "polling" : False}
 #Default arguments for viewer creation
 _val = os.environ.get('LV_ARGS')
 if _val:
@@ -35,6 +35,14 @@ if _val:
 _val = os.environ.get('LV_QUALITY')
 if _val:
     settings["quality_override"] = int(_val)
+#Render thread polls its call queue on a timer instead of waiting for calls
+_val = os.environ.get('LV_POLLING')
+if _val:
+    #Accept 0/1 or true/false
+    try:
+        settings["polling"] = bool(int(_val))
+    except ValueError:
+        settings["polling"] = _val.strip().lower() in ["true", "yes", "on"]
 
 import json
 import math
@@ -48,6 +56,14 @@ import base64
 import threading
 import time
 import weakref
+import bisect
+import itertools
+import zlib
+try:
+    import queue
+except ImportError:
+    import Queue as queue
+from concurrent.futures import Future, ThreadPoolExecutor
 
 from vutils import is_ipython, is_notebook, getname
 
@@ -58,6 +74,29 @@ version = LavaVuPython.version
 TOL_DEFAULT = 0.0001 #Default error tolerance for image tests
 TIMER_MAX_FPS = 200   #FPS for frame timer
 TIMER_INC = 1.0 / TIMER_MAX_FPS #Timer increment in milliseconds
+TIMER_IDLE = 0.1 #Event check interval in seconds when no window is visible
+BLOCK_SIZE = 16777216 #Values loaded per block from memory mapped data
+
+#Render thread call priority lanes, lower values are processed first
+PRIORITY_INTERACTIVE = 0 #Frame/image requests from interactive clients
+PRIORITY_QUERY = 1       #State queries and commands (default)
+PRIORITY_BULK = 2        #Long running jobs, events are processed after each one
+#Priority of render thread calls by method name, others use PRIORITY_QUERY
+CALL_PRIORITY = {"image" : PRIORITY_INTERACTIVE,
+                 "imageJPEG" : PRIORITY_INTERACTIVE,
+                 "imagePNG" : PRIORITY_INTERACTIVE,
+                 "imageBuffer" : PRIORITY_INTERACTIVE,
+                 "imageArray" : PRIORITY_INTERACTIVE,
+                 "video" : PRIORITY_BULK,
+                 "web" : PRIORITY_BULK,
+                 "loadFile" : PRIORITY_BULK,
+                 "isoSurface" : PRIORITY_BULK,
+                 "_batch_run" : PRIORITY_BULK}
+#Render thread calls that replace loaded data
+CALL_DATA = ["loadFile", "isoSurface", "clearAll"]
+#Render thread calls that do not modify the state
+#(other than by processing commands already queued)
+CALL_READONLY = ["image", "imageJPEG", "imagePNG", "imageBuffer", "imageArray", "imageDiff", "gl_version", "display"]
 
 geomnames = ["labels", "points", "grid", "triangles", "vectors", "tracers", "lines", "shapes", "volumes", "screen"]
 geomtypes = [LavaVuPython.lucLabelType,
@@ -117,6 +156,170 @@ def _convert_args(dictionary):
     """
     return str(json.dumps(dictionary, cls=_CustomEncoder))
 
+def _isiterator(data):
+    #Check for an iterator or generator of data blocks, rather than a single data set
+    if isinstance(data, (numpy.ndarray, list, tuple, str, dict)):
+        return False
+    return hasattr(data, '__next__') or hasattr(data, 'next')
+
+def _interleave(columns, width, dtype):
+    """Re-arrange separate component columns [[x...], [y...], [z...]]
+       into an array of [x,y,z] tuples, converting type in the same pass,
+       any extra components in width are set to zero
+    """
+    out = numpy.empty((columns[0].size, width), dtype=dtype)
+    for i in range(len(columns)):
+        out[:,i] = columns[i].ravel()
+    if width > len(columns):
+        out[:,len(columns):] = 0
+    return out
+
+def memmap(filename, dtype="float32", offset=0, shape=None, order='C'):
+    """
+    Open a raw binary data file as a read only memory mapped array
+
+    The returned array can be passed to the Object data loaders (vertices, values...),
+    pages of the file are only read as the data is loaded, in blocks,
+    so the file is never copied into python memory as a whole.
+    Slices of the array can be used to load a subset of a large file
+
+    Parameters
+    ----------
+    filename : str
+        Path to the raw data file
+    dtype : str or numpy.dtype
+        Data type of the values in the file
+    offset : int
+        Offset in bytes to the start of the data in the file
+    shape : tuple
+        Shape of the data, eg: (N,3) for vertices, (Z,Y,X) for a volume
+        if not provided, a 1d array of the whole file is returned
+    order : str
+        'C' (row-major) or 'F' (column-major) data layout
+
+    Returns
+    -------
+    data : numpy.memmap
+        The memory mapped array
+
+    Example
+    -------
+
+    >>> import lavavu
+    >>> lv = lavavu.Viewer()
+    >>> verts = lavavu.memmap('positions.raw', shape=(-1,3)) # doctest: +SKIP
+    >>> points = lv.points(vertices=verts[::10]) # doctest: +SKIP
+
+    Load vertices from a raw float32 file, read in blocks
+
+    >>> import numpy, os, tempfile
+    >>> filename = os.path.join(tempfile.mkdtemp(), 'positions.raw')
+    >>> numpy.arange(12, dtype=numpy.float32).tofile(filename)
+    >>> points = lv.points(vertices=lavavu.memmap(filename, shape=(-1,3)))
+    >>> print(points.data[0].vertices.tolist())
+    [[0.0, 1.0, 2.0], [3.0, 4.0, 5.0], [6.0, 7.0, 8.0], [9.0, 10.0, 11.0]]
+    """
+    if shape is not None and -1 in shape:
+        #Calculate missing dimension from file size
+        size = (os.path.getsize(filename) - offset) // numpy.dtype(dtype).itemsize
+        known = -numpy.prod(shape)
+        shape = tuple([size // known if d == -1 else d for d in shape])
+    return numpy.memmap(filename, dtype=dtype, mode='r', offset=offset, shape=shape, order=order)
+
+def quantize(data, dtype=numpy.uint16):
+    """
+    Quantise floating point data to unsigned integers spanning the data range,
+    for compact storage of large data sets at half (uint16) or quarter (uint8) size
+
+    The original values are recovered as data * scale + offset,
+    pass the scale and offset to Object.vertices() or Object.values()
+    to load the quantised data
+
+    Parameters
+    ----------
+    data : list or array
+        The data to quantise, must not contain NaN values
+    dtype : numpy.dtype
+        Unsigned integer type to quantise to, default is numpy.uint16
+
+    Returns
+    -------
+    qdata : array
+        The quantised data
+    scale : float
+        Scale factor to restore the data
+    offset : float
+        Offset to restore the data
+
+    Example
+    -------
+    Quantised 2d vertices are restored with the added z coordinate left at zero
+
+    >>> import lavavu
+    >>> lv = lavavu.Viewer()
+    >>> qdata, scale, offset = lavavu.quantize([[1.,2.], [3.,4.]])
+    >>> print(qdata.dtype, qdata.tolist())
+    uint16 [[0, 21845], [43690, 65535]]
+    >>> obj = lv.points()
+    >>> obj.vertices(qdata, scale=scale, offset=offset)
+    >>> print(obj.data[0].vertices.round(3).tolist())
+    [[1.0, 2.0, 0.0], [3.0, 4.0, 0.0]]
+    >>> obj = lv.points()
+    >>> obj.vertices(x=qdata[:,0], y=qdata[:,1], scale=scale, offset=offset)
+    >>> print(obj.data[0].vertices.round(3).tolist())
+    [[1.0, 2.0, 0.0], [3.0, 4.0, 0.0]]
+    """
+    data = numpy.asarray(data)
+    offset = float(numpy.amin(data))
+    scale = (float(numpy.amax(data)) - offset) / numpy.iinfo(dtype).max
+    if scale <= 0.0:
+        scale = 1.0
+    #(one float32 temporary, converted in place)
+    tmp = numpy.subtract(data, offset, dtype=numpy.float32)
+    tmp /= scale
+    numpy.rint(tmp, out=tmp)
+    qdata = numpy.empty(data.shape, dtype=dtype)
+    qdata[...] = tmp
+    return qdata, scale, offset
+
+def _decode(data, source, scale=None, offset=None, components=None):
+    """Restore quantised float32 data as data * scale + offset,
+       in place if data is already a converted copy of the source,
+       if components is provided only the first components of each vector are restored
+       (so a zero 3rd dimension added to 2d vertices stays zero)
+    """
+    if scale is None and offset is None:
+        return data
+    if isinstance(source, numpy.ndarray) and numpy.may_share_memory(data, source):
+        data = numpy.array(data, dtype=numpy.float32)
+    view = data if components is None else data[..., :components]
+    if scale is not None:
+        numpy.multiply(view, scale, out=view, casting='unsafe')
+    if offset is not None:
+        numpy.add(view, offset, out=view, casting='unsafe')
+    return data
+
+def _concat(geometries, typename):
+    """Join a data type from the elements of a list of Geometry into one preallocated array,
+       returns the data with CSR style row offsets for each element and each Geometry
+    """
+    width = dimensions.get(typename, 1)
+    views = []
+    groups = [0]
+    for geom in geometries:
+        for el in geom:
+            view = el.get(typename)
+            views.append(view.reshape((-1, width)) if width > 1 else view.ravel())
+        groups.append(len(views))
+    offsets = numpy.zeros(len(views)+1, dtype=numpy.int64)
+    numpy.cumsum([len(v) for v in views], out=offsets[1:])
+    dtype = views[0].dtype if len(views) else numpy.float32
+    shape = (int(offsets[-1]), width) if width > 1 else (int(offsets[-1]),)
+    data = numpy.empty(shape, dtype=dtype)
+    for i in range(len(views)):
+        data[offsets[i]:offsets[i+1]] = views[i]
+    return data, offsets, offsets[groups]
+
 def grid2d(corners=((0.,1.), (1.,0.)), dims=[2,2]):
     """
     Generate a 2d grid of vertices
@@ -361,6 +564,71 @@ class Properties(dict):
     def parent(self):
         return self._parent()
 
+class _ValueStats(object):
+    """
+    Running statistics of a value data set, updated as data is appended
+    """
+    def __init__(self):
+        self.minimum = None
+        self.maximum = None
+        self.count = 0
+        self.nans = 0
+        self.edges = None
+        self.histogram = None
+
+    def bins(self, bins, minimum, maximum):
+        #Setup fixed bins to count a histogram of values
+        self.edges = numpy.linspace(minimum, maximum, bins+1)
+        self.histogram = numpy.zeros(bins, dtype=numpy.int64)
+
+    def update(self, data, histogram=True):
+        #Update with appended data
+        if not data.size: return
+        nans = int(numpy.count_nonzero(numpy.isnan(data)))
+        self.count += data.size
+        self.nans += nans
+        if nans < data.size:
+            lo = float(numpy.nanmin(data))
+            hi = float(numpy.nanmax(data))
+            if self.minimum is None or lo < self.minimum: self.minimum = lo
+            if self.maximum is None or hi > self.maximum: self.maximum = hi
+        if histogram and self.edges is not None:
+            #(NaN and values outside the bin range are not counted)
+            self.histogram += numpy.histogram(data, self.edges)[0]
+
+    def get(self):
+        stats = {"minimum" : self.minimum, "maximum" : self.maximum,
+                 "count" : self.count, "nan" : self.nans}
+        if self.edges is not None:
+            stats["histogram"] = numpy.copy(self.histogram)
+            stats["edges"] = numpy.copy(self.edges)
+        return stats
+
+class _RangeIndex(object):
+    """
+    Sorted index of a value data set, allows finding the values
+    within a range with a binary search instead of a full scan
+    """
+    def __init__(self, values, stamp=None):
+        #Timestep and data version indexed, to detect when the index is out of date
+        self.stamp = stamp
+        #(stable sort, NaN values are sorted to the end and excluded)
+        self.order = numpy.argsort(values, kind='mergesort')
+        self.values = values[self.order]
+        self.count = len(self.values) - int(numpy.count_nonzero(numpy.isnan(self.values)))
+
+    def bounds(self, minimum, maximum, inclusive=True):
+        #Start and end positions in the sorted values of a range
+        values = self.values[:self.count]
+        lo = numpy.searchsorted(values, minimum, 'left' if inclusive else 'right')
+        hi = numpy.searchsorted(values, maximum, 'right' if inclusive else 'left')
+        return int(lo), int(max(lo, hi))
+
+    def select(self, minimum, maximum, inclusive=True):
+        #Indices of the values within a range
+        lo, hi = self.bounds(minimum, maximum, inclusive)
+        return self.order[lo:hi]
+
 #Wrapper class for drawing object
 #handles property updating via internal dict
 class Object(dict):
@@ -403,6 +671,10 @@ class Object(dict):
         self._parent = weakref.ref(parent)
         self._current = 0
         self._geom = None
+        self._streaming = False
+        self._stats = {}
+        self._statstep = None
+        self._rangeindex = {}
         if not "filters" in self.dict: self.dict["filters"] = []
 
         #Create a control factory
@@ -437,9 +709,14 @@ class Object(dict):
         self.parent._setupobject(self.ref, **self.dict)
 
     def __getitem__(self, key):
-        self.parent._get() #Ensure in sync
+        #Ensure in sync, only the "data" property depends on loaded data
+        self.parent._get(data=(key == "data"))
         if key in self.dict:
-            return self.dict[key]
+            #Return a copy of list/dict values as the cached state is shared
+            value = self.dict[key]
+            if isinstance(value, (list, dict)):
+                return copy.deepcopy(value)
+            return value
         #Check for valid key
         if not key in self.parent.properties:
             raise KeyError(key + " : Invalid property name")
@@ -461,10 +738,13 @@ class Object(dict):
                 cmap = self.colourmap(value)
                 value = cmap.name
 
-        self.parent.app.parseProperty(key + '=' + _convert_args(value), self.ref)
-        self.parent._get() #Ensure in sync
+        if self.parent._batch is not None:
+            self.parent._batch.property(self, key, _convert_args(value))
+        else:
+            self.parent.app.parseProperty(key + '=' + _convert_args(value), self.ref)
 
     def __contains__(self, key):
+        self.parent._get(data=(key == "data")) #Ensure in sync
         return key in self.dict
 
     def __repr__(self):
@@ -594,7 +874,8 @@ class Object(dict):
         self.parent._get() #Ensure have latest data
         filterlist = []
         if "filters" in self:
-            filterlist = self["filters"]
+            #Copy, as the list is shared with the cached state
+            filterlist = copy.copy(self["filters"])
 
         if isinstance(values, float) or isinstance(values, int):
             values = [values,values]
@@ -605,9 +886,97 @@ class Object(dict):
         filterlist.append(newfilter)
 
         self.parent.app.parseProperty('filters=' + json.dumps(filterlist), self.ref)
-        self.parent._get() #Ensure in sync
         return len(self["filters"])-1
 
+    def filterindex(self, label):
+        """
+        Build a sorted index of a value data set used by filters
+
+        When a filter range on this data set is changed, with setfilter() or
+        by a filter control, the values selected are found with a binary search,
+        if the same data points remain selected the object is not re-filtered
+
+        The index covers the values at the current timestep, it is rebuilt
+        when the timestep or the loaded data changes and is discarded
+        when more values are loaded for the label
+
+        Parameters
+        ----------
+        label : str
+            Data label to index
+
+        Returns
+        -------
+        int
+            The number of values indexed
+        """
+        arrays = [el.get(label) for el in self.data]
+        arrays = [a.ravel() for a in arrays if a is not None and len(a)]
+        values = numpy.concatenate(arrays) if len(arrays) else numpy.zeros(0, dtype=numpy.float32)
+        self._rangeindex[label] = _RangeIndex(values, self._datastamp())
+        return len(values)
+
+    def _datastamp(self):
+        #Current timestep and data version, an index is out of date when these change
+        return (self._step(), self.parent.app._dataversion)
+
+    def _filterunchanged(self, index, minimum=None, maximum=None):
+        #Check if a new filter range selects the same values from an indexed data set
+        filters = self["filters"]
+        if index >= len(filters):
+            return False
+        f = filters[index]
+        rindex = self._rangeindex.get(f["by"])
+        if rindex is None or f["map"]:
+            return False
+        if rindex.stamp != self._datastamp():
+            #Timestep changed or data reloaded since indexed
+            self.filterindex(f["by"])
+            rindex = self._rangeindex[f["by"]]
+        if minimum is None: minimum = f["minimum"]
+        if maximum is None: maximum = f["maximum"]
+        if f["minimum"] > f["maximum"] or minimum > maximum:
+            return False
+        return rindex.bounds(f["minimum"], f["maximum"], f["inclusive"]) == rindex.bounds(minimum, maximum, f["inclusive"])
+
+    def _storefilter(self, index, minimum=None, maximum=None):
+        #Store a new filter range without re-filtering the data,
+        #for when the same values remain selected
+        filters = self["filters"]
+        if minimum is not None: filters[index]["minimum"] = minimum
+        if maximum is not None: filters[index]["maximum"] = maximum
+        self.parent._setobject(self.ref, {"filters" : filters})
+
+    def setfilter(self, index, minimum=None, maximum=None):
+        """
+        Modify the range of an existing filter
+
+        Parameters
+        ----------
+        index : int
+            The filter id, as returned by filter()
+        minimum : float
+            New minimum value of the filter range
+        maximum : float
+            New maximum value of the filter range
+
+        Returns
+        -------
+        boolean
+            False if the data set is indexed (see filterindex()) and the
+            same values are selected by the new range, so no update was required
+        """
+        if self._filterunchanged(index, minimum, maximum):
+            self._storefilter(index, minimum, maximum)
+            return False
+        cmds = ["select " + self.name]
+        if minimum is not None:
+            cmds.append("filtermin %d %s" % (index, minimum))
+        if maximum is not None:
+            cmds.append("filtermax %d %s" % (index, maximum))
+        self.parent.commands(cmds)
+        return True
+
     @property
     def datasets(self):
         """
@@ -653,22 +1022,28 @@ class Object(dict):
 
     def _convert(self, data, dtype=None):
         #Prepare a data set
+        #Arrays of the required type are passed through without copying,
+        #conversions are made in a single pass into a new contiguous array
+        #(the provided data is never modified)
         if not isinstance(data, numpy.ndarray):
             #Convert to numpy array first
             data = numpy.asarray(data)
 
-        #Always convert float64 to float32
-        if data.dtype == numpy.float64:
-            data = data.astype(numpy.float32)
+        #Always convert float64 and float16 to float32
+        if dtype is None and data.dtype in [numpy.float64, numpy.float16]:
+            dtype = numpy.float32
 
         #Transform to requested data type if provided
-        if data.dtype == numpy.float32 and dtype == numpy.uint8:
+        if dtype == numpy.uint8 and data.dtype in [numpy.float32, numpy.float64]:
             #Convert float[0,1] to uint8 * 255
+            out = numpy.empty(data.shape, dtype=numpy.uint8)
             if numpy.amin(data) >= 0.0 and numpy.amax(data) <= 1.0:
-                data *= 255.0
-            data = data.astype(numpy.uint8)
-        elif dtype != None and data.dtype != dtype:
-            data = data.astype(dtype)
+                numpy.multiply(data, 255.0, out=out, casting='unsafe')
+            else:
+                out[...] = data
+            data = out
+        elif dtype is not None and data.dtype != dtype:
+            data = data.astype(dtype, order='C')
 
         #Masked array? Set fill value to NaN
         if numpy.ma.is_masked(data):
@@ -679,22 +1054,54 @@ class Object(dict):
 
         return data
 
-    def _loadScalar(self, data, geomdtype):
+    def _loadChunks(self, chunks, load, size=None):
+        """
+        Load data from an iterator or generator of data blocks
+        Each block is appended to the current data element as it is read,
+        so only a single block is held in memory at a time
+
+        Dims can't be calculated from the block shapes, set the "dims"
+        property first if required (eg: for grid or volume data)
+        """
+        total = 0
+        self._streaming = True
+        try:
+            for chunk in chunks:
+                load(chunk)
+                total += numpy.size(chunk)
+        finally:
+            self._streaming = False
+        if size is not None and total != size:
+            print("WARNING: expected data size doesn't match size loaded: ", size, total)
+
+    def _ingested(self, source, data):
+        #Record the load and whether the source data had to be copied to load it
+        copied = not isinstance(source, numpy.ndarray) or not numpy.may_share_memory(source, data)
+        self.parent.app._stats.ingested(data.nbytes, copied)
+
+    def _loadScalar(self, data, geomdtype, source=None):
         #Passes a scalar dataset (float/uint8/uint32)
+        if source is None: source = data
         data = self._convert(data)
         #Load as flattened 1d array
         #(ravel() returns view rather than copy if possible, flatten() always copies)
+        data = data.ravel()
+        self._ingested(source, data)
         if data.dtype == numpy.float32:
-            return self.parent.app.arrayFloat(self.ref, data.ravel(), geomdtype)
+            return self.parent.app.arrayFloat(self.ref, data, geomdtype)
         elif data.dtype == numpy.uint32:
-            return self.parent.app.arrayUInt(self.ref, data.ravel(), geomdtype)
+            return self.parent.app.arrayUInt(self.ref, data, geomdtype)
         elif data.dtype == numpy.uint8:
-            return self.parent.app.arrayUChar(self.ref, data.ravel(), geomdtype)
+            return self.parent.app.arrayUChar(self.ref, data, geomdtype)
 
 
     def _checkDims(self, size):
+        #Loading data in blocks, dims can't be calculated from a block
+        if self._streaming:
+            return True
+
         #User provided dims value
-        if 'dims' in self.dict:
+        if 'dims' in self:
             D = self["dims"]
             #Dims match provided data?
             if isinstance(D, int):
@@ -756,7 +1163,63 @@ class Object(dict):
             #Dims = vertex count
             self["dims"] = (data.size/3, 1)
 
-    def _loadVector(self, data, geomdtype, D=3):
+    def _vectorDims(self, data):
+        #Quads or tracers? Use the shape as dims if not provided
+        #Quad/Triangle type?
+        #if self["geometry"] == 'quads' or self["geometry"] == 'grid':
+        if self["geometry"] in self.parent.renderers[LavaVuPython.lucGridType] or self["geometry"] in self.parent.renderers[LavaVuPython.lucTriangleType]:
+            self._gridDimsFromShape(data)
+        if self["geometry"] in self.parent.renderers[LavaVuPython.lucTracerType]:
+        #elif self["geometry"] == 'tracers':
+            self._tracerDimsFromShape(data)
+
+    def _loadMapped(self, data, load, size=None, vector=False):
+        """
+        Load a memory mapped data set in blocks of BLOCK_SIZE values,
+        pages of the file are read only as each block is loaded
+        Pass vector=True for vector data, which may be provided as columns
+        """
+        shape = data.shape
+        #Vector data provided as separate x,y,z columns? split blocks along the last axis
+        #(same detection as _loadVector, other data is always read in C order)
+        columns = vector and len(shape) == 2 and shape[-1] > 3 and shape[0] in [2, 3]
+        count = shape[-1] if columns else shape[0]
+        rows = max(1, BLOCK_SIZE * count // max(1, data.size))
+        def blocks():
+            for i in range(0, count, rows):
+                #(plain array views, not copies)
+                if columns:
+                    yield numpy.asarray(data[:,i:i+rows]).T
+                else:
+                    yield numpy.asarray(data[i:i+rows])
+        return self._loadChunks(blocks(), load, size)
+
+    def _loadColumns(self, columns, geomdtype, D=3, scale=None, offset=None, size=None):
+        """
+        Load vector data provided as separate component arrays (structure of arrays)
+        The components are interleaved in blocks of BLOCK_SIZE values as they are loaded,
+        so a full size interleaved copy is never created
+        """
+        columns = [numpy.asarray(c).ravel() for c in columns]
+        count = columns[0].size
+        for c in columns:
+            if c.size != count:
+                raise ValueError("Component arrays must all be the same length")
+        #If 2d vertices with 3d target, adds zero 3rd dimension
+        width = 3 if D==3 else len(columns)
+        #Tracers? Use the vertex count as dims if not provided
+        if D==3 and self["geometry"] in self.parent.renderers[LavaVuPython.lucTracerType]:
+            if not self._checkDims(count):
+                self["dims"] = (count, 1)
+        rows = max(1, BLOCK_SIZE // width)
+        def blocks():
+            for i in range(0, count, rows):
+                block = _interleave([c[i:i+rows] for c in columns], width, numpy.float32)
+                #Restore quantised data in the provided components only
+                yield _decode(block, None, scale, offset, len(columns))
+        return self._loadChunks(blocks(), lambda block: self._loadVector(block, geomdtype, D), size)
+
+    def _loadVector(self, data, geomdtype, D=3, scale=None, offset=None):
         """
         Accepts 2d or 3d data as a list of vertices [[x,y,z]...] or [[x,y]...]
          - If the last dimension is 2 and D==3 (target dimensions), a zero 3rd element is added to all vertices
@@ -766,39 +1229,47 @@ class Object(dict):
            the data will be re-arranged automatically
 
         Set D=2 to load 2d data (eg: tex coords) all steps except adding the 3rd dimension are the same
+
+        Quantised data is restored as data * scale + offset if scale or offset provided
         """
         #Passes a vector dataset (float)
-        data = self._convert(data, numpy.float32)
+        source = data
+        if not isinstance(data, numpy.ndarray):
+            data = numpy.asarray(data)
+        if numpy.ma.is_masked(data):
+            data = self._convert(data)
 
         #Detection of structure based on shape
+        #(re-arranging and type conversion are done together in a single copy)
         shape = data.shape
-        if len(shape) >= 2:
+        components = None
+        if len(shape) >= 2 and shape[-1] > 3 and shape[0] in [2, 3]:
             #Data provided as separate x,y,z columns? (Must be > 3 elements)
-            if shape[-1] > 3 and shape[0] == 3:
-                #Re-arrange to array of [x,y,z] triples
-                data = numpy.vstack((data[0],data[1],data[2])).reshape([3, -1]).transpose()
-            elif shape[-1] > 3 and shape[0] == 2:
-                #Re-arrange to array of [x,y] pairs
-                data = numpy.vstack((data[0],data[1])).reshape([2, -1]).transpose()
-
-            #Now check for 2d vertices with 3d target
-            if D==3 and data.shape[-1] == 2:
-                #Interpret as 2d data... must add 3rd dimension
-                data = numpy.insert(data, 2, values=0, axis=len(shape)-1)
-
-            #Quads or tracers? Use the shape as dims if not provided
-            if D==3:
-                #Quad/Triangle type?
-                #if self["geometry"] == 'quads' or self["geometry"] == 'grid':
-                if self["geometry"] in self.parent.renderers[LavaVuPython.lucGridType] or self["geometry"] in self.parent.renderers[LavaVuPython.lucTriangleType]:
-                    self._gridDimsFromShape(data)
-                if self["geometry"] in self.parent.renderers[LavaVuPython.lucTracerType]:
-                #elif self["geometry"] == 'tracers':
-                    self._tracerDimsFromShape(data)
+            #Re-arrange to array of [x,y,z] triples or [x,y] pairs,
+            #if 2d vertices with 3d target, adds zero 3rd dimension
+            width = 3 if D==3 else shape[0]
+            data = _interleave(data, width, numpy.float32)
+            components = shape[0]
+        elif len(shape) >= 2 and D==3 and shape[-1] == 2:
+            #Interpret as 2d data... must add 3rd dimension
+            out = numpy.zeros(shape[:-1] + (3,), dtype=numpy.float32)
+            out[...,0:2] = data
+            data = out
+            components = 2
+        else:
+            data = self._convert(data, numpy.float32)
+
+        if len(shape) >= 2 and D==3:
+            self._vectorDims(data)
+
+        #Restore quantised data
+        data = _decode(data, source, scale, offset, components)
 
         #Load as flattened 1d array
         #(ravel() returns view rather than copy if possible, flatten() always copies)
-        return self.parent.app.arrayFloat(self.ref, data.ravel(), geomdtype)
+        data = data.ravel()
+        self._ingested(source, data)
+        return self.parent.app.arrayFloat(self.ref, data, geomdtype)
 
     @property
     def data(self):
@@ -834,16 +1305,54 @@ class Object(dict):
     def next(self):
         return self._geom.next()
 
-    def vertices(self, data):
+    def vertices(self, data=None, size=None, scale=None, offset=None, x=None, y=None, z=None, layout=None):
         """
         Load 3d vertex data for object
 
         Parameters
         ----------
-        data : list or array
+        data : list or array or iterator
             Pass a list or numpy float32 3d array of vertices
+            or an iterator/generator returning blocks of vertices to load in turn
+            memory mapped arrays (see memmap()) are loaded from the file in blocks
+        size : int
+            Expected total number of values when loading blocks from an iterator
+        scale : float
+            Scale to restore quantised data (see quantize()), data * scale + offset
+        offset : float
+            Offset to restore quantised data (see quantize()), data * scale + offset
+        x,y,z : list or array
+            Pass the vertex coordinates as separate component arrays instead of data,
+            z is optional, 2d vertices are loaded with z=0
+        layout : str
+            Set to "soa" if data is provided as component columns [[x...], [y...], [z...]],
+            by default columns are detected from the shape only if there are more than 3 vertices
+
+        Example
+        -------
+        Components are interleaved in blocks as they are loaded
+
+        >>> import lavavu
+        >>> lv = lavavu.Viewer()
+        >>> obj = lv.points()
+        >>> obj.vertices(x=[0,1,2], y=[1,0,1], z=[0,0,1])
+        >>> print(obj.data[0].vertices.tolist())
+        [[0.0, 1.0, 0.0], [1.0, 0.0, 0.0], [2.0, 1.0, 1.0]]
         """
-        self._loadVector(data, LavaVuPython.lucVertexData)
+        if x is not None or y is not None or z is not None:
+            return self._loadColumns([c for c in [x, y, z] if c is not None], LavaVuPython.lucVertexData, 3, scale, offset, size)
+        if data is None:
+            raise TypeError("vertices() requires data or x,y(,z) component arrays")
+        if layout == "soa":
+            return self._loadColumns(list(data), LavaVuPython.lucVertexData, 3, scale, offset, size)
+        if _isiterator(data):
+            return self._loadChunks(data, lambda chunk: self.vertices(chunk, None, scale, offset), size)
+        if isinstance(data, numpy.memmap):
+            #Dims from the full data shape, before loading in blocks
+            if len(data.shape) > 2 and data.shape[-1] == 3:
+                self._vectorDims(data)
+            return self._loadMapped(data, lambda block: self._loadVector(block, LavaVuPython.lucVertexData, 3, scale, offset), size, vector=True)
+        self._loadVector(data, LavaVuPython.lucVertexData, 3, scale, offset)
 
     def normals(self, data):
         """
@@ -880,24 +1389,167 @@ class Object(dict):
         """
         self._loadVector(data, LavaVuPython.lucVectorData, magnitude)
 
-    def values(self, data, label="default"):
+    def values(self, data, label="default", size=None, scale=None, offset=None):
         """
         Load value data for object
 
         Parameters
         ----------
-        data : list or array
+        data : list or array or iterator
             Pass a list or numpy float32 array of values
+            or an iterator/generator returning blocks of values to load in turn
+            memory mapped arrays (see memmap()) are loaded from the file in blocks
         label : str
             Label for this data set
-        """
+        size : int
+            Expected total number of values when loading blocks from an iterator
+        scale : float
+            Scale to restore quantised data (see quantize()), data * scale + offset
+        offset : float
+            Offset to restore quantised data (see quantize()), data * scale + offset
+
+        Example
+        -------
+        Values can be loaded in blocks from a generator
+
+        >>> import lavavu
+        >>> lv = lavavu.Viewer()
+        >>> obj = lv.points(vertices=[[0,0,0], [1,1,1], [2,2,2], [3,3,3]])
+        >>> obj.values((block for block in [[0,1], [2,3]]), size=4)
+        >>> print(obj.data[0].get("default"))
+        [0. 1. 2. 3.]
+
+        Memory mapped values are loaded in the same order as a plain array
+
+        >>> import numpy, os, tempfile
+        >>> filename = os.path.join(tempfile.mkdtemp(), 'values.raw')
+        >>> numpy.arange(24, dtype=numpy.float32).reshape((3,8)).tofile(filename)
+        >>> plain = lv.points(vertices=numpy.zeros((24,3)))
+        >>> plain.values(numpy.fromfile(filename, dtype=numpy.float32).reshape((3,8)))
+        >>> mapped = lv.points(vertices=numpy.zeros((24,3)))
+        >>> mapped.values(lavavu.memmap(filename, shape=(3,8)))
+        >>> print(numpy.array_equal(plain.data[0].get("default"), mapped.data[0].get("default")))
+        True
+        >>> print(mapped.data[0].get("default")[:4])
+        [0. 1. 2. 3.]
+        """
+        if _isiterator(data):
+            return self._loadChunks(data, lambda chunk: self.values(chunk, label, None, scale, offset), size)
+        if isinstance(data, numpy.memmap):
+            #Volume? Use the full data shape as dims, before loading in blocks
+            if self["geometry"] == 'volume':
+                self._volumeDimsFromShape(data)
+            return self._loadMapped(data, lambda block: self.values(block, label, None, scale, offset), size)
+        source = data
         data = self._convert(data, numpy.float32)
 
         #Volume? Use the shape as dims if not provided
         if self["geometry"] == 'volume':
             self._volumeDimsFromShape(data)
 
-        self.parent.app.arrayFloat(self.ref, data.ravel(), label)
+        #Restore quantised data
+        data = _decode(data, source, scale, offset)
+
+        data = data.ravel()
+        self._ingested(source, data)
+        self._valuestats(label, data)
+        self.parent.app.arrayFloat(self.ref, data, label)
+
+    def _invalidate(self, label=None):
+        #Drop cached statistics and indices of value data sets, all if no label provided
+        if label:
+            self._stats.pop(label, None)
+            self._rangeindex.pop(label, None)
+        else:
+            self._stats = {}
+            self._rangeindex = {}
+
+    def _step(self):
+        #Current timestep, only re-syncs the state if changed by something other than a data load
+        self.parent._get(data=False)
+        return self.parent.state["properties"].get("timestep")
+
+    def _checkstats(self):
+        #Statistics cover the values at the current timestep, discard on a timestep change
+        step = self._step()
+        if step != self._statstep:
+            self._stats = {}
+            self._statstep = step
+
+    def _valuestats(self, label, data):
+        #Update the running statistics for a value data set with appended data
+        #(any sorted index is out of date)
+        self._rangeindex.pop(label, None)
+        self._checkstats()
+        entry = self._stats.get(label)
+        if entry is None:
+            #Only start tracking if no existing data was loaded some other way
+            if label in self.datasets:
+                return
+            entry = self._stats[label] = _ValueStats()
+        entry.update(data)
+
+    def stats(self, label="default", bins=None, valuerange=None):
+        """
+        Get statistics for a value data set at the current timestep
+        (including any fixed data)
+
+        Statistics are kept up to date as values are loaded with values(),
+        so the data only has to be scanned if it was loaded another way
+        (eg: from a file) or the timestep has changed, in which case the values
+        are scanned once and then updated as more values are loaded
+
+        Parameters
+        ----------
+        label : str
+            Label of the data set
+        bins : int
+            Number of fixed width bins to count a histogram of the values in,
+            the histogram is then also kept up to date as values are loaded
+        valuerange : list or tuple
+            Minimum and maximum of the histogram bins, default is the data range
+
+        Returns
+        -------
+        stats : dict
+            The minimum, maximum, count and nan (count of NaN values),
+            plus histogram and bin edges arrays if bins have been set
+
+        Example
+        -------
+        >>> import lavavu
+        >>> lv = lavavu.Viewer()
+        >>> obj = lv.points()
+        >>> lv.addstep()
+        >>> obj.vertices([[0,0,0], [1,1,1]])
+        >>> obj.values([1,2])
+        >>> lv.addstep()
+        >>> obj.vertices([[0,0,0], [1,1,1]])
+        >>> obj.values([5,6])
+        >>> print(obj.stats())
+        {'minimum': 5.0, 'maximum': 6.0, 'count': 2, 'nan': 0}
+        >>> lv.timestep(0)
+        >>> print(obj.stats(bins=2)["histogram"])
+        [1 1]
+        """
+        self._checkstats()
+        entry = self._stats.get(label)
+        if entry is None or (bins and entry.edges is None):
+            #Not tracked (or new histogram), scan the loaded data
+            #(elements without this data set are skipped)
+            arrays = [el.get(label) for el in self.data]
+            arrays = [a for a in arrays if a is not None]
+            entry = _ValueStats()
+            for array in arrays:
+                entry.update(array)
+            if bins:
+                if valuerange is None:
+                    valuerange = (entry.minimum or 0.0, entry.maximum or 0.0)
+                entry.bins(bins, valuerange[0], valuerange[1])
+                for array in arrays:
+                    entry.histogram += numpy.histogram(array, entry.edges)[0]
+            self._stats[label] = entry
+        return entry.get()
 
     def magnitude(self, data, label="magnitude"):
         """
@@ -914,18 +1566,26 @@ class Object(dict):
         mag = numpy.linalg.norm(data, axis=axis)
         return self.parent.app.arrayFloat(self.ref, mag.ravel(), label)
 
-    def colours(self, data):
+    def colours(self, data, size=None):
         """
         Load colour data for object
 
         Parameters
         ----------
-        data : str or list or array
+        data : str or list or array or iterator
             Pass a list or numpy uint32 array of colours
             if a string or list of strings is provided, colours are parsed as html colour string values
             if a numpy array is passed, colours are loaded as 4 byte ARGB unsigned integer values
+            an iterator/generator returning blocks of colours will load each block in turn
+        size : int
+            Expected total number of values when loading blocks from an iterator
         """
+        if _isiterator(data):
+            return self._loadChunks(data, self.colours, size)
         if isinstance(data, numpy.ndarray):
+            if data.dtype.kind in ['U', 'S', 'O']:
+                #Array of colour strings
+                return self._loadScalar(self.parent.parse_colours(data), LavaVuPython.lucRGBAData, data)
             if data.dtype != numpy.uint32:
                 return self.rgba(data)
             self._loadScalar(data, LavaVuPython.lucRGBAData)
@@ -940,33 +1600,45 @@ class Object(dict):
             data = [str(i) for i in data]
         if isinstance(data[0], str):
             #Each element will be parsed as a colour string
-            self.parent.app.loadColours(self.ref, data)
+            #(in bulk, each unique string is only parsed once)
+            self._loadScalar(self.parent.parse_colours(data), LavaVuPython.lucRGBAData, data)
         else:
             #Plain list, assume unsigned colour data, either 4*uint8 or 1*uint32 per rgba colour
             data = numpy.asarray(data, dtype=numpy.uint32)
             self.colours(data)
 
-    def indices(self, data, offset=0):
+    def indices(self, data, offset=0, size=None):
         """
         Load index data for object
 
         Parameters
         ----------
-        data : list or array
+        data : list or array or iterator
             Pass a list or numpy uint32 array of indices
             indices are loaded as 32 bit unsigned integer values
+            (compact uint8/uint16 index arrays are widened in a single pass)
+            or an iterator/generator returning blocks of indices to load in turn
         offset : int
             Specify an initial index offset, for 1-based indices pass offset=1
             Default is zero-based
+        size : int
+            Expected total number of values when loading blocks from an iterator
         """
+        if _isiterator(data):
+            return self._loadChunks(data, lambda chunk: self.indices(chunk, offset), size)
 
         #Accepts only uint32 indices
+        source = data
         data = self._convert(data, numpy.uint32)
         if offset > 0:
             #Convert indices to offset 0 before loading by subtracting offset
-            data = numpy.subtract(data, offset)
+            #(in place if already converted to a new array)
+            if data is source:
+                data = numpy.subtract(data, offset, dtype=numpy.uint32)
+            else:
+                numpy.subtract(data, offset, out=data, casting='unsafe')
         #Load indices
-        self._loadScalar(data, LavaVuPython.lucIndexData)
+        self._loadScalar(data, LavaVuPython.lucIndexData, source)
 
     def rgb(self, data):
         """
@@ -980,6 +1652,7 @@ class Object(dict):
         """
 
         #Accepts only uint8 rgb triples
+        source = data
         data = self._convert(data, numpy.uint8)
 
         #Detection of split r,g,b arrays from shape
@@ -987,9 +1660,9 @@ class Object(dict):
         shape = data.shape
         if len(shape) >= 2 and shape[-1] > 3 and shape[0] == 3:
             #Re-arrange to array of [r,g,b] triples
-            data = numpy.vstack((data[0],data[1],data[2])).reshape([3, -1]).transpose()
+            data = _interleave(data, 3, numpy.uint8)
 
-        self._loadScalar(data, LavaVuPython.lucRGBData)
+        self._loadScalar(data, LavaVuPython.lucRGBData, source)
 
     def rgba(self, data):
         """
@@ -1003,6 +1676,7 @@ class Object(dict):
         """
 
         #Accepts only uint8 rgba
+        source = data
         data = self._convert(data, numpy.uint8)
 
         #Detection of split r,g,b arrays from shape
@@ -1010,9 +1684,9 @@ class Object(dict):
         shape = data.shape
         if len(shape) >= 2 and shape[-1] > 4 and shape[0] == 4:
             #Re-arrange to array of [r,g,b,a] values
-            data = numpy.vstack((data[0],data[1],data[2],data[3])).reshape([4, -1]).transpose()
+            data = _interleave(data, 4, numpy.uint8)
 
-        self._loadScalar(data, LavaVuPython.lucRGBAData)
+        self._loadScalar(data, LavaVuPython.lucRGBAData, source)
 
 
     def luminance(self, data):
@@ -1027,13 +1701,14 @@ class Object(dict):
         """
 
         #Accepts only uint8 luminance values
+        source = data
         data = self._convert(data, numpy.uint8)
 
         #Volume? Use the shape as dims if not provided
         if self["geometry"] == 'volume':
             self._volumeDimsFromShape(data)
 
-        self._loadScalar(data, LavaVuPython.lucLuminanceData)
+        self._loadScalar(data, LavaVuPython.lucLuminanceData, source)
 
     def texture(self, data, flip=True, bgr=False):
         """
@@ -1251,6 +1926,7 @@ class Object(dict):
         """
         Clear all visualisation data from this object
         """
+        self._invalidate()
         self.parent.app.clearObject(self.ref)
 
     def cleardata(self, typename=""):
@@ -1267,9 +1943,12 @@ class Object(dict):
         if typename in datatypes:
             #Found data type name
             dtype = datatypes[typename]
+            if typename == 'values':
+                self._invalidate()
             self.parent.app.clearData(self.ref, dtype)
         else:
             #Assume values by label (or all values if blank)
+            self._invalidate(typename)
             self.parent.app.clearValues(self.ref, typename)
 
     def update(self, filter=None, compress=True):
@@ -1429,6 +2108,67 @@ class _Objects(dict):
     def __str__(self):
         return str(self.keys())
 
+class _Batch(object):
+    """
+    The Batch class is used internally to collect property writes, object setup and commands
+    while a Viewer.batch() transaction is active, they are applied in a single render thread call
+    """
+    def __init__(self, parent):
+        self._parent = weakref.ref(parent)
+        self.depth = 0
+        self.ops = []
+
+    @property
+    def parent(self):
+        return self._parent()
+
+    def __enter__(self):
+        #The transaction is only active inside the block
+        if self.depth == 0:
+            self.parent._batch = self
+        self.depth += 1
+        return self
+
+    def __exit__(self, *args):
+        self.depth -= 1
+        if self.depth == 0:
+            viewer = self.parent
+            viewer._batch = None
+            self.flush()
+            #Single state sync for the whole transaction
+            viewer._get()
+
+    def property(self, target, key, value):
+        #Property writes are merged by target, repeated keys keep the last value
+        #(target is an Object or None for view/global properties)
+        if not len(self.ops) or self.ops[-1][0] != 'properties':
+            self.ops.append(['properties', {}])
+        merged = self.ops[-1][1]
+        tid = id(target)
+        if not tid in merged:
+            merged[tid] = (target.ref if target is not None else None, {})
+        merged[tid][1][key] = value
+
+    def object(self, ref, properties):
+        self.ops.append(['object', ref, properties])
+
+    def commands(self, cmds):
+        #Consecutive command strings are joined and parsed together
+        if len(self.ops) and self.ops[-1][0] == 'commands':
+            self.ops[-1][1] += '\n' + cmds
+        else:
+            self.ops.append(['commands', cmds])
+
+    def state(self, state):
+        self.ops.append(['state', state])
+
+    def flush(self):
+        #Send all queued operations to the render thread as a single call
+        if not len(self.ops): return
+        ops = self.ops
+        self.ops = []
+        self.parent.app.batch(ops)
+
 class _ColourComponents():
     """Class to allow modifying colour components directly as an array
     """
@@ -1532,6 +2272,7 @@ class ColourMap(dict):
             self.ref = self.parent.app.getColourMap(ref)
 
         self.dict = kwargs
+        self._version = -1
         self._get() #Sync
 
         #Init prop dict for tab completion
@@ -1590,6 +2331,10 @@ class ColourMap(dict):
 
     def _get(self):
         self.parent._get() #Ensure in sync
+        #Skip if viewer state unchanged since last update
+        if self._version == self.parent._version:
+            return
+        self._version = self.parent._version
         #Update prop dict
         for cm in self.parent.state["colourmaps"]:
             if cm["name"] == self.ref.name:
@@ -1794,24 +2539,263 @@ class Figure(dict):
         return self.parent.image(*args, **kwargs)
 
 
+class _RenderStats(object):
+    """
+    Timing statistics for calls made on the render thread,
+    see Viewer.stats()
+    """
+    #Histogram bucket upper bounds in milliseconds (last bucket is everything above)
+    BUCKETS = [0.1, 0.5, 1, 5, 10, 50, 100, 500, 1000, 5000]
+
+    def __init__(self):
+        #Updated from the render thread and callers, read from any thread
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self.lock:
+            self.start = time.time()
+            self.calls = {}
+            self.frames = self._entry()
+            self.peak = 0
+            self.commands = 0
+            self.coalesced = 0
+            self.ingest = {"loads" : 0, "bytes" : 0, "copies" : 0, "copied_bytes" : 0}
+
+    def _entry(self):
+        return {"count" : 0,
+                "wait" : 0.0, "wait_max" : 0.0, "wait_hist" : [0] * (len(self.BUCKETS)+1),
+                "exec" : 0.0, "exec_max" : 0.0, "exec_hist" : [0] * (len(self.BUCKETS)+1)}
+
+    def _add(self, entry, key, elapsed):
+        ms = elapsed * 1000.0
+        entry[key] += ms
+        if ms > entry[key + "_max"]:
+            entry[key + "_max"] = ms
+        entry[key + "_hist"][bisect.bisect_left(self.BUCKETS, ms)] += 1
+
+    def queued(self, depth):
+        with self.lock:
+            if depth > self.peak:
+                self.peak = depth
+
+    def call(self, name, wait, elapsed):
+        with self.lock:
+            entry = self.calls.get(name)
+            if entry is None:
+                entry = self.calls[name] = self._entry()
+            entry["count"] += 1
+            self._add(entry, "wait", wait)
+            self._add(entry, "exec", elapsed)
+
+    def ingested(self, nbytes, copied):
+        with self.lock:
+            self.ingest["loads"] += 1
+            self.ingest["bytes"] += nbytes
+            if copied:
+                self.ingest["copies"] += 1
+                self.ingest["copied_bytes"] += nbytes
+
+    def queuedcommands(self, count, coalesced):
+        with self.lock:
+            self.commands += count
+            self.coalesced += coalesced
+
+    def frame(self, elapsed):
+        with self.lock:
+            self.frames["count"] += 1
+            self._add(self.frames, "exec", elapsed)
+
+    def get(self, depth=0):
+        #Snapshot under the lock, then derive the means
+        with self.lock:
+            calls = copy.deepcopy(self.calls)
+            frames = copy.deepcopy(self.frames)
+            queue = {"depth" : depth, "peak" : self.peak,
+                     "commands" : self.commands, "coalesced" : self.coalesced}
+            ingest = dict(self.ingest)
+            start = self.start
+        for name in calls:
+            entry = calls[name]
+            entry["wait_mean"] = entry["wait"] / entry["count"]
+            entry["exec_mean"] = entry["exec"] / entry["count"]
+        del frames["wait"], frames["wait_max"], frames["wait_hist"]
+        if frames["count"]:
+            frames["exec_mean"] = frames["exec"] / frames["count"]
+        elapsed = time.time() - start
+        frames["fps"] = frames["count"] / elapsed if elapsed > 0 else 0.0
+        return {"elapsed" : elapsed,
+                "queue" : queue,
+                "calls" : calls,
+                "frames" : frames,
+                "ingest" : ingest,
+                "buckets" : list(self.BUCKETS)}
+
+    def summary(self, depth=0):
+        #Text table of the statistics, for logging
+        stats = self.get(depth)
+        lines = ["Render thread: %.1fs, queue depth %d (peak %d), %d frames (%.1f fps, mean %.3f ms)" % (
+                 stats["elapsed"], depth, stats["queue"]["peak"], stats["frames"]["count"], stats["frames"]["fps"],
+                 stats["frames"].get("exec_mean", 0.0))]
+        lines.append("%-20s %8s %12s %12s %12s %12s" % ("call", "count", "wait(ms)", "wait max", "exec(ms)", "exec max"))
+        for name in sorted(stats["calls"], key=lambda n: -stats["calls"][n]["exec"]):
+            c = stats["calls"][name]
+            lines.append("%-20s %8d %12.3f %12.3f %12.3f %12.3f" % (name, c["count"], c["wait_mean"], c["wait_max"], c["exec_mean"], c["exec_max"]))
+        return '\n'.join(lines)
+
+def _mouseargs(cmd):
+    #Split a queued "mouse mouse=move,button=0,x=1,y=2..." command into a dict
+    try:
+        return dict([arg.split('=', 1) for arg in cmd.split(None, 1)[1].split(',') if arg])
+    except (IndexError, ValueError):
+        return None
+
+def _merge(prev, cmd):
+    """
+    Merge a command with the previous queued command if the result is equivalent,
+    returns the merged command or None if both must be kept
+    """
+    if prev == cmd and cmd in ["display", "redraw"]:
+        #Stacked redisplays
+        return cmd
+    p = prev.split()
+    c = cmd.split()
+    if len(c) == 1 and '=' in c[0] and len(p) == 1 and '=' in p[0]:
+        #Repeated property set, only the last value matters
+        if p[0].split('=', 1)[0] == c[0].split('=', 1)[0]:
+            return cmd
+        return None
+    if not len(p) or not len(c) or p[0] != c[0]:
+        return None
+    if c[0] == "mouse":
+        pargs = _mouseargs(prev)
+        cargs = _mouseargs(cmd)
+        if not pargs or not cargs:
+            return None
+        action = cargs.get("mouse")
+        if action != pargs.get("mouse") or action not in ["move", "scroll"]:
+            return None
+        #Must be the same button/modifier state
+        for key in ["button", "modifiers"]:
+            if pargs.get(key) != cargs.get(key):
+                return None
+        if action == "move":
+            #Only the latest position matters, motion is relative to the last press/move
+            return cmd
+        #Accumulate scrolling
+        try:
+            cargs["spin"] = str(int(pargs.get("spin", 0)) + int(cargs.get("spin", 0)))
+        except ValueError:
+            return None
+        return "mouse " + ','.join([k + '=' + cargs[k] for k in cargs])
+    if c[0] in ["rotate", "translate"] and len(p) == 3 and len(c) == 3 and p[1] == c[1] and c[1] in ["x", "y", "z"]:
+        #Accumulate rotation/translation about the same axis
+        try:
+            return "%s %s %s" % (c[0], c[1], float(p[2]) + float(c[2]))
+        except ValueError:
+            return None
+    return None
+
+def _coalesce(cmds):
+    """
+    Merge or drop superseded commands of the same kind from a list of queued commands,
+    consecutive mouse moves, scrolls, axis rotations and translations,
+    repeated property sets and stacked redisplays
+    """
+    result = []
+    for cmd in cmds:
+        cmd = cmd.strip()
+        if not len(cmd):
+            continue
+        if len(result):
+            merged = _merge(result[-1], cmd)
+            if merged is not None:
+                result[-1] = merged
+                continue
+        result.append(cmd)
+    return result
+
+def _report(future):
+    #Print errors from render thread calls when nothing waits on the result
+    if not future.cancelled() and future.exception() is not None:
+        print("Error in render thread call: " + str(future.exception()))
+
+def _then(future, func):
+    #Return a new Future with the result of future passed through func
+    #(cancelling either future cancels the other)
+    result = Future()
+    def done(f):
+        if f.cancelled():
+            result.cancel()
+        if not result.set_running_or_notify_cancel():
+            return
+        try:
+            result.set_result(func(f.result()))
+        except Exception as e:
+            result.set_exception(e)
+    def cancelled(r):
+        if r.cancelled():
+            future.cancel()
+    result.add_done_callback(cancelled)
+    future.add_done_callback(done)
+    return result
+
 class _LavaVuThreadSafe(LavaVuPython.LavaVu):
     def __init__(self, threaded=True, *args, **kwargs):
         self._threaded = threaded
         self._closing = False
+        self._render_thread = None
 
         if threaded:
-            # Create a condition variable to synchronize resource access
-            self._cv = threading.Condition()
-
             # Create the command queue
-            from collections import deque
-            self._q = deque()
+            # (each queued call carries its own Future to return the result)
+            # (a deque per priority lane polled on a timer in polling mode,
+            #  otherwise a blocking priority queue, FIFO within each lane)
+            # (calls from the same thread are never reordered, the last one
+            #  submitted is kept per thread to hold later calls behind it)
+            self._producer = threading.local()
+            self._polling = settings["polling"]
+            if self._polling:
+                from collections import deque
+                self._q = [deque() for p in range(PRIORITY_BULK+1)]
+            else:
+                self._q = queue.PriorityQueue()
+                self._seq = itertools.count()
+
+            #Commands held for merging before passing to the viewer command queue
+            self._commands = []
+            self._cmdlock = threading.Lock()
 
-            #Safe call return value
-            self._returned = None
+        #State version counters, incremented whenever the state may have changed
+        #allows the python wrappers to skip re-syncing when nothing is modified
+        #(data loads are counted separately as they only change the data labels)
+        self._version = 0
+        self._dataversion = 0
+        #Set when commands are passed to the viewer queue, they will be processed on next render
+        self._flushed = False
+
+        #Call and frame timing statistics
+        self._stats = _RenderStats()
 
         super(_LavaVuThreadSafe, self).__init__(*args, **kwargs)
 
+    def _modified(self, data=False):
+        #Flag the state as changed, wrappers will re-sync on next access
+        if data:
+            self._dataversion += 1
+        else:
+            self._version += 1
+
+    def _changed(self, name):
+        #Flag the state as changed after a render thread call,
+        #read only calls can only change it by processing queued commands
+        if name in CALL_READONLY and not self._flushed:
+            return
+        self._flushed = False
+        if name in CALL_DATA:
+            self._modified(True)
+        self._modified()
+
     #def __getattr__(self, attr):
     #    #Lock?
     #    return self.app[attr]
@@ -1867,6 +2851,24 @@ class _LavaVuThreadSafe(LavaVuPython.LavaVu):
     def addTimeStep(self, *args, **kwargs):
         return self._lavavu_call('addTimeStep', True, *args, **kwargs)
 
+    def batch(self, ops):
+        #Apply a list of queued operations from Viewer.batch() in one call
+        return self._thread_call(self._batch_run, True, ops)
+
+    def _batch_run(self, ops):
+        base = super(_LavaVuThreadSafe, self)
+        for op in ops:
+            if op[0] == 'properties':
+                for ref, props in op[1].values():
+                    for key in props:
+                        base.parseProperty(key + '=' + props[key], ref)
+            elif op[0] == 'object':
+                base.setObject(op[1], op[2])
+            elif op[0] == 'commands':
+                base.parseCommands(op[1])
+            elif op[0] == 'state':
+                base.setState(op[1])
+
     def imageDiff(self, *args, **kwargs):
         return self._lavavu_call('imageDiff', True, *args, **kwargs)
 
@@ -1908,6 +2910,109 @@ class _LavaVuThreadSafe(LavaVuPython.LavaVu):
 
     ####################################
 
+    """
+    These functions may modify the state or data, so flag it as changed
+    """
+    def parseProperty(self, *args, **kwargs):
+        return self._lavavu_modify('parseProperty', *args, **kwargs)
+
+    def setState(self, *args, **kwargs):
+        return self._lavavu_modify('setState', *args, **kwargs)
+
+    def queueCommands(self, cmds):
+        if not self._threaded:
+            self._flushed = True
+            return self._lavavu_modify('queueCommands', cmds)
+        #Hold commands until the render thread next processes events,
+        #so superseded commands can be merged first
+        with self._cmdlock:
+            self._commands.extend(cmds.split('\n'))
+        self._modified()
+        #Wake render thread to process the viewer command queue
+        self._wake()
+
+    def _queued(self):
+        #Pass held commands to the viewer command queue after merging, in render thread
+        if not len(self._commands):
+            return
+        with self._cmdlock:
+            cmds = self._commands
+            self._commands = []
+        merged = _coalesce(cmds)
+        self._stats.queuedcommands(len(cmds), len(cmds) - len(merged))
+        base = super(_LavaVuThreadSafe, self)
+        for cmd in merged:
+            base.queueCommands(cmd)
+        self._flushed = True
+
+    def setObject(self, *args, **kwargs):
+        return self._lavavu_modify('setObject', *args, **kwargs)
+
+    def createObject(self, *args, **kwargs):
+        return self._lavavu_modify('createObject', *args, **kwargs)
+
+    def colourBar(self, *args, **kwargs):
+        return self._lavavu_modify('colourBar', *args, **kwargs)
+
+    def addColourMap(self, *args, **kwargs):
+        return self._lavavu_modify('addColourMap', *args, **kwargs)
+
+    def setColourMap(self, *args, **kwargs):
+        return self._lavavu_modify('setColourMap', *args, **kwargs)
+
+    def clearObject(self, *args, **kwargs):
+        return self._lavavu_load('clearObject', *args, **kwargs)
+
+    def clearValues(self, *args, **kwargs):
+        return self._lavavu_load('clearValues', *args, **kwargs)
+
+    def clearData(self, *args, **kwargs):
+        return self._lavavu_load('clearData', *args, **kwargs)
+
+    def arrayFloat(self, *args, **kwargs):
+        return self._lavavu_load('arrayFloat', *args, **kwargs)
+
+    def arrayUInt(self, *args, **kwargs):
+        return self._lavavu_load('arrayUInt', *args, **kwargs)
+
+    def arrayUChar(self, *args, **kwargs):
+        return self._lavavu_load('arrayUChar', *args, **kwargs)
+
+    def textureUChar(self, *args, **kwargs):
+        return self._lavavu_load('textureUChar', *args, **kwargs)
+
+    def textureUInt(self, *args, **kwargs):
+        return self._lavavu_load('textureUInt', *args, **kwargs)
+
+    def loadTriangles(self, *args, **kwargs):
+        return self._lavavu_load('loadTriangles', *args, **kwargs)
+
+    def loadColours(self, *args, **kwargs):
+        return self._lavavu_load('loadColours', *args, **kwargs)
+
+    def loadLabels(self, *args, **kwargs):
+        return self._lavavu_load('loadLabels', *args, **kwargs)
+
+    def geometryArrayFloat(self, *args, **kwargs):
+        return self._lavavu_load('geometryArrayFloat', *args, **kwargs)
+
+    def geometryArrayUInt(self, *args, **kwargs):
+        return self._lavavu_load('geometryArrayUInt', *args, **kwargs)
+
+    def geometryArrayUChar(self, *args, **kwargs):
+        return self._lavavu_load('geometryArrayUChar', *args, **kwargs)
+
+    def appendToObject(self, *args, **kwargs):
+        return self._lavavu_load('appendToObject', *args, **kwargs)
+
+    def reloadObject(self, *args, **kwargs):
+        return self._lavavu_load('reloadObject', *args, **kwargs)
+
+    def update(self, *args, **kwargs):
+        return self._lavavu_load('update', *args, **kwargs)
+
+    ####################################
+
     def display(self, *args, **kwargs):
         #Don't wait for return value
         self._openglviewer_call('display', False, *args, **kwargs)
@@ -1952,6 +3057,18 @@ class _LavaVuThreadSafe(LavaVuPython.LavaVu):
 
     ####################################
 
+    #Call LavaVu method that modifies the state from current thread
+    def _lavavu_modify(self, name, *args, **kwargs):
+        result = getattr(super(_LavaVuThreadSafe, self), name)(*args, **kwargs)
+        self._modified()
+        return result
+
+    #Call LavaVu method that modifies object data from current thread
+    def _lavavu_load(self, name, *args, **kwargs):
+        result = getattr(super(_LavaVuThreadSafe, self), name)(*args, **kwargs)
+        self._modified(data=True)
+        return result
+
     #Call LavaVu method from render thread
     def _lavavu_call(self, name, wait_return, *args, **kwargs):
         method = getattr(super(_LavaVuThreadSafe, self), name)
@@ -1961,28 +3078,200 @@ class _LavaVuThreadSafe(LavaVuPython.LavaVu):
     def _openglviewer_call(self, name, wait_return, *args, **kwargs):
         return self._thread_call(getattr(self.viewer, name), wait_return, *args, **kwargs)
 
+    def submit(self, name, *args, **kwargs):
+        """
+        Queue a LavaVu method call on the render thread and return immediately
+
+        Returns
+        -------
+        future : concurrent.futures.Future
+            Future holding the result of the call once processed
+        """
+        return self._thread_future(getattr(super(_LavaVuThreadSafe, self), name), *args, **kwargs)
+
+    def _thread_future(self, method, *args, **kwargs):
+        """
+        Queue a call on the render thread, returns a Future holding the result
+        (run immediately if not threaded or already in the render thread)
+
+        Calls are prioritised by method name (see CALL_PRIORITY), but calls
+        from the same thread are always processed in the order submitted
+
+        Example
+        -------
+        A frame requested after a command is rendered after it,
+        even while waiting behind a long running job
+
+        >>> import lavavu, threading
+        >>> lv = lavavu.Viewer()
+        >>> ready = threading.Event()
+        >>> order = []
+        >>> def loadFile(): ready.wait(5)
+        >>> def parseCommands(): order.append("commands")
+        >>> def imageJPEG(): order.append("image")
+        >>> futures = [lv.app._thread_future(f) for f in [loadFile, parseCommands, imageJPEG]]
+        >>> ready.set()
+        >>> futures[-1].result(5)
+        >>> print(order)
+        ['commands', 'image']
+        """
+        future = Future()
+        call = [future, method, args, kwargs, time.time()]
+        if not self._threaded or threading.current_thread() is self._render_thread:
+            self._thread_exec(call)
+        else:
+            #Use the thread queue to pass input args
+            #print("THREAD_CALL:",method.__name__,args,kwargs)
+            self._submit(call)
+        return future
+
     def _thread_call(self, method, wait_return, *args, **kwargs):
-        if not self._threaded:
-            return method(*args, **kwargs)
         """
         This calls a method on the render thread
         All args are placed on the queue, along with the method
+        and a Future to hold the result, safe to use from multiple threads
 
         if wait_return is True:
-          Wait for the call to be executed with a condition variable lock
-          Returns the saved return data from render thread after woken
+          Wait for the call to be executed and return the result
+          (exceptions raised in the render thread are raised here)
         Otherwise:
-          Return immediately
-        """
-        #Use the thread queue to pass input args
-        self._q.append([method, wait_return, args, kwargs])
-        #print("THREAD_CALL:",method.__name__,args,kwargs)
+          Return the Future immediately, errors are printed
+          as nothing waits for the result
+
+        If not threaded, or called from the render thread, the call
+        is made directly, the result or completed Future is returned
+
+        Calls still queued when the render thread stops are cancelled
+
+        Example
+        -------
+        >>> import lavavu, threading
+        >>> lv = lavavu.Viewer()
+        >>> app = lv.app
+        >>> started = threading.Event()
+        >>> ready = threading.Event()
+        >>> def loadFile():
+        ...     started.set()
+        ...     ready.wait(5)
+        >>> running = app._thread_call(loadFile, False)
+        >>> waiting = app._thread_call(loadFile, False)
+        >>> started.wait(5)
+        True
+        >>> app._closing = True
+        >>> ready.set()
+        >>> running.result(5)
+        >>> waiting.exception(5) is None
+        Traceback (most recent call last):
+        ...
+        concurrent.futures._base.CancelledError
+        >>> app._thread_call(loadFile, False).cancelled()
+        True
+
+        Without a render thread the completed Future is returned
+
+        >>> lv = lavavu.Viewer(port=0)
+        >>> lv.app._thread_call(lambda: 1, False).result()
+        1
+        """
+        if wait_return and (not self._threaded or threading.current_thread() is self._render_thread):
+            #Not threaded or already in render thread, call directly
+            t0 = time.time()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self._stats.call(method.__name__, 0.0, time.time() - t0)
+                self._changed(method.__name__)
+        #(run immediately if not threaded, returning the completed Future)
+        future = self._thread_future(method, *args, **kwargs)
         if wait_return:
             #Wait until the call is completed in render thread
-            with self._cv:
-                self._cv.wait()
-            #Return the saved result data
-            return self._returned
+            return future.result()
+        future.add_done_callback(_report)
+        return future
+
+    def _submit(self, call):
+        #Add a call to the render thread queue, in the lane for its priority
+        priority = CALL_PRIORITY.get(call[1].__name__, PRIORITY_QUERY)
+        #A call may not overtake an earlier call from the same thread that is still
+        #waiting, eg: aframe() after acommands("rotate y 10") must render the rotation,
+        #so it is placed in the same lane, behind the earlier call
+        last = getattr(self._producer, "last", None)
+        if last is not None and last[1] > priority and not last[0].done():
+            priority = last[1]
+        self._producer.last = (call[0], priority)
+        if self._polling:
+            self._q[priority].append(call)
+        else:
+            self._q.put((priority, next(self._seq), call))
+        self._stats.queued(self._depth())
+        #Render thread stopped? it will never process the call
+        #(checked after queuing, so a call is never missed by the final _cancel())
+        if self._closing:
+            self._cancel()
+
+    def _cancel(self):
+        #Cancel all calls still waiting in the render thread queue,
+        #so callers waiting on their results are released
+        while True:
+            try:
+                if self._polling:
+                    call = None
+                    for lane in self._q:
+                        if len(lane):
+                            call = lane.popleft()
+                            break
+                    else:
+                        break
+                else:
+                    priority, seq, call = self._q.get_nowait()
+            except (queue.Empty, IndexError):
+                break
+            if call is not None:
+                call[0].cancel()
+
+    def _depth(self):
+        #Number of calls waiting in the render thread queue
+        if not self._threaded:
+            return 0
+        if self._polling:
+            return sum([len(lane) for lane in self._q])
+        return self._q.qsize()
+
+    def _wake(self):
+        #Wake the render thread without queuing a call
+        if self._threaded and not self._polling:
+            self._q.put((PRIORITY_INTERACTIVE, next(self._seq), None))
+
+    def _events(self):
+        #Process interactive and timer events
+        self._queued()
+        if self.viewer.events():
+            t0 = time.time()
+            self.viewer.execute()
+            self._stats.frame(time.time() - t0)
+            self._modified()
+
+    def _thread_exec(self, call):
+        #Run a queued call in the render thread
+        future, method, args, kwargs, queued = call
+        #Skip if cancelled before it was processed
+        if not future.set_running_or_notify_cancel():
+            return
+        #print("CALLING:",method.__name__)
+        t0 = time.time()
+        try:
+            result = method(*args, **kwargs)
+        except BaseException as e:
+            #Pass the error back to the caller
+            future.set_exception(e)
+            #(KeyboardInterrupt, SystemExit... still stop the thread)
+            if not isinstance(e, Exception):
+                raise
+        else:
+            future.set_result(result)
+        finally:
+            self._stats.call(method.__name__, t0 - queued, time.time() - t0)
+            self._changed(method.__name__)
 
     def _thread_run(self):
         """
@@ -1991,39 +3280,51 @@ class _LavaVuThreadSafe(LavaVuPython.LavaVu):
         All OpenGL calls must be made from here
         """
         #self._kwargs["usequeue"] = True #Switch on command queuing
+        self._render_thread = threading.current_thread()
 
-        #Render event handling loop!
-        while not self._closing:
-            #Process interactive and timer events
-            if self.viewer.events():
-                self.viewer.execute()
-
-            #Process commands that must be run on the render thread
-            if len(self._q):
-                #if not self.app.viewer.isopen or not self.app.amodel:
-                #    print("NOT OPEN!")
-                #    print('deferring : ' + self.app._q[0])
-                method, wait_return, args, kwargs = self._q.popleft()
-                #If set, must return result and notify waiting thread with condition variable
-                if wait_return:
-                    #print("CALLING:",method.__name__)
-                    self._returned = method(*args, **kwargs)
-                    #Notify waiting thread result is ready
-                    with self._cv:
-                        self._cv.notify()
-                    #print("RETURNED:",type(self._returned))
+        try:
+            #Render event handling loop!
+            while not self._closing:
+                #Process interactive and timer events
+                self._events()
+
+                #Process commands that must be run on the render thread
+                if self._polling:
+                    #Polling mode, process one call per timer increment
+                    #from the highest priority lane with calls waiting
+                    for lane in self._q:
+                        if len(lane):
+                            self._thread_exec(lane.popleft())
+                            break
+                    time.sleep(TIMER_INC)
                 else:
-                    method(*args, **kwargs)
-                method = None
-
-            time.sleep(TIMER_INC)
-
-            #Detect window closed
-            if self.viewer.quitProgram:
-                if is_notebook():
-                    #Just hide the window
-                    self.viewer.hide()
-                    self.viewer.quitProgram = False
+                    #Wait for calls, waking immediately when one is submitted
+                    #only check events on the timer while a window is visible
+                    timeout = TIMER_INC if self.viewer.visible else TIMER_IDLE
+                    try:
+                        priority, seq, call = self._q.get(True, timeout)
+                        #Process all pending calls in priority order before checking events again,
+                        #except after a long running job, so interactive events are not held up
+                        while True:
+                            if call is not None:
+                                self._thread_exec(call)
+                                if priority == PRIORITY_BULK:
+                                    break
+                            priority, seq, call = self._q.get_nowait()
+                    except queue.Empty:
+                        pass
+
+                #Detect window closed
+                if self.viewer.quitProgram:
+                    if is_notebook():
+                        #Just hide the window
+                        self.viewer.hide()
+                        self.viewer.quitProgram = False
+        finally:
+            #Thread stopped, cancel any calls still queued
+            #(callers waiting on their results would otherwise hang)
+            self._closing = True
+            self._cancel()
 
 
 class Viewer(dict):
@@ -2131,6 +3432,11 @@ class Viewer(dict):
         self.app = None
         self._objects = _Objects(self)
         self.state = {}
+        self._version = (-1, -1)
+        self._batch = None
+        self._pending = {}
+        self._pendinglock = threading.Lock()
+        self._colours = {}
         self._managed = False
         self.server = None
         self._thread = None
@@ -2305,8 +3611,14 @@ class Viewer(dict):
         #Wait for the render thread to exit
         if self.port and self._thread:
             #print("---SHUTDOWN-THREAD")
-            self.app._closing = True
-            self._thread.join()
+            #(app is cleared once the render thread has exited,
+            # the thread cancels any calls still queued as it stops)
+            if self.app is not None:
+                self.app._closing = True
+                self.app._wake()
+            #(may be deleted by the render thread's own cleanup)
+            if self._thread is not threading.current_thread():
+                self._thread.join()
             self._thread = None
         #Wait for server thread to exit
         if self.server:
@@ -2445,10 +3757,13 @@ class Viewer(dict):
         #Set view/global property
         if not key in self.properties:
             raise ValueError(key + " : Invalid property name")
-        self.app.parseProperty(key + '=' + json.dumps(item))
-        self._get()
+        if self._batch is not None:
+            self._batch.property(None, key, json.dumps(item))
+        else:
+            self.app.parseProperty(key + '=' + json.dumps(item))
 
     def __contains__(self, key):
+        self._get()
         return key in self.state or key in self.state["properties"] or key in self.state["views"][0]
 
     def __repr__(self):
@@ -2465,7 +3780,7 @@ class Viewer(dict):
     def __str__(self):
         #View/global props to string
         self._get()
-        properties = self.state["properties"]
+        properties = dict(self.state["properties"])
         properties.update(self.state["views"][0])
         return str('\n'.join(['    %s=%s' % (k,json.dumps(v)) for k,v in properties.items()]))
 
@@ -2611,9 +3926,19 @@ class Viewer(dict):
         """
         self.timestep(value)
 
-    def _get(self):
+    def _get(self, force=False, data=True):
         #Import state from lavavu
+        #(skipped if the state version has not changed since last sync,
+        # pass data=False if object data labels are not required, then
+        # changes to the object data alone will not trigger a sync)
+        if self._batch is not None:
+            #Apply pending writes first so reads are consistent
+            self._batch.flush()
+        version = (self.app._version, self.app._dataversion)
+        if not force and version[0] == self._version[0] and (not data or version[1] == self._version[1]):
+            return
         self.state = _convert_keys(json.loads(self.app.getState()))
+        self._version = version
         self._objects._sync()
 
     def _set(self):
@@ -2622,6 +3947,57 @@ class Viewer(dict):
         #self.state["objects"] = [obj.dict for obj in self._objects.list]
         self.app.setState(json.dumps(self.state))
 
+    def _setobject(self, ref, properties):
+        #Set object properties, queued if a transaction is active
+        if self._batch is not None:
+            self._batch.object(ref, _convert_args(properties))
+        else:
+            self.app.setObject(ref, _convert_args(properties))
+
+    def batch(self):
+        """
+        Start a transaction, for use as a context manager
+
+        Property writes on the viewer and its objects, object setup and commands
+        issued inside the block are queued and applied together in a single call
+        on the render thread when the block exits, followed by a single state sync
+
+        Repeated writes to the same property are merged, only the last value is applied
+
+        Reading state inside the block applies any pending writes first
+
+        The transaction is only active inside the with block,
+        calling batch() alone has no effect
+
+        Returns
+        -------
+        batch : context manager
+            The transaction, or the active one if called inside a batch block
+
+        Example
+        -------
+        >>> import lavavu
+        >>> lv = lavavu.Viewer()
+        >>> pts = [lv.points(vertices=[[0,0,0], [1,1,1]]) for i in range(10)]
+        >>> with lv.batch():
+        ...     lv["background"] = "black"
+        ...     for p in pts:
+        ...         p["pointsize"] = 5
+        ...         p["colour"] = "red"
+
+        Calling batch() without a with block does not start a transaction
+
+        >>> import json
+        >>> tx = lv.batch()
+        >>> lv.commands('background blue')
+        >>> print(json.loads(lv.app.getState())["properties"]["background"])
+        rgba(0,0,255,1)
+        """
+        if self._batch is not None:
+            #Nested, joins the active transaction
+            return self._batch
+        return _Batch(self)
+
     def commands(self, cmds, queue=False):
         """
         Execute viewer commands
@@ -2640,8 +4016,19 @@ class Viewer(dict):
         if isinstance(cmds, list):
             cmds = '\n'.join(cmds)
 
+        #Filter range change on an indexed data set? skip if the same values are selected
+        if 'filtermin' in cmds or 'filtermax' in cmds:
+            if self._filterunchanged(cmds):
+                return
+
+        #Transaction active? queue for applying together
+        if self._batch is not None:
+            if cmds[0] == '{':
+                self._batch.state(cmds)
+            else:
+                self._batch.commands(cmds)
         #JSON state?
-        if cmds[0] == '{':
+        elif cmds[0] == '{':
             self.app.setState(cmds)
             #self.app.setState(str(cmds.decode('ascii')))
         elif queue or self.queue: #Thread safe queue requested
@@ -2650,6 +4037,30 @@ class Viewer(dict):
         else:
             self.app.commands(cmds)
 
+    def _filterunchanged(self, cmds):
+        #Check filter control commands: "select name; filtermin/filtermax index value"
+        lines = [line.strip() for line in cmds.split('\n')]
+        if len(lines) != 2 or not lines[0].startswith('select '):
+            return False
+        parts = lines[1].split()
+        if len(parts) != 3 or parts[0] not in ["filtermin", "filtermax"]:
+            return False
+        obj = self._objects.get(lines[0][7:].strip())
+        if obj is None or not obj._rangeindex:
+            return False
+        try:
+            index = int(parts[1])
+            value = float(parts[2])
+        except ValueError:
+            return False
+        minimum = value if parts[0] == "filtermin" else None
+        maximum = value if parts[0] == "filtermax" else None
+        if not obj._filterunchanged(index, minimum, maximum):
+            return False
+        #Keep the stored filter range up to date, without the redraw
+        obj._storefilter(index, minimum, maximum)
+        return True
+
     def help(self, cmd="", obj=None):
         """
         Get help on a command or property
@@ -2694,7 +4105,7 @@ class Viewer(dict):
         """
         self.commands(cmds)
 
-    def _setupobject(self, ref=None, **kwargs):
+    def _splitdata(self, kwargs):
         #Strip data keys from kwargs and put aside for loading
         datasets = {}
         cmapdata = None
@@ -2703,16 +4114,9 @@ class Viewer(dict):
                 datasets[key] = kwargs.pop(key, None)
             if key == "colourmap":
                 cmapdata = kwargs.pop(key, None)
+        return datasets, cmapdata
 
-        #Call function to add/setup the object, all other args passed to properties dict
-        if ref is None:
-            ref = self.app.createObject(_convert_args(kwargs))
-        else:
-            self.app.setObject(ref, _convert_args(kwargs))
-
-        #Get the created/updated object
-        obj = self.Object(ref)
-
+    def _loaddata(self, obj, datasets, cmapdata):
         #Read any property data sets (allows object creation and load with single prop dict)
         for key in datasets:
             #Get the load function matching the data set (eg: vertices() ) and call on data
@@ -2725,6 +4129,20 @@ class Viewer(dict):
         if cmapdata is not None:
             obj.colourmap(cmapdata)
 
+    def _setupobject(self, ref=None, **kwargs):
+        datasets, cmapdata = self._splitdata(kwargs)
+
+        #Call function to add/setup the object, all other args passed to properties dict
+        if ref is None:
+            ref = self.app.createObject(_convert_args(kwargs))
+        else:
+            self._setobject(ref, kwargs)
+
+        #Get the created/updated object
+        obj = self.Object(ref)
+
+        self._loaddata(obj, datasets, cmapdata)
+
         #Return wrapper obj
         return obj
 
@@ -2754,6 +4172,63 @@ class Viewer(dict):
         #Adds a new object, all other args passed to properties dict
         return self._setupobject(ref=None, **kwargs)
 
+    def add_many(self, specs):
+        """
+        Add a list of visualisation objects
+
+        All objects are created first and the object list is synced once,
+        then any data provided is loaded, avoiding a full state sync per object
+
+        Parameters
+        ----------
+        specs : list of dict
+            Properties for each object to create, as would be passed to add()
+            can include a name, geometry type and data sets
+            (vertices/normals/vectors/colours/indices/values/labels/texcoords)
+            If an object of a given name exists, it will be returned instead of created,
+            any data sets provided are loaded into the existing object
+
+        Returns
+        -------
+        objects : list of Object
+            The objects created, in the same order as the specs
+
+        Example
+        -------
+        >>> import lavavu
+        >>> lv = lavavu.Viewer()
+        >>> objs = lv.add_many([{"geometry" : "points", "vertices" : [[0,0,0], [1,1,1]]},
+        ...                     {"name" : "tris", "geometry" : "triangles", "colour" : "red"}])
+        >>> print(objs[1].name)
+        tris
+        """
+        self._get()
+        pending = []
+        for spec in specs:
+            kwargs = dict(spec)
+            name = kwargs.get("name")
+            if not name and "geometry" in kwargs:
+                #Set name to typename if none provided, as for _addtype()
+                self._ctr += 1
+                name = kwargs["name"] = kwargs["geometry"] + str(self._ctr)
+            datasets, cmapdata = self._splitdata(kwargs)
+            if name and name in self._objects:
+                print("Object exists: " + name)
+                pending.append((name, datasets, cmapdata))
+                continue
+            ref = self.app.createObject(_convert_args(kwargs))
+            pending.append((ref.name(), datasets, cmapdata))
+
+        #Single sync for all created objects
+        self._get()
+
+        objects = []
+        for name, datasets, cmapdata in pending:
+            obj = self._objects[name]
+            self._loaddata(obj, datasets, cmapdata)
+            objects.append(obj)
+        return objects
+
     #Shortcut for adding specific geometry types
     def _addtype(self, typename, name=None, **kwargs):
         #Set name to typename if none provided
@@ -2791,10 +4266,7 @@ class Viewer(dict):
             print("WARNING: No objects exist!")
         #If name passed, find this object in updated list, if not just use the last
         elif isinstance(identifier, str):
-            for obj in self._objects.list:
-                if obj.name == identifier:
-                    o = obj
-                    break
+            o = self._objects.get(identifier)
             #Not found? Create
             if not o:
                 return self.add(identifier, **kwargs)
@@ -2804,18 +4276,15 @@ class Viewer(dict):
                 o = self._objects.list[identifier-1]
         elif isinstance(identifier, LavaVuPython.DrawingObject):
             #Lookup by swig wrapped object
-            for obj in self._objects.list:
-                #Can't compare swig wrapper objects directly,
-                #so use the name
-                if obj.name == identifier.name():
-                    o = obj
-                    break
+            #Can't compare swig wrapper objects directly,
+            #so use the name
+            o = self._objects.get(identifier.name())
         else:
             #Last resort: last object in list
             o = self._objects.list[-1]
 
         if o is not None:
-            self.app.setObject(o.ref, _convert_args(kwargs))
+            self._setobject(o.ref, kwargs)
             return o
         print("WARNING: Object not found and could not be created: ",identifier)
         return None
@@ -3133,7 +4602,7 @@ class Viewer(dict):
         #Update figure
         self.savefigure()
 
-    def image(self, filename="", resolution=None, transparent=False, quality=95):
+    def image(self, filename="", resolution=None, transparent=False, quality=95, wait=True):
         """
         Save or get an image of current display
 
@@ -3148,17 +4617,22 @@ class Viewer(dict):
             Creates a PNG image with a transparent background
         quality : int
             Quality for JPEG image compression, default 95%
+        wait : boolean
+            Wait for the image, if False returns a Future immediately
 
         Returns
         -------
         image : str
             filename of saved image or encoded image as string data
+            (or a concurrent.futures.Future holding it if wait=False)
         """
         if resolution is None:
-            return self.app.image(filename, 0, 0, quality, transparent)
-        return self.app.image(filename, resolution[0], resolution[1], quality, transparent)
+            resolution = (0, 0)
+        if wait:
+            return self.app.image(filename, resolution[0], resolution[1], quality, transparent)
+        return self.app.submit("image", filename, resolution[0], resolution[1], quality, transparent)
 
-    def frame(self, resolution=None, quality=90):
+    def frame(self, resolution=None, quality=90, wait=True):
         """
         Get an image frame, returns current display as base64 encoded jpeg data url
 
@@ -3168,17 +4642,20 @@ class Viewer(dict):
             Image resolution in pixels [x,y]
         quality : int
             Quality for JPEG image compression, default 90%
+        wait : boolean
+            Wait for the image, if False returns a Future immediately
 
         Returns
         -------
         image : str
             encoded image as string data
+            (or a concurrent.futures.Future holding it if wait=False)
         """
         #Jpeg encoded frame data
         if not resolution: resolution = self.resolution
-        return self.app.image("", resolution[0], resolution[1], quality)
+        return self.image("", resolution, quality=quality, wait=wait)
 
-    def jpeg(self, resolution=None, quality=90):
+    def jpeg(self, resolution=None, quality=90, wait=True):
         """
         Get an image frame, returns current display as JPEG data in a bytearray
 
@@ -3188,17 +4665,22 @@ class Viewer(dict):
             Image resolution in pixels [x,y]
         quality : int
             Quality for JPEG image compression, default 90%
+        wait : boolean
+            Wait for the image, if False returns a Future immediately
 
         Returns
         -------
         image : bytearray
             encoded image as byte array
+            (or a concurrent.futures.Future holding it if wait=False)
         """
         #Jpeg encoded frame data
         if not resolution: resolution = self.resolution
-        return bytearray(self.app.imageJPEG(resolution[0], resolution[1], quality))
+        if wait:
+            return bytearray(self.app.imageJPEG(resolution[0], resolution[1], quality))
+        return _then(self.app.submit("imageJPEG", resolution[0], resolution[1], quality), bytearray)
 
-    def png(self, resolution=None):
+    def png(self, resolution=None, wait=True):
         """
         Get an image frame, returns current display as PNG data in a bytearray
 
@@ -3206,15 +4688,219 @@ class Viewer(dict):
         ----------
         resolution : list or tuple
             Image resolution in pixels [x,y]
+        wait : boolean
+            Wait for the image, if False returns a Future immediately
 
         Returns
         -------
         image : bytearray
             encoded image as byte array
+            (or a concurrent.futures.Future holding it if wait=False)
         """
         #PNG encoded frame data
         if not resolution: resolution = self.resolution
-        return bytearray(self.app.imagePNG(resolution[0], resolution[1]))
+        if wait:
+            return bytearray(self.app.imagePNG(resolution[0], resolution[1]))
+        return _then(self.app.submit("imagePNG", resolution[0], resolution[1]), bytearray)
+
+    def stats(self, reset=False, log=None):
+        """
+        Get render thread timing statistics
+
+        Records the time each call spends waiting in the render thread queue
+        and executing, by method name (image, imageJPEG, parseCommands, loadFile...),
+        the current and peak queue depth and the time spent rendering frames
+        in the event loop. Times are in milliseconds, histograms count calls
+        within each of the "buckets" upper bounds, plus one for anything above.
+        Also counts data loads ("ingest") and how many needed the source data copied.
+
+        Parameters
+        ----------
+        reset : boolean
+            Clear the statistics after returning them
+        log : float
+            Print a summary of the statistics every log seconds, pass 0 to stop logging
+
+        Returns
+        -------
+        stats : dict
+            The statistics recorded since the viewer was created or last reset
+        """
+        app = self.app
+        result = app._stats.get(app._depth())
+        if reset:
+            app._stats.reset()
+        if log is not None:
+            self._stats_log(log)
+        return result
+
+    def _stats_log(self, interval):
+        #Start or stop the periodic statistics logging thread
+        self._logstats = interval
+        if not interval or getattr(self, "_logthread", None):
+            return
+        vref = weakref.ref(self)
+        def logger():
+            while True:
+                viewer = vref()
+                if viewer is None or not viewer._logstats or viewer.app is None:
+                    break
+                print(viewer.app._stats.summary(viewer.app._depth()))
+                interval = viewer._logstats
+                viewer = None
+                time.sleep(interval)
+            v = vref()
+            if v is not None:
+                v._logthread = None
+        self._logthread = threading.Thread(target=logger)
+        self._logthread.daemon = True
+        self._logthread.start()
+
+    def _awaitable(self, key, future, cancel_stale):
+        """
+        Wrap a render thread Future for awaiting in the running asyncio event loop
+
+        If cancel_stale is set, any earlier request of the same kind made with
+        the same cancel_stale value that has not yet been processed is cancelled,
+        only the latest result is rendered. Pass a client identifier rather than
+        True to only cancel requests from that client
+        """
+        import asyncio
+        if cancel_stale is not False and cancel_stale is not None:
+            key = (key, cancel_stale)
+            #Done callbacks run in the render thread
+            with self._pendinglock:
+                stale = self._pending.get(key)
+                self._pending[key] = future
+            if stale is not None:
+                stale.cancel()
+            def done(f):
+                with self._pendinglock:
+                    if self._pending.get(key) is f:
+                        del self._pending[key]
+            future.add_done_callback(done)
+        return asyncio.wrap_future(future)
+
+    def aimage(self, filename="", resolution=None, transparent=False, quality=95, cancel_stale=False):
+        """
+        Save or get an image of current display without blocking the asyncio event loop,
+        usage: data = await lv.aimage()
+
+        Parameters
+        ----------
+        filename : str
+            Name of the file to save (should be .jpg or .png),
+            if not provided the image will be returned as a base64 encoded data url
+        resolution : list or tuple
+            Image resolution in pixels [x,y]
+        transparent : boolean
+            Creates a PNG image with a transparent background
+        quality : int
+            Quality for JPEG image compression, default 95%
+        cancel_stale : boolean or hashable
+            Cancel any earlier aimage() request with the same cancel_stale value
+            that has not yet been rendered, pass a client id to only cancel that client's requests
+
+        Returns
+        -------
+        image : asyncio.Future
+            awaitable returning filename of saved image or encoded image as string data
+        """
+        future = self.image(filename, resolution, transparent, quality, wait=False)
+        return self._awaitable("image", future, cancel_stale)
+
+    def aframe(self, resolution=None, quality=90, cancel_stale=False):
+        """
+        Get an image frame without blocking the asyncio event loop,
+        usage: data = await lv.aframe()
+
+        Parameters
+        ----------
+        resolution : list or tuple
+            Image resolution in pixels [x,y]
+        quality : int
+            Quality for JPEG image compression, default 90%
+        cancel_stale : boolean or hashable
+            Cancel any earlier aframe() request with the same cancel_stale value
+            that has not yet been rendered, so a slow consumer only receives the latest frame,
+            pass a client id to only cancel that client's requests
+
+        Returns
+        -------
+        image : asyncio.Future
+            awaitable returning encoded image as string data
+        """
+        future = self.frame(resolution, quality, wait=False)
+        return self._awaitable("frame", future, cancel_stale)
+
+    def ajpeg(self, resolution=None, quality=90, cancel_stale=False):
+        """
+        Get an image frame as JPEG data in a bytearray without blocking the asyncio event loop,
+        usage: data = await lv.ajpeg()
+
+        Parameters
+        ----------
+        resolution : list or tuple
+            Image resolution in pixels [x,y]
+        quality : int
+            Quality for JPEG image compression, default 90%
+        cancel_stale : boolean or hashable
+            Cancel any earlier ajpeg() request with the same cancel_stale value
+            that has not yet been rendered, pass a client id to only cancel that client's requests
+
+        Returns
+        -------
+        image : asyncio.Future
+            awaitable returning encoded image as byte array
+        """
+        future = self.jpeg(resolution, quality, wait=False)
+        return self._awaitable("jpeg", future, cancel_stale)
+
+    def apng(self, resolution=None, cancel_stale=False):
+        """
+        Get an image frame as PNG data in a bytearray without blocking the asyncio event loop,
+        usage: data = await lv.apng()
+
+        Parameters
+        ----------
+        resolution : list or tuple
+            Image resolution in pixels [x,y]
+        cancel_stale : boolean or hashable
+            Cancel any earlier apng() request with the same cancel_stale value
+            that has not yet been rendered, pass a client id to only cancel that client's requests
+
+        Returns
+        -------
+        image : asyncio.Future
+            awaitable returning encoded image as byte array
+        """
+        future = self.png(resolution, wait=False)
+        return self._awaitable("png", future, cancel_stale)
+
+    def acommands(self, cmds):
+        """
+        Execute viewer commands without blocking the asyncio event loop,
+        usage: await lv.acommands("rotate y 10")
+
+        Parameters
+        ----------
+        cmds : list or str
+            Command(s) to execute
+
+        Returns
+        -------
+        result : asyncio.Future
+            awaitable completed when the commands have been processed
+        """
+        if isinstance(cmds, list):
+            cmds = '\n'.join(cmds)
+        elif ';' in cmds:
+            cmds = cmds.replace(';', '\n')
+        if len(cmds) and cmds[0] == '{':
+            future = self.app.submit("setState", cmds)
+        else:
+            future = self.app.submit("parseCommands", cmds)
+        return self._awaitable("commands", future, False)
 
     def display(self, resolution=(0,0), transparent=False):
         """        
@@ -3773,19 +5459,64 @@ class Viewer(dict):
             the bounding box of the combined data
         """
         #Get vertices from a list of lavavu objects
-        pverts = None
         bb_all = [[float('Inf'), float('Inf'), float('Inf')], [float('-Inf'), float('-Inf'), float('-Inf')]]
         for o in objectlist:
-            #Concatenate all elements
+            #Bounds over all timesteps, consistent when extracting at each step
             bb = self.objects[o].boundingbox(True)
             for i in range(3):
                 if bb[0][i] < bb_all[0][i]: bb_all[0][i] = bb[0][i]
                 if bb[1][i] > bb_all[1][i]: bb_all[1][i] = bb[1][i]
 
-            for v in self.objects[o].data.vertices:
-                v = v.reshape((-1,3))
-                pverts = v if pverts is None else numpy.concatenate([pverts, v])
-        return pverts, bb_all
+        #Concatenate all elements
+        pverts = self.concat(objectlist, "vertices")[0]
+        return (pverts if len(pverts) else None), bb_all
+
+    def concat(self, objects=None, typename="vertices"):
+        """
+        Join a data type from all elements of a list of objects into a single array
+
+        The output is allocated once and filled in a single pass,
+        offset tables locate the data of each element and object
+
+        Parameters
+        ----------
+        objects : list
+            List of objects or object names, default is all objects
+        typename : str
+            Type of data to be retrieved
+            (vertices/normals/vectors/indices/colours/texcoords/luminance/rgb/values or value label)
+
+        Returns
+        -------
+        data : array
+            The joined data, with shape (N, 3) for vertices/normals/vectors,
+            (N, 2) for texcoords, otherwise (N,)
+        offsets : array
+            Row offsets of each element, element i is data[offsets[i]:offsets[i+1]]
+        objoffsets : array
+            Row offsets of each object, object j is data[objoffsets[j]:objoffsets[j+1]]
+
+        Example
+        -------
+        >>> import lavavu
+        >>> lv = lavavu.Viewer()
+        >>> a = lv.points(vertices=[[0,0,0], [1,1,1]])
+        >>> b = lv.points(vertices=[[2,2,2]])
+        >>> data, offsets, objoffsets = lv.concat([a, b])
+        >>> print(data.shape, offsets, objoffsets)
+        (3, 3) [0 2 3] [0 2 3]
+
+        Elements without the data are included with no rows
+
+        >>> a.values([1,2], "temperature")
+        >>> data, offsets, objoffsets = lv.concat([a, b], "temperature")
+        >>> print(data, offsets, objoffsets)
+        [1. 2.] [0 2 2] [0 2 2]
+        """
+        if objects is None:
+            objects = self.objects.list
+        objects = [o if isinstance(o, Object) else self.objects[o] for o in objects]
+        return _concat([o.data for o in objects], typename)
 
     def parse_colour(self, colour):
         """
@@ -3816,6 +5547,53 @@ class Viewer(dict):
         self.app.colourArrayFloat(colour, array)
         return array
 
+    def parse_colours(self, colours):
+        """
+        Parse a list of colour strings and return a numpy array of packed RGBA colours
+
+        Each unique colour string is parsed only once, parsed colours are
+        cached so repeated names (eg: categorical colours) are just looked up
+
+        Parameters
+        ----------
+        colours : str or list or array
+            Colour strings, accepts html formats and X11 colour names or JSON string RGBA arrays,
+            a single string is split on whitespace
+
+        Returns
+        -------
+        colours : array
+            the colour data as 4 byte RGBA uint32 array, the same shape as the colours provided
+
+        Example
+        -------
+        Parse some colour strings
+
+        >>> import lavavu
+        >>> lv = lavavu.Viewer()
+        >>> lv.parse_colours(['red', 'blue', 'red'])
+        array([4278190335, 4294901760, 4278190335], dtype=uint32)
+        """
+        if isinstance(colours, str):
+            colours = colours.split()
+        colours = numpy.asarray(colours)
+        if colours.size == 0:
+            return numpy.zeros(colours.shape, dtype=numpy.uint32)
+        #Map all entries to their unique colour strings in one pass
+        unique, inverse = numpy.unique(colours.ravel(), return_inverse=True)
+        table = numpy.empty(len(unique), dtype=numpy.uint32)
+        if len(self._colours) > 65536:
+            self._colours = {}
+        for i in range(len(unique)):
+            key = str(unique[i])
+            packed = self._colours.get(key)
+            if packed is None:
+                rgba = numpy.clip(numpy.rint(self.parse_colour(key) * 255.0), 0, 255).astype(numpy.uint32)
+                packed = rgba[0] | (rgba[1] << 8) | (rgba[2] << 16) | (rgba[3] << 24)
+                self._colours[key] = packed
+            table[i] = packed
+        return table[inverse].reshape(colours.shape)
+
 #Wrapper for list of geomdata objects
 class Geometry(list):
     """  
@@ -3908,32 +5686,57 @@ class Geometry(list):
         else:
             glist = self.obj.parent.app.getGeometryAt(self.obj.ref, timestep)
         sets = self.obj.datasets
+        labels = list(sets.keys())
         for g in glist:
             #By default all elements are returned, even if object has multiple types 
             #Filter can be set to a type name to exclude other geometry types
             if filter is None or g.type == self.obj.parent._getRendererType(filter):
-                g = DrawData(g, obj)
-                self.append(g)
-                #Add the value data set labels
-                for s in sets:
-                    g.available[s] = g.get(s).shape
-
-        #Allows getting data by data type or value labels using Descriptors
-        #Data by type name
-        for key in datatypes:
-            typename = key
-            if key == 'values':
-                #Just use the first available value label as the default .values descriptor
-                if len(sets) == 0: continue
-                typename = list(sets.keys())[0]
-            #Access by type name to get a view
-            setattr(Geometry, key, _GeomDataListView(self.obj, self.timestep, typename))
+                #(data is not retrieved until accessed)
+                self.append(DrawData(g, obj, labels))
+
+        #Allows getting data by data type or value labels using Descriptors,
+        #these are created on first access and bound to this instance only
+        self._labels = labels
+        self._views = {}
+
+    def _view(self, key):
+        #Get the descriptor for a data type or label, None if not a data name
+        if key in self._views:
+            return self._views[key]
+        copy = False
+        typename = key
+        if key.endswith('_copy') and key[:-5] in datatypes:
             #Access by type name + _copy to get a copy
-            setattr(Geometry, key + '_copy', _GeomDataListView(self.obj, self.timestep, typename, copy=True))
+            typename = key[:-5]
+            copy = True
+        if typename == 'values':
+            #Just use the first available value label as the default .values descriptor
+            if len(self._labels) == 0: return None
+            typename = self._labels[0]
+        elif not typename in datatypes and not typename in self._labels:
+            return None
+        self._views[key] = _GeomDataListView(self.obj, self.timestep, typename, copy=copy)
+        return self._views[key]
+
+    def __getattr__(self, key):
+        #Only called when not a normal attribute, look up data by type name or label
+        view = self._view(key) if '_views' in self.__dict__ else None
+        if view is None:
+            raise AttributeError(key)
+        return view.__get__(self, type(self))
+
+    def __setattr__(self, key, value):
+        view = self._view(key) if '_views' in self.__dict__ else None
+        if view is None:
+            super(Geometry, self).__setattr__(key, value)
+        else:
+            view.__set__(self, value)
 
-        #Data by label
-        for key in sets:
-            setattr(Geometry, key, _GeomDataListView(self.obj, self.timestep, key))
+    def __dir__(self):
+        names = dir(type(self)) + list(self.__dict__.keys())
+        names += [key for key in datatypes if key != 'values' or len(self._labels)]
+        names += [key + '_copy' for key in datatypes if key != 'values' or len(self._labels)]
+        return sorted(set(names + self._labels))
 
     def __getitem__(self, key):
         if isinstance(key, str):
@@ -3959,6 +5762,172 @@ class Geometry(list):
         #For backwards compatibility with old Viewer.data() method (now a property)
         return self
 
+    def timeseries(self, label="default", steps=None, indices=None, database=None, threads=None):
+        """
+        Extract a value data set across multiple timesteps
+
+        The data is read directly from each timestep's stored records
+        into a single array, the current timestep is not changed
+
+        Parameters
+        ----------
+        label : str
+            Data label of the values to extract, default="default"
+        steps : list or range
+            Timestep indices to extract, default is all timesteps
+        indices : list or array
+            Indices of the values to extract at each step, default is all values,
+            required if the number of values changes between timesteps
+        database : str
+            Read the records from this GLDB database file instead of the loaded data,
+            allows extracting data from timesteps that have not been loaded/cached
+        threads : int
+            Number of threads used to decompress database records, default is 1
+
+        Returns
+        -------
+        data : array
+            float32 array of shape (steps, values)
+
+        Example
+        -------
+        >>> import lavavu
+        >>> lv = lavavu.Viewer()
+        >>> obj = lv.points()
+        >>> for t in range(3):
+        ...     lv.addstep()
+        ...     obj.vertices([[0,0], [1,1]])
+        ...     obj.values([t, t*2], "temperature")
+        >>> print(obj.data.timeseries("temperature"))
+        [[0. 0.]
+         [1. 2.]
+         [2. 4.]]
+        """
+        if indices is not None:
+            indices = numpy.asarray(indices, dtype=numpy.int64)
+        source = _GLDBRecords(database, self.obj.name, label) if database else None
+        if steps is None:
+            steps = range(len(source.steps) if source else len(self.obj.parent.steps))
+        steps = list(steps)
+
+        try:
+            if source:
+                stepvalues = source.values(steps, threads)
+            else:
+                stepvalues = (self._stepvalues(label, step) for step in steps)
+            out = numpy.zeros(shape=(len(steps), 0), dtype=numpy.float32)
+            for t, values in enumerate(stepvalues):
+                if indices is not None:
+                    values = values[indices]
+                #Allocate the output when the first step size is known
+                if t == 0:
+                    out = numpy.empty(shape=(len(steps), values.size), dtype=numpy.float32)
+                elif values.size != out.shape[1]:
+                    raise ValueError("Number of values at step %d (%d) differs from first step (%d), use indices to select values" % (steps[t], values.size, out.shape[1]))
+                out[t] = values
+            return out
+        finally:
+            if source:
+                source.close()
+
+    def concat(self, typename="vertices"):
+        """
+        Join a data type from all elements into a single array
+
+        The output is allocated once and filled in a single pass,
+        index data is not adjusted to reference the joined vertices
+
+        Parameters
+        ----------
+        typename : str
+            Type of data to be retrieved
+            (vertices/normals/vectors/indices/colours/texcoords/luminance/rgb/values or value label)
+
+        Returns
+        -------
+        data : array
+            The joined data, with shape (N, 3) for vertices/normals/vectors,
+            (N, 2) for texcoords, otherwise (N,)
+        offsets : array
+            Row offsets of each element, element i is data[offsets[i]:offsets[i+1]]
+        """
+        return _concat([self], typename)[:2]
+
+    def _stepvalues(self, label, step):
+        #Values from the loaded records at a timestep, joined if more than one
+        app = self.obj.parent.app
+        arrays = [app.geometryArrayViewFloat(g, label) for g in app.getGeometryAt(self.obj.ref, step)]
+        return _GLDBRecords.join([a for a in arrays if a.size])
+
+class _GLDBRecords(object):
+    """
+    Reads the value records of an object directly from a GLDB database
+    """
+    #Data types of legacy value records without a label
+    legacy = {3 : "values", 4 : "opacities", 5 : "red", 6 : "green", 7 : "blue",
+              9 : "widths", 10 : "heights", 11 : "lengths", 14 : "sizes", 17 : "values"}
+
+    def __init__(self, filename, name, label):
+        import sqlite3
+        if not os.path.exists(filename):
+            raise IOError("Database not found: " + filename)
+        self.db = sqlite3.connect(filename)
+        row = self.db.execute("SELECT id FROM object WHERE name=?", (name,)).fetchone()
+        if row is None:
+            self.close()
+            raise KeyError("Object not found in database: " + name)
+        self.object_id = row[0]
+        self.steps = [r[0] for r in self.db.execute("SELECT id FROM timestep ORDER BY id")]
+        types = [t for t in self.legacy if self.legacy[t] == label]
+        self.query = "SELECT count, data FROM geometry WHERE object_id=? AND timestep=? AND (units=?"
+        if len(types):
+            self.query += " OR ((units IS NULL OR units='') AND data_type IN (%s))" % ','.join([str(t) for t in types])
+        self.query += ") ORDER BY id"
+        self.label = label
+
+    def read(self, step):
+        #Compressed records for a timestep index, (count, blob) tuples
+        return self.db.execute(self.query, (self.object_id, self.steps[step], self.label)).fetchall()
+
+    def values(self, steps, threads=None):
+        #Generator for the values at each step,
+        #decompression can run on a thread pool (zlib releases the GIL)
+        if not threads or threads < 2:
+            for step in steps:
+                yield self.decode(self.read(step))
+            return
+        #Work through the steps in batches to limit the compressed data held at once
+        pool = ThreadPoolExecutor(max_workers=threads)
+        try:
+            batch = 2 * threads
+            for b in range(0, len(steps), batch):
+                records = [self.read(step) for step in steps[b:b+batch]]
+                for values in pool.map(self.decode, records):
+                    yield values
+        finally:
+            pool.shutdown()
+
+    @staticmethod
+    def decode(records):
+        #Decompress and join the records of a step
+        arrays = []
+        for count, blob in records:
+            if len(blob) != count * 4:
+                blob = zlib.decompress(blob)
+            arrays.append(numpy.frombuffer(blob, dtype=numpy.float32))
+        return _GLDBRecords.join(arrays)
+
+    @staticmethod
+    def join(arrays):
+        if len(arrays) == 1:
+            return arrays[0]
+        if len(arrays) == 0:
+            return numpy.zeros(0, dtype=numpy.float32)
+        return numpy.concatenate(arrays)
+
+    def close(self):
+        self.db.close()
+
 class _GeomDataListView(object):
     """A descriptor that provides view/copy/set access to a DrawData list"""
     def __init__(self, obj, timestep, key, copy=False):
@@ -4048,21 +6017,51 @@ class DrawData(object):
     [array([4., 5.], dtype=float32)]
 
     """
-    def __init__(self, data, obj):
+    def __init__(self, data, obj, labels=None):
         self.data = data
         self._obj = obj
         self._parent = weakref.ref(obj.parent)
-        self.available = {}
-        #Get available data types
-        for key in datatypes:
-            dat = self.get(key)
-            if len(dat):
-                self.available[key] = dat.shape
+        #Value data set labels, listed in available data
+        self._labels = labels if labels is not None else list(obj.datasets.keys())
+        #Array views are retrieved on first access and cached until data is modified
+        self._views = {}
+        self._available = None
+        self._version = None
 
     @property
     def parent(self):
         return self._parent()
 
+    def _cached(self):
+        #Clear the cached views if any object data has been loaded or changed since retrieved,
+        #or the state has changed (timestep changes, file loads and clearing can free the data)
+        app = self.parent.app
+        version = (app._version, app._dataversion)
+        if version != self._version:
+            self._views = {}
+            self._available = None
+            self._version = version
+        return self._views
+
+    @property
+    def available(self):
+        """
+        Dictionary of the data types and value labels in this element
+        and the shape of their data
+        """
+        self._cached()
+        if self._available is None:
+            #(only the data sizes are needed, views are not created or cached)
+            available = {}
+            for key in datatypes:
+                size = self._raw(key).size
+                if size:
+                    available[key] = self._shape(key, size)
+            for label in self._labels:
+                available[label] = self._shape(label, self._raw(label).size)
+            self._available = available
+        return self._available
+
     @property
     def type(self):
         return geomnames[self.data.type]
@@ -4071,10 +6070,9 @@ class DrawData(object):
         #Allows getting data by data type or value labels using Descriptors
         if attr == 'values':
             #Just use the first available value label as the default .values descriptor
-            sets = self._obj.datasets
-            if len(sets) == 0:
+            if len(self._labels) == 0:
                 raise AttributeError(attr)
-            attr = list(sets.keys())[0]
+            attr = self._labels[0]
 
         if attr in datatypes:
             # Fetch a data type here and return it (by reference)
@@ -4102,45 +6100,105 @@ class DrawData(object):
         -------
         data : array
             Numpy array view of the data set requested
-        """
-        array = None
-        #Attempt to return an array with the correct shape
-        if not "dims" in self._obj and self.data.width*self.data.height*self.data.depth > 1:
-            self._obj["dims"] = [self.data.width, self.data.height, self.data.depth]
-        dims = self._obj["dims"]
 
+        Example
+        -------
+        Indices are stored as uint8, uint16 or uint32 depending on the largest
+        index in each element, but are always retrieved as uint32
+
+        >>> import lavavu
+        >>> lv = lavavu.Viewer()
+        >>> tris = lv.triangles(vertices=[[0,0,0], [1,0,0], [0,1,0], [1,1,0]])
+        >>> tris.indices([0,1,2, 1,3,2])
+        >>> print(tris.data[0]._raw("indices").dtype)
+        uint8
+        >>> print(tris.data[0].get("indices"))
+        [0 1 2 1 3 2]
+        >>> print(tris.data[0].get("indices").dtype)
+        uint32
+
+        Values of objects with the "precision" property set are stored as
+        float16 or quantized16 uint16 data, but are always retrieved as float32
+
+        >>> pts = lv.points(vertices=[[0,0,0], [1,1,1]], precision="float16")
+        >>> pts.values([0.1, 2.5], "vals")
+        >>> print(pts.data[0]._raw("vals").dtype)
+        uint16
+        >>> print(pts.data[0].get("vals"))
+        [0.09997559 2.5       ]
+        """
+        views = self._cached()
+        if not typename in views:
+            views[typename] = self._view(typename)
+        return views[typename]
+
+    def _raw(self, typename):
+        #Retrieve a flat view of a data element from the viewer
         if typename in datatypes and typename != 'values':
-            dims += [dimensions[typename]]
             if typename in ["luminance", "rgb"]:
                 #Get uint8 data
-                array = self.parent.app.geometryArrayViewUChar(self.data, datatypes[typename])
-            elif typename in ["indices", "colours"]:
+                return self.parent.app.geometryArrayViewUChar(self.data, datatypes[typename])
+            elif typename == "indices":
+                #Get uint32/uint16/uint8 data, indices are stored at the
+                #smallest width that holds the largest index in this element
+                app = self.parent.app
+                for view in [app.geometryArrayViewUInt, app.geometryArrayViewUShort, app.geometryArrayViewUChar]:
+                    array = view(self.data, datatypes[typename])
+                    if array.size:
+                        break
+                return array
+            elif typename == "colours":
                 #Get uint32 data
-                array = self.parent.app.geometryArrayViewUInt(self.data, datatypes[typename])
-            else:
-                #Get float32 data
-                array = self.parent.app.geometryArrayViewFloat(self.data, datatypes[typename])
-        else:
+                return self.parent.app.geometryArrayViewUInt(self.data, datatypes[typename])
             #Get float32 data
-            array = self.parent.app.geometryArrayViewFloat(self.data, typename)
+            return self.parent.app.geometryArrayViewFloat(self.data, datatypes[typename])
+        #Get float32 data, or the packed uint16 data of values stored
+        #at reduced precision (see the "precision" property)
+        app = self.parent.app
+        array = app.geometryArrayViewFloat(self.data, typename)
+        if not array.size and app.geometryPrecision(self.data, typename)[0] > 0:
+            return app.geometryArrayViewUShort(self.data, typename)
+        return array
 
-        if array.size > 0:
+    def _shape(self, typename, size):
+        #Attempt to find the correct shape for a data element of this size
+        if not "dims" in self._obj and self.data.width*self.data.height*self.data.depth > 1:
+            self._obj["dims"] = [self.data.width, self.data.height, self.data.depth]
+        dims = list(self._obj["dims"])
+        if typename in datatypes and typename != 'values':
+            dims += [dimensions[typename]]
+
+        if size > 0:
             #Remove any dims <= 1
             dims = [d for d in dims if d > 1]
 
             if len(dims):
                 #Shape the array to match object dims, and data element dims as final dimension
                 length = int(numpy.prod(dims))
-                #print(typename,"DIMS:",dims,"SIZE:",array.size, length)
-                if length == array.size:
+                #print(typename,"DIMS:",dims,"SIZE:",size, length)
+                if length == size:
                     #Need to reverse dims for numpy shape
-                    shape = dims[::-1]
-                    array = array.reshape(shape)
-                elif array.shape[0] == array.size and dims[-1] <= 3:
-                    array = array.reshape((-1, dims[-1]))
-                #print(typename,"DIMS:",dims,"SHAPE:",array.shape)
-        
-        return array
+                    return tuple(dims[::-1])
+                elif dims[-1] <= 3 and size % dims[-1] == 0:
+                    return (size // dims[-1], dims[-1])
+        return (size,)
+
+    def _view(self, typename):
+        #Retrieve a view of a data element from the viewer, with the correct shape
+        array = self._raw(typename)
+        if typename == "indices" and array.dtype != numpy.uint32:
+            #Widen compact indices, always returned as uint32
+            array = array.astype(numpy.uint32)
+        elif array.dtype == numpy.uint16:
+            #Decode reduced precision values, always returned as float32
+            precision, scale, offset = self.parent.app.geometryPrecision(self.data, typename)
+            if precision == 1:
+                array = array.view(numpy.float16).astype(numpy.float32)
+            else:
+                codes = array
+                array = (codes * numpy.float32(scale) + numpy.float32(offset)).astype(numpy.float32)
+                array[codes == 65535] = numpy.nan
+        return array.reshape(self._shape(typename, array.size))
 
     def copy(self, typename):
         """
@@ -4164,7 +6222,7 @@ class DrawData(object):
         #to the data no matter what viewer does with it
         return numpy.copy(self.get(typename))
 
-    def set(self, typename, array):
+    def set(self, typename, array, offset=None):
         """
         Set a data element in geometry data
 
@@ -4175,14 +6233,22 @@ class DrawData(object):
             (vertices/normals/vectors/indices/colours/texcoords/luminance/rgb/values)
         array : array
             Numpy array holding the data to be written
+        offset : int
+            Replace existing data starting at this item (eg: vertex index) with the
+            provided array instead of replacing the whole data set, see update_range()
         """
+        if offset is not None:
+            array = numpy.asarray(array)
+            width = dimensions.get(typename, 1)
+            count = array.size // width if width > 1 else array.size
+            return self.update_range(typename, offset, offset + count, array)
 
         #Convert to numpy
         array = self._obj._convert(array)
 
         #Attempt to set the dims based on the provided array shape
         if "dims" in self._obj and len(array.shape) > 0:
-            dims = self._obj["dims"]
+            dims = list(self._obj["dims"])
             #Need to reverse dims from numpy shape
             newdims = array.shape[::-1]
             length = numpy.prod(dims)
@@ -4203,19 +6269,88 @@ class DrawData(object):
                 self.data.height = newdims[1]
                 self.data.depth = newdims[2]
 
+        #(arrays already of the required type are not copied, indices
+        # are packed into uint8/uint16 storage when the largest index fits)
         if typename in datatypes and typename != 'values':
             if typename in ["luminance", "rgb"]:
                 #Set uint8 data
-                self.parent.app.geometryArrayUChar(self.data, array.astype(numpy.uint8).ravel(), datatypes[typename])
+                self.parent.app.geometryArrayUChar(self.data, array.astype(numpy.uint8, copy=False).ravel(), datatypes[typename])
             elif typename in ["indices", "colours"]:
                 #Set uint32 data
-                self.parent.app.geometryArrayUInt(self.data, array.astype(numpy.uint32).ravel(), datatypes[typename])
+                self.parent.app.geometryArrayUInt(self.data, array.astype(numpy.uint32, copy=False).ravel(), datatypes[typename])
             else:
                 #Set float32 data
-                self.parent.app.geometryArrayFloat(self.data, array.astype(numpy.float32).ravel(), datatypes[typename])
+                self.parent.app.geometryArrayFloat(self.data, array.astype(numpy.float32, copy=False).ravel(), datatypes[typename])
         else:
-            #Set float32 data
-            self.parent.app.geometryArrayFloat(self.data, array.astype(numpy.float32).ravel(), typename)
+            #Set float32 data, replaced values invalidate the data set statistics
+            self._obj._invalidate(typename)
+            self.parent.app.geometryArrayFloat(self.data, array.astype(numpy.float32, copy=False).ravel(), typename)
+
+    def update_range(self, typename, start, stop, array):
+        """
+        Replace a range of existing data in place
+
+        The data is written directly into the existing container,
+        avoiding copying and re-loading the whole data set when only
+        part of it has changed, the object is then flagged for reload
+
+        The value data range used for colour mapping is not re-calculated,
+        use set() to replace values that extend the range
+
+        Parameters
+        ----------
+        typename : str
+            Type of data to set
+            (vertices/normals/vectors/indices/colours/texcoords/luminance/rgb/values)
+        start : int
+            First item (eg: vertex index) to replace
+        stop : int
+            End of the range, one past the last item to replace
+        array : array
+            Numpy array holding the data to be written, (stop-start) items
+
+        Example
+        -------
+        >>> import lavavu
+        >>> lv = lavavu.Viewer()
+        >>> obj = lv.points(vertices=[[0,0,0], [1,1,1], [2,2,2]])
+        >>> obj.data[0].update_range("vertices", 1, 2, [5,5,5])
+        >>> print(obj.data.vertices)
+        [array([[0., 0., 0.],
+               [5., 5., 5.],
+               [2., 2., 2.]], dtype=float32)]
+
+        Value statistics are updated to include the new values
+
+        >>> obj.values([1,2,3])
+        >>> obj.data[0].update_range("default", 0, 1, [7])
+        >>> print(obj.stats())
+        {'minimum': 2.0, 'maximum': 7.0, 'count': 3, 'nan': 0}
+        >>> obj.data[0].update_range("vertices", 2, 4, [[6,6,6], [7,7,7]])
+        Traceback (most recent call last):
+          ...
+        IndexError: Range 2:4 outside of existing vertices data (3 items)
+        """
+        view = self.get(typename)
+        width = dimensions.get(typename, 1)
+        view = view.reshape((-1, width)) if width > 1 else view.ravel()
+        if start < 0 or stop > len(view) or stop < start:
+            raise IndexError("Range %d:%d outside of existing %s data (%d items)" % (start, stop, typename, len(view)))
+
+        #Convert to the existing data type and write into the view
+        array = self._obj._convert(array, view.dtype)
+        if array.size != (stop - start) * width:
+            raise ValueError("Expected %d values for range %d:%d, got %d" % ((stop - start) * width, start, stop, array.size))
+        view[start:stop] = array.reshape(view[start:stop].shape)
+        if self._raw(typename).dtype != view.dtype:
+            #Compact indices and reduced precision values were decoded
+            #into a copy, write back and re-pack the whole element
+            self.set(typename, numpy.copy(view))
+
+        #Updated values invalidate the data set statistics
+        if not typename in datatypes or typename == 'values':
+            self._obj._invalidate(typename)
+        self.parent.app.reloadObject(self._obj.ref)
 
     def __repr__(self):
         renderlist = [geomnames[value] for value in geomtypes if value == self.data.type]
@@ -4673,4 +6808,6 @@ if __name__ == '__main__':
     #Run doctests
     import doctest
     doctest.testmod()
+    import convert
+    doctest.testmod(convert)
 
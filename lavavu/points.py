@@ -5,7 +5,7 @@ Warning! EXPERIMENTAL:
 
 Tools for importing and working with point clouds
 - OBJ loader, requires pywavefront
-- PLY loader, requires plyfile
+- PLY loader, binary files are read directly, ascii requires plyfile
 - LAS loader, requires laspy
 
 These functions ported from my viz script repo here:
@@ -127,22 +127,11 @@ def loadpointcloud(filename, subsample=1, dtype=numpy.float32, components=['x',
 
     elif ext == '.ply':
         print("Loading PLY")
-        from plyfile import PlyData, PlyElement       
-        plydata = PlyData.read(filename)
+        #Binary data is memory mapped and subsampled before reading
+        plydata = convert.read_PLY(filename, subsample)
         if plydata:
-            x = plydata['vertex']['x']
-            y = plydata['vertex']['y']
-            z = plydata['vertex']['z']
-            V = numpy.vstack((x,y,z)).reshape([3, -1]).transpose()
-
-            C = convert._get_PLY_colours(plydata.elements[0])
-
-            #SubSample
-            if subsample > 1:
-                V = V[::subsample]
-                if C is not None:
-                    C = C[::subsample]
-
+            V = convert._PLY_columns(plydata['vertex'], ['x', 'y', 'z'], dtype)
+            C = convert._get_PLY_colours(plydata['vertex'])
             return (V, C)
 
     elif ext == '.las':
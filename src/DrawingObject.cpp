@@ -81,6 +81,16 @@ void DrawingObject::updateRange(const std::string& label, const Range& newRange)
     ranges[label] = range;
 }
 
+int DrawingObject::precision()
+{
+  //Storage precision for vertex and value data
+  json p = properties["precision"];
+  if (!p.is_string()) return PRECISION_FLOAT32;
+  if (p == "float16") return PRECISION_FLOAT16;
+  if (p == "quantized16") return PRECISION_QUANTIZED16;
+  return PRECISION_FLOAT32;
+}
+
 ColourMap* DrawingObject::getColourMap(const std::string propname, ColourMap* current)
 {
   if (!session.colourMaps) return NULL;
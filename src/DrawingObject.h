@@ -79,6 +79,7 @@ public:
   ~DrawingObject();
 
   void updateRange(const std::string& label, const Range& newRange);
+  int precision();
   ColourMap* getColourMap(const std::string propname="colourmap", ColourMap* current=NULL);
   void setup();
   TextureData* useTexture(Texture_Ptr tex=nullptr);
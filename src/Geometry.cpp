@@ -697,11 +697,29 @@ void Geometry::jsonExportAll(DrawingObject* draw, json& obj, bool encode)
 
         unsigned int length = dat->size() * sizeof(float);
 
+        //Compact indices are exported as unsigned int, compact values as float
+        std::vector<unsigned int> indices;
+        std::vector<float> floats;
+        if (data_type == lucIndexData)
+        {
+          indices.resize(dat->size());
+          geom[index]->_indices->copy(indices.data());
+        }
+        else if (val_ptr && val_ptr->precision != PRECISION_FLOAT32)
+        {
+          floats.resize(dat->size());
+          val_ptr->copy(floats.data());
+        }
+
         if (length > 0)
         {
           el["size"] = dsizes[data_type];
           el["count"] = (int)dat->size();
-          if (encode)
+          if (encode && data_type == lucIndexData)
+            el["data"] = base64_encode(reinterpret_cast<const unsigned char*>(indices.data()), length);
+          else if (encode && floats.size())
+            el["data"] = base64_encode(reinterpret_cast<const unsigned char*>(floats.data()), length);
+          else if (encode)
             el["data"] = base64_encode(reinterpret_cast<const unsigned char*>(dat->ref(0)), length);
           else
           {
@@ -710,8 +728,12 @@ void Geometry::jsonExportAll(DrawingObject* draw, json& obj, bool encode)
             json values;
             for (unsigned int j=0; j<dat->size(); j++)
             {
-              if (data_type == lucIndexData || data_type == lucRGBAData)
+              if (data_type == lucIndexData)
+                values.push_back((int)indices[j]);
+              else if (data_type == lucRGBAData)
                 values.push_back((int)*reinterpret_cast<unsigned int*>(dat->ref(j)));
+              else if (floats.size())
+                values.push_back(floats[j]);
               else
                 values.push_back((float)*reinterpret_cast<float*>(dat->ref(j)));
             }
@@ -1837,6 +1859,10 @@ Geom_Ptr Geometry::read(Geom_Ptr geom, unsigned int n, const void* data, std::st
     //printf(" -- NEW VALUE STORE CREATED FOR %s label %s count %d N %d ptr %p\n", geom->draw->name().c_str(), label.c_str(), geom->values.size(), n, store);
   }
 
+  //New or replaced data is stored at the object's precision
+  if (store->size() == 0)
+    store->setPrecision(geom->draw->precision());
+
   //Read the data
   if (n > 0) store->read(n, data);
 
@@ -181,13 +181,13 @@ class RenderData
   Coord3DValues& vertices;
   Coord3DValues& vectors;
   Coord3DValues& normals;
-  UIntValues& indices;
+  IndexValues& indices;
   UIntValues& colours;
   Coord2DValues& texCoords;
   UCharValues& luminance;
   UCharValues& rgb;
 
-  RenderData(Coord3DValues& vertices, Coord3DValues& vectors, Coord3DValues& normals, UIntValues& indices, UIntValues& colours, Coord2DValues& texCoords, UCharValues& luminance, UCharValues& rgb)
+  RenderData(Coord3DValues& vertices, Coord3DValues& vectors, Coord3DValues& normals, IndexValues& indices, UIntValues& colours, Coord2DValues& texCoords, UCharValues& luminance, UCharValues& rgb)
    : vertices(vertices), vectors(vectors), normals(normals), indices(indices), colours(colours), texCoords(texCoords), luminance(luminance), rgb(rgb) {}
 
 };
@@ -198,6 +198,22 @@ typedef std::shared_ptr<DataContainer> Data_Ptr;
 typedef std::shared_ptr<Coord3DValues> Float3_Ptr;
 typedef std::shared_ptr<Coord2DValues> Float2_Ptr;
 typedef std::shared_ptr<UIntValues> UInt_Ptr;
+typedef std::shared_ptr<IndexValues> Index_Ptr;
+
+//GL data type of index data as stored
+inline GLenum GLIndexType(IndexValues& indices)
+{
+  if (indices.itemsize() == 1) return GL_UNSIGNED_BYTE;
+  if (indices.itemsize() == 2) return GL_UNSIGNED_SHORT;
+  return GL_UNSIGNED_INT;
+}
+
+//Bytes used in an element buffer for index data as stored,
+//padded so the next element's indices start on a 4 byte boundary
+inline unsigned int GLIndexBytes(IndexValues& indices)
+{
+  return (indices.bytes() + 3) & ~3;
+}
 typedef std::shared_ptr<UCharValues> UChar_Ptr;
 
 //Colour lookup functors
@@ -335,7 +351,8 @@ public:
 
   std::vector<Values_Ptr> values;
   Float3_Ptr _vertices, _vectors, _normals;
-  UInt_Ptr _indices, _colours;
+  Index_Ptr _indices;
+  UInt_Ptr _colours;
   Float2_Ptr _texCoords;
   UChar_Ptr _luminance, _rgb;
 
@@ -365,7 +382,7 @@ public:
     _vertices = std::make_shared<Coord3DValues>();
     _vectors = std::make_shared<Coord3DValues>();
     _normals = std::make_shared<Coord3DValues>();
-    _indices = std::make_shared<UIntValues>();
+    _indices = std::make_shared<IndexValues>();
     _colours = std::make_shared<UIntValues>();
     _texCoords = std::make_shared<Coord2DValues>();
     _luminance = std::make_shared<UCharValues>();
@@ -434,7 +451,7 @@ public:
   Coord3DValues& vertices()   {return *_vertices;}
   Coord3DValues& vectors()    {return *_vectors;}
   Coord3DValues& normals()    {return *_normals;}
-  UIntValues& indices()       {return *_indices;}
+  IndexValues& indices()      {return *_indices;}
   UIntValues& colours()       {return *_colours;}
   Coord2DValues& texCoords()  {return *_texCoords;}
   UCharValues& luminance()    {return *_luminance;}
@@ -546,6 +563,7 @@ protected:
   unsigned int drawcount;
   DrawingObject* cached;
   std::vector<unsigned int> counts;
+  std::vector<unsigned int> starts; //Index buffer byte offsets
   bool allVertsFixed = false;
   bool allDataFixed = false;
 
@@ -971,6 +971,12 @@ void ImageLoader::load3D(int width, int height, int depth, void* data, int volty
   case VOLUME_FLOAT:
     glTexImage3D(GL_TEXTURE_3D, 0, GL_R32F, width, height, depth, 0, GL_RED, GL_FLOAT, data);
     break;
+  case VOLUME_HALF:
+    glTexImage3D(GL_TEXTURE_3D, 0, GL_R16F, width, height, depth, 0, GL_RED, GL_HALF_FLOAT, data);
+    break;
+  case VOLUME_SHORT:
+    glTexImage3D(GL_TEXTURE_3D, 0, GL_R16, width, height, depth, 0, GL_RED, GL_UNSIGNED_SHORT, data);
+    break;
   case VOLUME_BYTE:
     glTexImage3D(GL_TEXTURE_3D, 0, GL_RED, width, height, depth, 0, GL_RED, GL_UNSIGNED_BYTE, data);
     break;
@@ -1002,6 +1008,14 @@ void ImageLoader::load3Dslice(int slice, void* data)
     glTexSubImage3D(GL_TEXTURE_3D, 0, 0, 0, slice, texture->width, texture->height, 1, 
                     GL_RED, GL_FLOAT, data);
     break;
+  case VOLUME_HALF:
+    glTexSubImage3D(GL_TEXTURE_3D, 0, 0, 0, slice, texture->width, texture->height, 1, 
+                    GL_RED, GL_HALF_FLOAT, data);
+    break;
+  case VOLUME_SHORT:
+    glTexSubImage3D(GL_TEXTURE_3D, 0, 0, 0, slice, texture->width, texture->height, 1, 
+                    GL_RED, GL_UNSIGNED_SHORT, data);
+    break;
   case VOLUME_BYTE:
   case VOLUME_BYTE_COMPRESSED:
     glTexSubImage3D(GL_TEXTURE_3D, 0, 0, 0, slice, texture->width, texture->height, 1, 
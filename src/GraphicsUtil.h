@@ -729,6 +729,8 @@ void* read_png(std::istream& stream, GLuint& channels, GLuint& width, GLuint& he
 #define VOLUME_BYTE_COMPRESSED 5
 #define VOLUME_RGB_COMPRESSED 6
 #define VOLUME_RGBA_COMPRESSED 7
+#define VOLUME_HALF 8
+#define VOLUME_SHORT 9
 
 class TextureData  //Texture image data
 {
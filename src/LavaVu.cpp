@@ -3577,6 +3577,9 @@ void LavaVu::geometryArrayViewFloat(Geom_Ptr geom, float** array, int* len, std:
   }
   *array = (float*)dat->ref(0);
   *len = dat->size();
+  //Values stored at reduced precision have no float view, see geometryArrayViewUShort
+  if (dat->precision != PRECISION_FLOAT32)
+    *len = 0;
 }
 
 void LavaVu::geometryArrayViewUInt(Geom_Ptr geom, lucGeometryDataType dtype, unsigned int** array, int* len)
@@ -3587,6 +3590,46 @@ void LavaVu::geometryArrayViewUInt(Geom_Ptr geom, lucGeometryDataType dtype, uns
   Data_Ptr dat = geom->dataContainer(dtype);
   *array = (unsigned int*)dat->ref(0);
   *len = dat->size();
+  //Index data is stored as 1, 2 or 4 byte indices, only the view of the stored type holds data
+  if (dtype == lucIndexData && geom->_indices->itemsize() != sizeof(unsigned int))
+    *len = 0;
+}
+
+void LavaVu::geometryArrayViewUShort(Geom_Ptr geom, lucGeometryDataType dtype, unsigned short** array, int* len)
+{
+  //Get a view of internal geom array, 2 byte index data only
+  //(warning, can be released at any time, copy if needed!)
+  if (!geom) return;
+  Data_Ptr dat = geom->dataContainer(dtype);
+  *array = (unsigned short*)dat->ref(0);
+  *len = 0;
+  if (dtype == lucIndexData && geom->_indices->itemsize() == sizeof(unsigned short))
+    *len = dat->size();
+}
+
+void LavaVu::geometryArrayViewUShort(Geom_Ptr geom, unsigned short** array, int* len, std::string label)
+{
+  //Get a view of internal geom array, values stored at reduced precision only
+  //(warning, can be released at any time, copy if needed!)
+  if (!geom) return;
+  Values_Ptr dat = geom->valueContainer(label);
+  *len = 0;
+  if (dat == nullptr || dat->precision == PRECISION_FLOAT32) return;
+  *array = (unsigned short*)dat->ref(0);
+  *len = dat->size();
+}
+
+std::vector<float> LavaVu::geometryPrecision(Geom_Ptr geom, std::string label)
+{
+  //Get the storage precision of labelled values, with the scale and offset of quantised values
+  std::vector<float> precision = {PRECISION_FLOAT32, 1.0, 0.0};
+  if (!geom) return precision;
+  Values_Ptr dat = geom->valueContainer(label);
+  if (dat == nullptr) return precision;
+  precision[0] = dat->precision;
+  precision[1] = dat->scale;
+  precision[2] = dat->offset;
+  return precision;
 }
 
 void LavaVu::geometryArrayViewUChar(Geom_Ptr geom, lucGeometryDataType dtype, unsigned char** array, int* len)
@@ -3597,6 +3640,9 @@ void LavaVu::geometryArrayViewUChar(Geom_Ptr geom, lucGeometryDataType dtype, un
   Data_Ptr dat = geom->dataContainer(dtype);
   *array = (unsigned char*)dat->ref(0);
   *len = dat->size();
+  //Index data is stored as 1, 2 or 4 byte indices, only the view of the stored type holds data
+  if (dtype == lucIndexData && geom->_indices->itemsize() != sizeof(unsigned char))
+    *len = 0;
 }
 
 std::string rawImageWrite(unsigned char* array, int height, int width, int depth, std::string path, int jpegquality)
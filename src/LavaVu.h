@@ -274,6 +274,9 @@ public:
   void geometryArrayViewFloat(Geom_Ptr geom, float** array, int* len, std::string label);
   void geometryArrayViewUInt(Geom_Ptr geom, lucGeometryDataType dtype, unsigned int** array, int* len);
   void geometryArrayViewUChar(Geom_Ptr geom, lucGeometryDataType dtype, unsigned char** array, int* len);
+  void geometryArrayViewUShort(Geom_Ptr geom, lucGeometryDataType dtype, unsigned short** array, int* len);
+  void geometryArrayViewUShort(Geom_Ptr geom, unsigned short** array, int* len, std::string label);
+  std::vector<float> geometryPrecision(Geom_Ptr geom, std::string label);
 
   void imageBuffer(unsigned char* array, int height, int width, int depth);
   std::vector<unsigned char> imageJPEG(int width, int height, int quality=95);
@@ -55,6 +55,7 @@ namespace std
 %apply (float* IN_ARRAY1, int DIM1) {(float* array, int len)};
 %apply (float** ARGOUTVIEW_ARRAY1, int* DIM1) {(float** array, int* len)};
 %apply (unsigned char** ARGOUTVIEW_ARRAY1, int* DIM1) {(unsigned char** array, int* len)};
+%apply (unsigned short** ARGOUTVIEW_ARRAY1, int* DIM1) {(unsigned short** array, int* len)};
 %apply (unsigned int** ARGOUTVIEW_ARRAY1, int* DIM1) {(unsigned int** array, int* len)};
 %apply (unsigned char* INPLACE_ARRAY3, int DIM1, int DIM2, int DIM3) {(unsigned char* array, int height, int width, int depth)};
 
@@ -203,6 +204,9 @@ public:
   void geometryArrayViewFloat(Geom_Ptr geom, float** array, int* len, std::string label);
   void geometryArrayViewUInt(Geom_Ptr geom, lucGeometryDataType dtype, unsigned int** array, int* len);
   void geometryArrayViewUChar(Geom_Ptr geom, lucGeometryDataType dtype, unsigned char** array, int* len);
+  void geometryArrayViewUShort(Geom_Ptr geom, lucGeometryDataType dtype, unsigned short** array, int* len);
+  void geometryArrayViewUShort(Geom_Ptr geom, unsigned short** array, int* len, std::string label);
+  std::vector<float> geometryPrecision(Geom_Ptr geom, std::string label);
 
   void imageBuffer(unsigned char* array, int height, int width, int depth);
   std::vector<unsigned char> imageJPEG(int width, int height, int quality=95);
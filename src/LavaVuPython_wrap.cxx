@@ -24877,6 +24877,220 @@ fail:
 }
 
 
+SWIGINTERN PyObject *_wrap_LavaVu_geometryArrayViewUShort__SWIG_0(PyObject *SWIGUNUSEDPARM(self), int nobjs, PyObject **swig_obj) {
+  PyObject *resultobj = 0;
+  LavaVu *arg1 = (LavaVu *) 0 ;
+  Geom_Ptr arg2 ;
+  lucGeometryDataType arg3 ;
+  unsigned short **arg4 = (unsigned short **) 0 ;
+  int *arg5 = (int *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 ;
+  int res2 = 0 ;
+  int val3 ;
+  int ecode3 = 0 ;
+  unsigned short *data_temp4 = NULL ;
+  int dim_temp4 ;
+  
+  {
+    arg4 = &data_temp4;
+    arg5 = &dim_temp4;
+  }
+  if ((nobjs < 3) || (nobjs > 3)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_LavaVu, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "LavaVu_geometryArrayViewUShort" "', argument " "1"" of type '" "LavaVu *""'"); 
+  }
+  arg1 = reinterpret_cast< LavaVu * >(argp1);
+  {
+    int newmem = 0;
+    res2 = SWIG_ConvertPtrAndOwn(swig_obj[1], &argp2, SWIGTYPE_p_std__shared_ptrT_GeomData_t,  0 , &newmem);
+    if (!SWIG_IsOK(res2)) {
+      SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "LavaVu_geometryArrayViewUShort" "', argument " "2"" of type '" "Geom_Ptr""'"); 
+    }
+    if (argp2) arg2 = *(reinterpret_cast< Geom_Ptr * >(argp2));
+    if (newmem & SWIG_CAST_NEW_MEMORY) delete reinterpret_cast< Geom_Ptr * >(argp2);
+  }
+  ecode3 = SWIG_AsVal_int(swig_obj[2], &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "LavaVu_geometryArrayViewUShort" "', argument " "3"" of type '" "lucGeometryDataType""'");
+  } 
+  arg3 = static_cast< lucGeometryDataType >(val3);
+  {
+    try {
+      (arg1)->geometryArrayViewUShort(arg2,arg3,arg4,arg5);
+    } catch (const std::runtime_error& e) {
+      SWIG_exception(SWIG_RuntimeError, e.what());
+    }
+  }
+  resultobj = SWIG_Py_Void();
+  {
+    npy_intp dims[1] = {
+      *arg5 
+    };
+    PyObject* obj = PyArray_SimpleNewFromData(1, dims, NPY_USHORT, (void*)(*arg4));
+    PyArrayObject* array = (PyArrayObject*) obj;
+    
+    if (!array) SWIG_fail;
+    resultobj = SWIG_Python_AppendOutput(resultobj,obj);
+  }
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_LavaVu_geometryArrayViewUShort__SWIG_1(PyObject *SWIGUNUSEDPARM(self), int nobjs, PyObject **swig_obj) {
+  PyObject *resultobj = 0;
+  LavaVu *arg1 = (LavaVu *) 0 ;
+  Geom_Ptr arg2 ;
+  unsigned short **arg3 = (unsigned short **) 0 ;
+  int *arg4 = (int *) 0 ;
+  std::string arg5 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 ;
+  int res2 = 0 ;
+  unsigned short *data_temp3 = NULL ;
+  int dim_temp3 ;
+  
+  {
+    arg3 = &data_temp3;
+    arg4 = &dim_temp3;
+  }
+  if ((nobjs < 3) || (nobjs > 3)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_LavaVu, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "LavaVu_geometryArrayViewUShort" "', argument " "1"" of type '" "LavaVu *""'"); 
+  }
+  arg1 = reinterpret_cast< LavaVu * >(argp1);
+  {
+    int newmem = 0;
+    res2 = SWIG_ConvertPtrAndOwn(swig_obj[1], &argp2, SWIGTYPE_p_std__shared_ptrT_GeomData_t,  0 , &newmem);
+    if (!SWIG_IsOK(res2)) {
+      SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "LavaVu_geometryArrayViewUShort" "', argument " "2"" of type '" "Geom_Ptr""'"); 
+    }
+    if (argp2) arg2 = *(reinterpret_cast< Geom_Ptr * >(argp2));
+    if (newmem & SWIG_CAST_NEW_MEMORY) delete reinterpret_cast< Geom_Ptr * >(argp2);
+  }
+  {
+    std::string *ptr = (std::string *)0;
+    int res = SWIG_AsPtr_std_string(swig_obj[2], &ptr);
+    if (!SWIG_IsOK(res) || !ptr) {
+      SWIG_exception_fail(SWIG_ArgError((ptr ? res : SWIG_TypeError)), "in method '" "LavaVu_geometryArrayViewUShort" "', argument " "5"" of type '" "std::string""'"); 
+    }
+    arg5 = *ptr;
+    if (SWIG_IsNewObj(res)) delete ptr;
+  }
+  {
+    try {
+      (arg1)->geometryArrayViewUShort(arg2,arg3,arg4,arg5);
+    } catch (const std::runtime_error& e) {
+      SWIG_exception(SWIG_RuntimeError, e.what());
+    }
+  }
+  resultobj = SWIG_Py_Void();
+  {
+    npy_intp dims[1] = {
+      *arg4 
+    };
+    PyObject* obj = PyArray_SimpleNewFromData(1, dims, NPY_USHORT, (void*)(*arg3));
+    PyArrayObject* array = (PyArrayObject*) obj;
+    
+    if (!array) SWIG_fail;
+    resultobj = SWIG_Python_AppendOutput(resultobj,obj);
+  }
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_LavaVu_geometryArrayViewUShort(PyObject *self, PyObject *args) {
+  Py_ssize_t argc;
+  PyObject *argv[4] = {
+    0
+  };
+  
+  if (!(argc = SWIG_Python_UnpackTuple(args,"LavaVu_geometryArrayViewUShort",0,3,argv))) SWIG_fail;
+  --argc;
+  if (argc == 3) {
+    int _v = 0;
+    {
+      {
+        int res = SWIG_AsVal_int(argv[2], NULL);
+        _v = SWIG_CheckState(res);
+      }
+    }
+    if (!_v) goto check_1;
+    return _wrap_LavaVu_geometryArrayViewUShort__SWIG_0(self, argc, argv);
+  }
+check_1:
+  
+  if (argc == 3) {
+    return _wrap_LavaVu_geometryArrayViewUShort__SWIG_1(self, argc, argv);
+  }
+  
+fail:
+  SWIG_SetErrorMsg(PyExc_NotImplementedError,"Wrong number or type of arguments for overloaded function 'LavaVu_geometryArrayViewUShort'.\n"
+    "  Possible C/C++ prototypes are:\n"
+    "    LavaVu::geometryArrayViewUShort(Geom_Ptr,lucGeometryDataType,unsigned short **,int *)\n"
+    "    LavaVu::geometryArrayViewUShort(Geom_Ptr,unsigned short **,int *,std::string)\n");
+  return 0;
+}
+
+
+SWIGINTERN PyObject *_wrap_LavaVu_geometryPrecision(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  LavaVu *arg1 = (LavaVu *) 0 ;
+  Geom_Ptr arg2 ;
+  std::string arg3 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 ;
+  int res2 = 0 ;
+  PyObject *swig_obj[3] ;
+  std::vector< float,std::allocator< float > > result;
+  
+  if (!SWIG_Python_UnpackTuple(args,"LavaVu_geometryPrecision",3,3,swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_LavaVu, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "LavaVu_geometryPrecision" "', argument " "1"" of type '" "LavaVu *""'"); 
+  }
+  arg1 = reinterpret_cast< LavaVu * >(argp1);
+  {
+    int newmem = 0;
+    res2 = SWIG_ConvertPtrAndOwn(swig_obj[1], &argp2, SWIGTYPE_p_std__shared_ptrT_GeomData_t,  0 , &newmem);
+    if (!SWIG_IsOK(res2)) {
+      SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "LavaVu_geometryPrecision" "', argument " "2"" of type '" "Geom_Ptr""'"); 
+    }
+    if (argp2) arg2 = *(reinterpret_cast< Geom_Ptr * >(argp2));
+    if (newmem & SWIG_CAST_NEW_MEMORY) delete reinterpret_cast< Geom_Ptr * >(argp2);
+  }
+  {
+    std::string *ptr = (std::string *)0;
+    int res = SWIG_AsPtr_std_string(swig_obj[2], &ptr);
+    if (!SWIG_IsOK(res) || !ptr) {
+      SWIG_exception_fail(SWIG_ArgError((ptr ? res : SWIG_TypeError)), "in method '" "LavaVu_geometryPrecision" "', argument " "3"" of type '" "std::string""'"); 
+    }
+    arg3 = *ptr;
+    if (SWIG_IsNewObj(res)) delete ptr;
+  }
+  {
+    try {
+      result = (arg1)->geometryPrecision(arg2,arg3);
+    } catch (const std::runtime_error& e) {
+      SWIG_exception(SWIG_RuntimeError, e.what());
+    }
+  }
+  resultobj = swig::from(static_cast< std::vector< float,std::allocator< float > > >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
 SWIGINTERN PyObject *_wrap_LavaVu_imageBuffer(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   LavaVu *arg1 = (LavaVu *) 0 ;
@@ -26638,6 +26852,8 @@ static PyMethodDef SwigMethods[] = {
 	 { "LavaVu_geometryArrayViewFloat", _wrap_LavaVu_geometryArrayViewFloat, METH_VARARGS, NULL},
 	 { "LavaVu_geometryArrayViewUInt", _wrap_LavaVu_geometryArrayViewUInt, METH_VARARGS, NULL},
 	 { "LavaVu_geometryArrayViewUChar", _wrap_LavaVu_geometryArrayViewUChar, METH_VARARGS, NULL},
+	 { "LavaVu_geometryArrayViewUShort", _wrap_LavaVu_geometryArrayViewUShort, METH_VARARGS, NULL},
+	 { "LavaVu_geometryPrecision", _wrap_LavaVu_geometryPrecision, METH_VARARGS, NULL},
 	 { "LavaVu_imageBuffer", _wrap_LavaVu_imageBuffer, METH_VARARGS, NULL},
 	 { "LavaVu_imageJPEG", _wrap_LavaVu_imageJPEG, METH_VARARGS, NULL},
 	 { "LavaVu_imagePNG", _wrap_LavaVu_imagePNG, METH_VARARGS, NULL},
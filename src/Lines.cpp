@@ -221,10 +221,15 @@ void Lines::render()
   glBindVertexArray(vao);
   glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, indexvbo);
   GL_Error_Check;
+  //Indices are uploaded as stored, 1, 2 or 4 bytes each depending on the element,
+  //the offset from previous element vertices is applied when drawn
+  unsigned int bytes = 0;
+  for (unsigned int index = 0; index < geom.size(); index++)
+    bytes += GLIndexBytes(geom[index]->render->indices);
   if (glIsBuffer(indexvbo))
   {
-    glBufferData(GL_ELEMENT_ARRAY_BUFFER, elements * sizeof(GLuint), NULL, GL_DYNAMIC_DRAW);
-    debug_print("  %d byte IBO prepared for %d indices\n", elements * sizeof(GLuint), elements);
+    glBufferData(GL_ELEMENT_ARRAY_BUFFER, bytes, NULL, GL_DYNAMIC_DRAW);
+    debug_print("  %d byte IBO prepared for %d indices\n", bytes, elements);
   }
   else
     abort_program("IBO creation failed\n");
@@ -232,9 +237,10 @@ void Lines::render()
 
   //Upload vertex indices
   unsigned int offset = 0;
-  unsigned int voffset = 0;
   idxcount = 0;
   assert(counts.size() == geom.size());
+  starts.clear();
+  starts.resize(geom.size());
   for (unsigned int index = 0; index < geom.size(); index++)
   {
     unsigned int indices = geom[index]->render->indices.size();
@@ -243,23 +249,16 @@ void Lines::render()
     {
       if (indices > 0)
       {
-        //Create the index list, adding offset from previous element vertices
-        std::vector<unsigned int> indexlist(indices);
-        for (unsigned int i=0; i<indices; i++)
-          indexlist[i] = voffset + geom[index]->render->indices[i];
-
-        glBufferSubData(GL_ELEMENT_ARRAY_BUFFER, offset * sizeof(GLuint), indices * sizeof(GLuint), indexlist.data());
-        //printf("%d upload %d indices, voffset %d\n", index, indices, voffset);
+        glBufferSubData(GL_ELEMENT_ARRAY_BUFFER, offset, geom[index]->render->indices.bytes(), geom[index]->render->indices.ref());
+        //printf("%d upload %d indices, offset %d\n", index, indices, offset);
         counts[index] = indices;
-        offset += indices;
+        starts[index] = offset;
+        offset += GLIndexBytes(geom[index]->render->indices);
         GL_Error_Check;
       }
       //For vertices only, just use the existing vertex count
       idxcount += counts[index];
     }
-
-    //Vertex index offset
-    voffset += geom[index]->count();
   }
 
   GL_Error_Check;
@@ -283,6 +282,7 @@ void Lines::draw()
   double time;
   int stride = 3 * sizeof(float) + sizeof(Colour);   //3d vertices + 32-bit colour
   int offset = 0;
+  GLint voffset = 0;
   glBindVertexArray(vao);
   glBindBuffer(GL_ARRAY_BUFFER, vbo);
   glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, indexvbo);
@@ -320,8 +320,8 @@ void Lines::draw()
 
         if (geom[i]->render->indices.size() > 0)
         {
-          //Draw with index buffer
-          glDrawElements(primitive, counts[i], GL_UNSIGNED_INT, (GLvoid*)(offset*sizeof(GLuint)));
+          //Draw with index buffer, indices per element are zero based
+          glDrawElementsBaseVertex(primitive, counts[i], GLIndexType(geom[i]->render->indices), (GLvoid*)(intptr_t)starts[i], voffset);
         }
         else
         {
@@ -331,6 +331,7 @@ void Lines::draw()
       }
 
       offset += counts[i];
+      voffset += geom[i]->count();
     }
     glDisableVertexAttribArray(aPosition);
     glDisableVertexAttribArray(aColour);
@@ -1529,11 +1529,30 @@ int Model::readGeometryRecords(sqlite3_stmt* statement, bool cache)
       active = getRenderer(type);
       if (!active) continue; //Can't render this data
 
+      //Index records may hold 1 or 2 byte indices, the size is stored in dim_factor,
+      //float records may hold 2 byte values at reduced precision, the precision is stored in dim_factor
+      unsigned int itemsize = GeomData::byteSize(data_type);
+      int stored = sqlite3_column_int(statement, 12);
+      int precision = PRECISION_FLOAT32;
+      unsigned int header = 0;
+      if (data_type == lucIndexData)
+      {
+        if (stored == 1 || stored == 2) itemsize = stored;
+      }
+      else if (itemsize == sizeof(float) && (stored == PRECISION_FLOAT16 || stored == PRECISION_QUANTIZED16))
+      {
+        precision = stored;
+        itemsize = sizeof(unsigned short);
+        //Quantised data is preceded by the scale and offset
+        if (precision == PRECISION_QUANTIZED16)
+          header = 2 * sizeof(float);
+      }
+
       unsigned char* buffer = NULL;
-      if (bytes != (unsigned int)(count * GeomData::byteSize(data_type)))
+      if (bytes != (unsigned int)(count * itemsize + header))
       {
         //Decompress!
-        unsigned long dst_len = (unsigned long)(count * GeomData::byteSize(data_type));
+        unsigned long dst_len = (unsigned long)(count * itemsize + header);
         unsigned long uncomp_len = dst_len;
         unsigned long cmp_len = bytes;
         buffer = new unsigned char[dst_len];
@@ -1557,6 +1576,33 @@ int Model::readGeometryRecords(sqlite3_stmt* statement, bool cache)
 
       tbytes += bytes;   //Byte counter
 
+      //Compact indices are read as unsigned int, the container stores them compact again
+      std::vector<unsigned int> indices;
+      if (itemsize < sizeof(unsigned int) && data_type == lucIndexData)
+      {
+        indices.resize(count);
+        for (int i=0; i<count; i++)
+          indices[i] = itemsize == 1 ? ((const unsigned char*)data)[i] : ((const unsigned short*)data)[i];
+        data = indices.data();
+      }
+
+      //Reduced precision values are read as float, value data is packed again at the object's precision
+      std::vector<float> floats;
+      if (precision != PRECISION_FLOAT32)
+      {
+        float scale = 1.0, offset = 0.0;
+        if (header)
+        {
+          memcpy(&scale, data, sizeof(float));
+          memcpy(&offset, (const unsigned char*)data + sizeof(float), sizeof(float));
+        }
+        const unsigned short* packed = (const unsigned short*)((const unsigned char*)data + header);
+        floats.resize(count);
+        for (int i=0; i<count; i++)
+          floats[i] = FloatValues::decode(packed[i], precision, scale, offset);
+        data = floats.data();
+      }
+
       //Always add a new element for each new vertex geometry record
       //not suitable if writing db on multiple procs!
       if (data_type == lucVertexData) active->add(obj);
@@ -1831,6 +1877,16 @@ void Model::writeGeometry(Database& outdb, Geometry* g, DrawingObject* obj, int
       if (!block || block->size() == 0) continue;
       std::cerr << step << "] Writing geometry (type[" << data_type << "] * " << block->size()
                 << ") for object : " << obj->dbid << " => " << obj->name() << ", compress: " << compressdata << std::endl;
+      if (data_type == lucVertexData && obj->precision() != PRECISION_FLOAT32)
+      {
+        //Vertices are held as float, pack at the object's precision to write
+        FloatValues packed;
+        packed.datasize = block->unitsize();
+        packed.setPrecision(obj->precision());
+        packed.read(block->size(), block->ref(0));
+        writeGeometryRecord(outdb, g->type, (lucGeometryDataType)data_type, obj->dbid, data[i], &packed, step, compressdata, &packed);
+        continue;
+      }
       writeGeometryRecord(outdb, g->type, (lucGeometryDataType)data_type, obj->dbid, data[i], block.get(), step, compressdata);
     }
     for (unsigned int j=0; j<data[i]->values.size(); j++)
@@ -1845,17 +1901,42 @@ void Model::writeGeometry(Database& outdb, Geometry* g, DrawingObject* obj, int
       //Filters and colourby properties will need modification though
       unsigned int data_type = lucColourValueData+j;
       if (data_type == lucIndexData) data_type++;
-      writeGeometryRecord(outdb, g->type, (lucGeometryDataType)data_type, obj->dbid, data[i], block, step, compressdata);
+      writeGeometryRecord(outdb, g->type, (lucGeometryDataType)data_type, obj->dbid, data[i], block, step, compressdata, data[i]->values[j].get());
     }
   }
 }
 
-void Model::writeGeometryRecord(Database& outdb, lucGeometryType type, lucGeometryDataType dtype, unsigned int objid, Geom_Ptr data, DataContainer* block, int step, bool compressdata)
+void Model::writeGeometryRecord(Database& outdb, lucGeometryType type, lucGeometryDataType dtype, unsigned int objid, Geom_Ptr data, DataContainer* block, int step, bool compressdata, FloatValues* floats)
 {
   char SQL[SQL_QUERY_MAX];
   sqlite3_stmt* statement;
-  unsigned char* buffer = (unsigned char*)block->ref(0);
+
+  //Index data is written as stored, 1, 2 or 4 bytes per index, record the size in dim_factor
+  //(4 byte indices are recorded as 0, as written by previous versions)
+  float dim_factor = 0.0;
+  if (dtype == lucIndexData && ((IndexValues*)block)->itemsize() < sizeof(unsigned int))
+    dim_factor = ((IndexValues*)block)->itemsize();
+
+  //Float data at reduced precision is also written as stored, 2 bytes per value, record the precision
+  //in dim_factor, quantised data is preceded by the float scale and offset to restore the values
+  unsigned char* source = (unsigned char*)block->ref(0);
   unsigned long src_len = block->bytes();
+  std::vector<unsigned char> quantized;
+  if (floats && floats->precision != PRECISION_FLOAT32)
+  {
+    dim_factor = floats->precision;
+    if (floats->precision == PRECISION_QUANTIZED16)
+    {
+      quantized.resize(2 * sizeof(float) + src_len);
+      memcpy(&quantized[0], &floats->scale, sizeof(float));
+      memcpy(&quantized[sizeof(float)], &floats->offset, sizeof(float));
+      memcpy(&quantized[2 * sizeof(float)], source, src_len);
+      source = quantized.data();
+      src_len = quantized.size();
+    }
+  }
+
+  unsigned char* buffer = source;
   // Compress the data if enabled and > 1kb
   unsigned long cmp_len = 0;
   if (compressdata &&  src_len > 1000)
@@ -1864,12 +1945,12 @@ void Model::writeGeometryRecord(Database& outdb, lucGeometryType type, lucGeomet
     buffer = (unsigned char*)malloc((size_t)cmp_len);
     if (buffer == NULL)
       abort_program("Compress database: out of memory!\n");
-    if (compress(buffer, &cmp_len, (const unsigned char *)block->ref(0), src_len) != Z_OK)
+    if (compress(buffer, &cmp_len, (const unsigned char *)source, src_len) != Z_OK)
       abort_program("Compress database buffer failed!\n");
     if (cmp_len >= src_len)
     {
       free(buffer);
-      buffer = (unsigned char*)block->ref(0);
+      buffer = source;
       cmp_len = 0;
     }
     else
@@ -1890,7 +1971,7 @@ void Model::writeGeometryRecord(Database& outdb, lucGeometryType type, lucGeomet
     if (!std::isfinite(max[c])) max[c] = 0.0;
   }
 
-  snprintf(SQL, SQL_QUERY_MAX, "insert into geometry (object_id, timestep, rank, idx, type, data_type, size, count, width, minimum, maximum, dim_factor, units, minX, minY, minZ, maxX, maxY, maxZ, labels, data) values (%d, %d, %d, %d, %d, %d, %d, %d, %d, %g, %g, %g, '%s', %g, %g, %g, %g, %g, %g, ?, ?)", objid, step, data->height, data->depth, type, dtype, block->unitsize(), block->size(), data->width, block->minimum, block->maximum, 0.0, block->label.c_str(), min[0], min[1], min[2], max[0], max[1], max[2]);
+  snprintf(SQL, SQL_QUERY_MAX, "insert into geometry (object_id, timestep, rank, idx, type, data_type, size, count, width, minimum, maximum, dim_factor, units, minX, minY, minZ, maxX, maxY, maxZ, labels, data) values (%d, %d, %d, %d, %d, %d, %d, %d, %d, %g, %g, %g, '%s', %g, %g, %g, %g, %g, %g, ?, ?)", objid, step, data->height, data->depth, type, dtype, block->unitsize(), block->size(), data->width, block->minimum, block->maximum, dim_factor, block->label.c_str(), min[0], min[1], min[2], max[0], max[1], max[2]);
 
   /* Prepare statement... */
   if (sqlite3_prepare_v2(outdb.db, SQL, -1, &statement, NULL) != SQLITE_OK)
@@ -184,7 +184,7 @@ public:
   void writeObjects(Database& outdb, DrawingObject* obj, int step, bool compress);
   void deleteGeometry(Database& outdb, lucGeometryType type, DrawingObject* obj, int step);
   void writeGeometry(Database& outdb, Geometry* g, DrawingObject* obj, int step, bool compress);
-  void writeGeometryRecord(Database& outdb, lucGeometryType type, lucGeometryDataType dtype, unsigned int objid, Geom_Ptr data, DataContainer* block, int step, bool compressdata);
+  void writeGeometryRecord(Database& outdb, lucGeometryType type, lucGeometryDataType dtype, unsigned int objid, Geom_Ptr data, DataContainer* block, int step, bool compressdata, FloatValues* floats=NULL);
   void deleteObjectRecord(unsigned int id);
   void backup(Database& fromdb, Database& todb);
   void calculateBounds(View* aview, float* default_min=NULL, float* default_max=NULL);
@@ -159,6 +159,12 @@ void TriSurfaces::loadMesh()
       t2 = clock();
       debug_print("  %.4lf seconds to add to sort vector\n", (t2-t1)/(double)CLOCKS_PER_SEC);
 
+      //Colour values are summed in place for shared vertices, use float storage while optimising
+      FloatValues* colourvalues = geom[index]->colourData();
+      int precision = colourvalues ? colourvalues->precision : PRECISION_FLOAT32;
+      if (optimise && vertColour && colourvalues)
+        colourvalues->setPrecision(PRECISION_FLOAT32);
+
       //Sums normals + colours for shared vertices
       smoothMesh(index, verts, normals, optimise);
 
@@ -202,11 +208,11 @@ void TriSurfaces::loadMesh()
         Float3_Ptr old_vertices = geom[index]->_vertices;
         Float3_Ptr old_normals = geom[index]->_normals;
         Float2_Ptr old_texCoords = geom[index]->_texCoords;
-        UInt_Ptr old_indices = geom[index]->_indices;
+        Index_Ptr old_indices = geom[index]->_indices;
 
         //Create a new stores for replaced values
         geom[index]->_vertices = std::make_shared<Coord3DValues>();
-        geom[index]->_indices = std::make_shared<UIntValues>();
+        geom[index]->_indices = std::make_shared<IndexValues>();
 
         if (hasTexCoords)
           geom[index]->_texCoords = std::make_shared<Coord2DValues>();
@@ -225,10 +231,12 @@ void TriSurfaces::loadMesh()
         if (oldvalues && vertColour)
         {
           newvalues = Values_Ptr(new FloatValues());
+          newvalues->setPrecision(precision);
           newvalues->label = oldvalues->label;
           newvalues->minimum = oldvalues->minimum;
           newvalues->maximum = oldvalues->maximum;
         }
+        std::vector<float> colourdata;
 
         for (unsigned int v=0; v<verts.size(); v++)
         {
@@ -242,7 +250,7 @@ void TriSurfaces::loadMesh()
             {
               if (verts[v].vcount > 1)
                 oldvalues->value[verts[v].id] /= verts[v].vcount;
-              newvalues->read(1, &oldvalues->value[verts[v].id]);
+              colourdata.push_back(oldvalues->value[verts[v].id]);
             }
 
             //Save an index lookup entry (Grid indices loaded in previous step)
@@ -264,7 +272,11 @@ void TriSurfaces::loadMesh()
         }
 
         if (newvalues)
+        {
+          //Read in one block, compact storage is packed over the full range at once
+          newvalues->read(colourdata.size(), colourdata.data());
           geom[index]->values[geom[index]->draw->colourIdx] = newvalues;
+        }
 
       }
 
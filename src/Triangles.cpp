@@ -321,10 +321,14 @@ void Triangles::render()
   glBindVertexArray(vao);
   glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, indexvbo);
   GL_Error_Check;
+  //Indices are uploaded as stored, 1, 2 or 4 bytes each depending on the element
+  unsigned int bytes = 0;
+  for (unsigned int index = 0; index < geom.size(); index++)
+    bytes += GLIndexBytes(geom[index]->render->indices);
   if (glIsBuffer(indexvbo))
   {
-    glBufferData(GL_ELEMENT_ARRAY_BUFFER, elements * sizeof(GLuint), NULL, GL_DYNAMIC_DRAW);
-    debug_print("  %d byte IBO prepared for %d indices\n", elements * sizeof(GLuint), elements);
+    glBufferData(GL_ELEMENT_ARRAY_BUFFER, bytes, NULL, GL_DYNAMIC_DRAW);
+    debug_print("  %d byte IBO prepared for %d indices\n", bytes, elements);
   }
   else
     abort_program("IBO creation failed\n");
@@ -333,6 +337,8 @@ void Triangles::render()
   //Element counts to actually plot (exclude filtered/hidden) per geom entry
   counts.clear();
   counts.resize(geom.size());
+  starts.clear();
+  starts.resize(geom.size());
 
   //Upload vertex indices
   unsigned int offset = 0;
@@ -345,10 +351,11 @@ void Triangles::render()
     {
       if (indices > 0)
       {
-        glBufferSubData(GL_ELEMENT_ARRAY_BUFFER, offset * sizeof(GLuint), indices * sizeof(GLuint), geom[index]->render->indices.ref());
+        glBufferSubData(GL_ELEMENT_ARRAY_BUFFER, offset, geom[index]->render->indices.bytes(), geom[index]->render->indices.ref());
         //printf("%d upload %d indices, offset %d\n", index, indices, offset);
         counts[index] = indices;
-        offset += indices;
+        starts[index] = offset;
+        offset += GLIndexBytes(geom[index]->render->indices);
         GL_Error_Check;
       }
       else
@@ -415,8 +422,7 @@ void Triangles::draw()
         if (geom[index]->render->indices.size() > 0)
         {
           //Draw with index buffer
-          //glDrawElements(primitive, counts[index], GL_UNSIGNED_INT, (GLvoid*)(start*sizeof(GLuint)));
-          glDrawElementsBaseVertex(primitive, counts[index], GL_UNSIGNED_INT, (GLvoid*)(start*sizeof(GLuint)), voffset);
+          glDrawElementsBaseVertex(primitive, counts[index], GLIndexType(geom[index]->render->indices), (GLvoid*)(intptr_t)starts[index], voffset);
           //printf("  DRAW %d from %d by INDEX (voffset %d)\n", counts[index], start, voffset);
         }
         else
@@ -636,7 +642,7 @@ void Triangles::calcGridIndices(unsigned int i)
     }
   }
 
-  //geom[i]->_indices = std::make_shared<UIntValues>();
+  //geom[i]->_indices = std::make_shared<IndexValues>();
   geom[i]->render->indices.read(indices.size(), &indices[0]);
   //Update the rendering references as some containers have been replaced
   geom[i]->setRenderData();
@@ -680,7 +686,7 @@ void Triangles::calcGridVertices(unsigned int i)
     }
   }
 
-  geom[i]->_indices = std::make_shared<UIntValues>(); //Clear any indices
+  geom[i]->_indices = std::make_shared<IndexValues>(); //Clear any indices
   geom[i]->_vertices = std::make_shared<Coord3DValues>();
   read(geom[i], vertices.size(), lucVertexData, &vertices[0]);
   //Update the rendering references as some containers have been replaced
@@ -144,12 +144,192 @@ bool Range::update(const float& min, const float& max)
   return modified;
 }
 
+unsigned short float2half(float f)
+{
+  //Single to half precision, rounding to nearest even
+  unsigned int x;
+  memcpy(&x, &f, sizeof(float));
+  unsigned int sign = (x >> 16) & 0x8000;
+  unsigned int absx = x & 0x7fffffff;
+  if (absx > 0x7f800000) //NaN
+    return sign | 0x7e00;
+  if (absx >= 0x47800000) //Inf or overflow
+    return sign | 0x7c00;
+  if (absx < 0x38800000)
+  {
+    //Subnormal half, or underflow to zero
+    if (absx < 0x33000000) return sign;
+    unsigned int e = absx >> 23;
+    unsigned int m = (absx & 0x7fffff) | 0x800000;
+    unsigned int shift = 126 - e;
+    unsigned int h = m >> shift;
+    unsigned int rem = m & ((1u << shift) - 1);
+    unsigned int halfway = 1u << (shift - 1);
+    if (rem > halfway || (rem == halfway && (h & 1))) h++;
+    return sign | h;
+  }
+  //Re-bias the exponent, rounding may carry into the exponent (up to inf)
+  unsigned int h = (absx - 0x38000000) >> 13;
+  unsigned int rem = absx & 0x1fff;
+  if (rem > 0x1000 || (rem == 0x1000 && (h & 1))) h++;
+  return sign | h;
+}
+
+float half2float(unsigned short h)
+{
+  unsigned int sign = (h & 0x8000) << 16;
+  unsigned int e = (h >> 10) & 0x1f;
+  unsigned int m = h & 0x3ff;
+  unsigned int x;
+  if (e == 0x1f) //Inf or NaN
+    x = sign | 0x7f800000 | (m << 13);
+  else if (e == 0)
+  {
+    if (m == 0)
+      x = sign;
+    else
+    {
+      //Subnormal half, normalise
+      e = 113;
+      while (!(m & 0x400))
+      {
+        m <<= 1;
+        e--;
+      }
+      x = sign | (e << 23) | ((m & 0x3ff) << 13);
+    }
+  }
+  else
+    x = sign | ((e + 112) << 23) | (m << 13);
+  float f;
+  memcpy(&f, &x, sizeof(float));
+  return f;
+}
+
+void FloatValues::read(unsigned int n, const void* data)
+{
+  if (precision == PRECISION_FLOAT32)
+  {
+    DataValues<float>::read(n, data);
+    return;
+  }
+
+  const float* values = (const float*)data;
+  if (precision == PRECISION_QUANTIZED16)
+  {
+    //Extend the quantised range to include the new values
+    float min = next ? offset : HUGE_VALF;
+    float max = next ? offset + scale * QUANTIZED_MAX : -HUGE_VALF;
+    for (unsigned int i=0; i<n; i++)
+    {
+      if (!std::isfinite(values[i])) continue;
+      if (values[i] < min) min = values[i];
+      if (values[i] > max) max = values[i];
+    }
+    if (min <= max) requantize(min, max);
+  }
+
+  unsigned int size = next + n;
+  unsigned int oldsize = packed.size();
+  if (oldsize < size)
+  {
+    //Always at least double size for efficiency when reading 1 value at a time
+    if (n == 1 && size < oldsize*2)
+      size = oldsize*2;
+    resize(size);
+  }
+  for (unsigned int i=0; i<n; i++)
+    packed[next + i] = encode(values[i]);
+  next += n;
+}
+
+void FloatValues::requantize(float min, float max)
+{
+  //Set the quantised range, re-encoding any existing values if it has changed
+  float newscale = max > min ? (max - min) / QUANTIZED_MAX : 1.0;
+  if (newscale == scale && min == offset) return;
+  if (next == 0)
+  {
+    scale = newscale;
+    offset = min;
+    return;
+  }
+  for (unsigned int i=0; i<next; i++)
+  {
+    if (packed[i] == QUANTIZED_NAN) continue;
+    float q = (packed[i] * scale + offset - min) / newscale + 0.5;
+    packed[i] = q < 0 ? 0 : (q > QUANTIZED_MAX ? QUANTIZED_MAX : (unsigned short)q);
+  }
+  scale = newscale;
+  offset = min;
+}
+
+void FloatValues::setPrecision(int newprecision)
+{
+  if (newprecision == precision) return;
+  //Convert existing data to the new storage
+  std::vector<float> values(next);
+  copy(values.data());
+  clear();
+  precision = newprecision;
+  scale = 1.0;
+  offset = 0.0;
+  if (values.size()) read(values.size(), values.data());
+}
+
+void FloatValues::resize(unsigned long size)
+{
+  if (precision == PRECISION_FLOAT32)
+  {
+    DataValues<float>::resize(size);
+    return;
+  }
+  unsigned int oldsize = packed.size();
+  if (oldsize < size)
+  {
+    packed.resize(size);
+    membytes__ += sizeof(unsigned short)*(size-oldsize);
+    if (membytes__ > mempeak__) mempeak__ = membytes__;
+  }
+}
+
+void FloatValues::clear()
+{
+  DataValues<float>::clear();
+  membytes__ -= sizeof(unsigned short)*packed.size();
+  packed.clear();
+  next = 0;
+}
+
+void FloatValues::erase(unsigned int start, unsigned int end)
+{
+  if (precision == PRECISION_FLOAT32)
+  {
+    DataValues<float>::erase(start, end);
+    return;
+  }
+  packed.erase(packed.begin()+start, packed.begin()+end);
+  membytes__ -= sizeof(unsigned short)*(end - start);
+}
+
 void FloatValues::minmax()
 {
   if (minimum < maximum) return;
-  auto minmax = std::minmax_element(value.begin(), value.begin()+next);
-  minimum = *minmax.first;
-  maximum = *minmax.second;
+  if (precision == PRECISION_FLOAT32)
+  {
+    auto minmax = std::minmax_element(value.begin(), value.begin()+next);
+    minimum = *minmax.first;
+    maximum = *minmax.second;
+    return;
+  }
+  minimum = HUGE_VALF;
+  maximum = -HUGE_VALF;
+  for (unsigned int i=0; i<next; i++)
+  {
+    float v = (*this)[i];
+    if (v < minimum) minimum = v;
+    if (v > maximum) maximum = v;
+  }
 }
 
 bool Properties::has(const std::string& key) {return data.count(key) > 0 && !data[key].is_null();}
@@ -256,12 +256,89 @@ public:
   }
 };
 
+//Storage precision of float data (object "precision" property)
+#define PRECISION_FLOAT32 0
+#define PRECISION_FLOAT16 1
+#define PRECISION_QUANTIZED16 2
+//Largest quantised value, the last code is reserved for NaN
+#define QUANTIZED_MAX 65534
+#define QUANTIZED_NAN 65535
+
+//IEEE half precision conversion
+unsigned short float2half(float f);
+float half2float(unsigned short h);
+
 class FloatValues : public DataValues<float>
 {
+  //Compact storage, 2 bytes per value as half floats or quantised
+  //to the stored data range (value = packed * scale + offset)
+  std::vector<unsigned short> packed;
+
+  inline unsigned short encode(float v)
+  {
+    if (precision == PRECISION_FLOAT16) return float2half(v);
+    if (!std::isfinite(v)) return QUANTIZED_NAN;
+    float q = (v - offset) / scale + 0.5;
+    if (q < 0) return 0;
+    if (q > QUANTIZED_MAX) return QUANTIZED_MAX;
+    return (unsigned short)q;
+  }
+
+  inline float decode(unsigned short p) {return decode(p, precision, scale, offset);}
+
+  void requantize(float min, float max);
+
  public:
-  FloatValues() {}
+  int precision;
+  float scale;
+  float offset;
+
+  FloatValues() : precision(PRECISION_FLOAT32), scale(1.0), offset(0.0) {}
+  virtual ~FloatValues() {membytes__ -= sizeof(unsigned short)*packed.size();}
   void read1(const float& data) {read(1, &data);}
 
+  virtual void read(unsigned int n, const void* data);
+
+  unsigned int bytes() {return itemsize()*size();}
+
+  //Value of packed data at the given precision
+  static inline float decode(unsigned short p, int precision, float scale, float offset)
+  {
+    if (precision == PRECISION_FLOAT16) return half2float(p);
+    if (p == QUANTIZED_NAN) return NAN;
+    return p * scale + offset;
+  }
+
+  //Bytes per value as stored
+  unsigned int itemsize() {return precision == PRECISION_FLOAT32 ? sizeof(float) : sizeof(unsigned short);}
+
+  inline float operator[] (unsigned i)
+  {
+    if (precision == PRECISION_FLOAT32) return value[i];
+    return decode(packed[i]);
+  }
+
+  void* ref(unsigned i=0)
+  {
+    //Stored data, itemsize() bytes per value
+    if (precision == PRECISION_FLOAT32) return (void*)&value[i];
+    return (void*)&packed[i];
+  }
+
+  //Copy of the values as float
+  void copy(float* dest)
+  {
+    for (unsigned int i=0; i<next; i++)
+      dest[i] = (*this)[i];
+  }
+
+  //Change the storage precision, converting any existing data
+  void setPrecision(int newprecision);
+
+  void resize(unsigned long size);
+  void clear();
+  void erase(unsigned int start, unsigned int end);
+
   void minmax();
 };
 
@@ -279,6 +356,119 @@ class UCharValues : public DataValues<unsigned char>
   void read1(const unsigned char& data) {read(1, &data);}
 };
 
+class IndexValues : public DataContainer
+{
+  //Vertex indices, read as unsigned int but stored in the smallest
+  //unsigned type holding the largest index read so far (1, 2 or 4 bytes),
+  //existing indices are widened if a larger index is appended
+  std::vector<unsigned char> value;
+  unsigned int width;
+
+  void set(unsigned int i, unsigned int idx)
+  {
+    if (width == 1)
+      value[i] = idx;
+    else if (width == 2)
+      ((unsigned short*)value.data())[i] = idx;
+    else
+      ((unsigned int*)value.data())[i] = idx;
+  }
+
+  void widen(unsigned int newwidth)
+  {
+    if (newwidth <= width) return;
+    //Re-pack the existing indices at the new width
+    std::vector<unsigned int> old(next);
+    for (unsigned int i=0; i<next; i++)
+      old[i] = (*this)[i];
+    long oldbytes = value.size();
+    width = newwidth;
+    value.resize(next * width);
+    membytes__ += value.size() - oldbytes;
+    if (membytes__ > mempeak__) mempeak__ = membytes__;
+    for (unsigned int i=0; i<next; i++)
+      set(i, old[i]);
+  }
+
+public:
+  IndexValues() : width(1) {}
+  virtual ~IndexValues() {membytes__ -= value.size();}
+
+  unsigned int bytes() {return width*size();}
+
+  //Bytes per index as stored
+  unsigned int itemsize() {return width;}
+
+  static unsigned int widthFor(unsigned int idx)
+  {
+    if (idx <= 0xff) return 1;
+    if (idx <= 0xffff) return 2;
+    return 4;
+  }
+
+  void read1(const unsigned int& data) {read(1, &data);}
+
+  void read(unsigned int n, const void* data)
+  {
+    const unsigned int* idx = (const unsigned int*)data;
+    unsigned int maxidx = 0;
+    for (unsigned int i=0; i<n; i++)
+      if (idx[i] > maxidx) maxidx = idx[i];
+    widen(widthFor(maxidx));
+    resize(next + n);
+    for (unsigned int i=0; i<n; i++)
+      set(next + i, idx[i]);
+    next += n;
+  }
+
+  inline unsigned int operator[] (unsigned i)
+  {
+    if (width == 1)
+      return value[i];
+    if (width == 2)
+      return ((unsigned short*)value.data())[i];
+    return ((unsigned int*)value.data())[i];
+  }
+
+  //Copy of the indices as unsigned int
+  void copy(unsigned int* dest)
+  {
+    for (unsigned int i=0; i<next; i++)
+      dest[i] = (*this)[i];
+  }
+
+  void* ref(unsigned i=0)
+  {
+    //Stored data, itemsize() bytes per index
+    return (void*)(value.data() + i * width);
+  }
+
+  void resize(unsigned long size)
+  {
+    unsigned long oldsize = value.size();
+    if (oldsize < size * width)
+    {
+      value.resize(size * width);
+      membytes__ += value.size() - oldsize;
+      if (membytes__ > mempeak__) mempeak__ = membytes__;
+    }
+  }
+
+  void clear()
+  {
+    membytes__ -= value.size();
+    value.clear();
+    width = 1;
+    next = 0;
+  }
+
+  void erase(unsigned int start, unsigned int end)
+  {
+    value.erase(value.begin() + start * width, value.begin() + end * width);
+    membytes__ -= (end - start) * width;
+  }
+};
+
 class Coord3DValues : public FloatValues
 {
 public:
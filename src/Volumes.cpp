@@ -271,8 +271,16 @@ void Volumes::update()
         }
         else if (geom[i]->colourData())
         {
-          assert(geom[i]->colourData()->size() == geom[i]->width * geom[i]->height * geom[i]->depth);
-          geom[i]->texture->load3D(geom[i]->width, geom[i]->height, geom[i]->depth, geom[i]->colourData()->ref(), VOLUME_FLOAT);
+          FloatValues* values = geom[i]->colourData();
+          assert(values->size() == geom[i]->width * geom[i]->height * geom[i]->depth);
+          //Compact values are uploaded as stored, half float or normalised 16 bit
+          int type = VOLUME_FLOAT;
+          if (values->precision == PRECISION_FLOAT16)
+            type = VOLUME_HALF;
+          else if (values->precision == PRECISION_QUANTIZED16)
+            type = VOLUME_SHORT;
+          bpv = values->itemsize();
+          geom[i]->texture->load3D(geom[i]->width, geom[i]->height, geom[i]->depth, values->ref(), type);
         }
         debug_print("volume %d width %d height %d depth %d (bpv %d)\n", i, geom[i]->width, geom[i]->height, geom[i]->depth, bpv);
       }
@@ -385,29 +393,47 @@ void Volumes::update()
       {
         //Float data, interpret as either luminance or bytes packed into float container (legacy, still needed?)
         //TODO: Support RGB(A) float GL_RGBA16F (bpv=8) or GL_RGBA32F? (bpv=16)
-        bpv = (4 * geom[i]->colourData()->size()) / (float)(geom[i]->width * geom[i]->height);
+        FloatValues* values = geom[i]->colourData();
+        bpv = (values->itemsize() * values->size()) / (float)(geom[i]->width * geom[i]->height);
+        //Each slice is quantized over its own range, decode to float to combine them
+        bool decode = values->precision == PRECISION_QUANTIZED16;
+        if (decode) bpv = 4;
         if (bpv == 1)
         {
           type = texcompress ? VOLUME_BYTE_COMPRESSED : VOLUME_BYTE;
           geom[i]->texture->load3D(dims[0], dims[1], dims[2], NULL, type);
         }
+        else if (bpv == 2)
+        {
+          type = VOLUME_HALF;
+          geom[i]->texture->load3D(dims[0], dims[1], dims[2], NULL, type);
+        }
         else if (bpv == 4)
         {
-          geom[i]->texture->load3D(dims[0], dims[1], dims[2], NULL, VOLUME_FLOAT);
+          type = VOLUME_FLOAT;
+          geom[i]->texture->load3D(dims[0], dims[1], dims[2], NULL, type);
         }
         else
           abort_program("Invalid volume bpv %d", bpv);
 
+        std::vector<float> decoded;
         for (unsigned int j=i; j<i+slices[current]; j++)
         {
+          void* slice = geom[j]->colourData()->ref();
+          if (decode)
+          {
+            decoded.resize(geom[j]->colourData()->size());
+            geom[j]->colourData()->copy(decoded.data());
+            slice = decoded.data();
+          }
           if (crop) 
           {
-            GLubyte* ptr = RawImageCrop(geom[j]->colourData()->ref(), geom[i]->width, geom[i]->height, bpv, dims[0], dims[1], texoffset[0], texoffset[1]);
+            GLubyte* ptr = RawImageCrop(slice, geom[i]->width, geom[i]->height, bpv, dims[0], dims[1], texoffset[0], texoffset[1]);
             geom[i]->texture->load3Dslice(j-i, ptr);
             delete ptr;
           }
           else
-            geom[i]->texture->load3Dslice(j-i, geom[j]->colourData()->ref());
+            geom[i]->texture->load3Dslice(j-i, slice);
         }
 
       }
@@ -530,6 +556,14 @@ void Volumes::render(Geom_Ptr g)
     //prog->setUniform2f("uRange", range.data());
   }
 
+  //Quantized values are sampled normalised over the 16 bit codes, map the range to match
+  FloatValues* values = g->colourData();
+  if (values && values->precision == PRECISION_QUANTIZED16 && g->texture->type == VOLUME_SHORT)
+  {
+    float span = values->scale * 65535.0;
+    range = Range((range.minimum - values->offset) / span, (range.maximum - values->offset) / span);
+  }
+
   //std::cout << "Range " << range << std::endl;
   //Normalise provided isovalue to match data range
   //THIS IS BROKEN - unless the controls are aware of the ranges we can't do this, stick with [0,1] until fixed